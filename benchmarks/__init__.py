@@ -0,0 +1 @@
+# Замеры производительности и генераторы нагрузки для пакета transport
@@ -0,0 +1,65 @@
+import random
+from typing import List
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.truck import Truck
+from transport.train import Train
+from transport.company import TransportCompany
+
+# Генераторы синтетической нагрузки с фиксированным seed.
+# Одинаковые параметры всегда дают одинаковые данные.
+
+# Распределения веса груза (тонны)
+WEIGHT_DISTRIBUTIONS = ("uniform", "heavy")
+
+TRUCK_CAPACITIES = (10.0, 20.0, 40.0)
+TRUCK_COLORS = ("Красный", "Синий", "Белый")
+
+
+# Вес груза: равномерный 0.5..10 т или с тяжелым хвостом (Парето, обрезан до 60 т)
+def cargo_weight(rng: random.Random, distribution: str) -> float:
+    if distribution == "uniform":
+        return round(rng.uniform(0.5, 10.0), 2)
+    if distribution == "heavy":
+        return round(min(0.5 * rng.paretovariate(1.5), 60.0), 2)
+    raise ValueError(f"Неизвестное распределение веса: {distribution}")
+
+
+# Клиенты с заданной долей VIP
+def generate_clients(n: int, seed: int = 0, distribution: str = "uniform",
+                     vip_ratio: float = 0.1) -> List[Client]:
+    rng = random.Random(seed)
+    return [
+        Client(f"Клиент{i}", cargo_weight(rng, distribution), rng.random() < vip_ratio)
+        for i in range(n)
+    ]
+
+
+# Парк транспорта: truck_share — доля грузовиков, остальное — поезда.
+# Общая грузоподъемность ~ total_weight * slack
+def generate_fleet(total_weight: float, seed: int = 0, truck_share: float = 0.8,
+                   slack: float = 1.1) -> List[Vehicle]:
+    rng = random.Random(seed + 1)
+    fleet: List[Vehicle] = []
+    capacity = 0.0
+    target = max(total_weight * slack, 1.0)
+    while capacity < target:
+        if rng.random() < truck_share:
+            vehicle = Truck(rng.choice(TRUCK_CAPACITIES), rng.choice(TRUCK_COLORS))
+        else:
+            cars = rng.randint(5, 60)
+            vehicle = Train(cars * 60.0, cars)
+        fleet.append(vehicle)
+        capacity += vehicle.capacity
+    return fleet
+
+
+# Готовая компания с клиентами и транспортом
+def make_company(n_clients: int, seed: int = 0, distribution: str = "uniform",
+                 vip_ratio: float = 0.1, truck_share: float = 0.8,
+                 slack: float = 1.1) -> TransportCompany:
+    clients = generate_clients(n_clients, seed, distribution, vip_ratio)
+    company = TransportCompany(f"bench-{n_clients}")
+    company.add_clients(clients)
+    company.add_vehicles(generate_fleet(sum(c.cargo_weight for c in clients), seed, truck_share, slack))
+    return company
@@ -0,0 +1,132 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.generators import cargo_weight, generate_fleet
+from benchmarks.run import latency_summary
+from transport.company import TransportCompany
+from transport.intake import OrderIntake
+
+# Генератор нагрузки для сервиса приема заказов (transport.intake).
+#
+# Запуск:
+#   python -m benchmarks.intake_load --orders 20000 --connections 8
+#   python -m benchmarks.intake_load --port 8765   # внешний сервис
+#
+# Без --port сервис запускается в том же процессе на свободном порту.
+# Каждое соединение отправляет заказы, держа не больше --inflight
+# неподтвержденных. Задержка — от отправки заказа до получения ответа.
+
+
+# Заказы одного соединения (строки JSON)
+def make_orders(n: int, seed: int, distribution: str, vip_ratio: float) -> List[bytes]:
+    rng = random.Random(seed)
+    return [
+        json.dumps({"name": "Клиент", "cargo_weight": cargo_weight(rng, distribution),
+                    "is_vip": rng.random() < vip_ratio}, ensure_ascii=False).encode("utf-8") + b"\n"
+        for _ in range(n)
+    ]
+
+
+# Одно соединение: отправка заказов и прием ответов параллельно
+async def connection(host: str, port: int, orders: List[bytes], inflight: int,
+                     samples: List[float], counts: Dict[str, int]):
+    reader, writer = await asyncio.open_connection(host, port)
+    clock = time.perf_counter
+    sent: List[float] = []
+    window = asyncio.Semaphore(inflight)
+
+    async def receive():
+        for k in range(len(orders)):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("Сервис закрыл соединение")
+            samples.append(clock() - sent[k])
+            reply = json.loads(line)
+            status = reply.get("status", "error")
+            counts[status] = counts.get(status, 0) + 1
+            window.release()
+
+    receiver = asyncio.get_running_loop().create_task(receive())
+    for order in orders:
+        await window.acquire()
+        sent.append(clock())
+        writer.write(order)
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(orders: int, connections: int, inflight: int, host: str, port: Optional[int],
+              seed: int, distribution: str, vip_ratio: float, slack: float,
+              window: float, batch_size: int, strategy: str) -> Dict:
+    intake = None
+    server = None
+    if port is None:
+        # Парк под ожидаемый суммарный вес заказов
+        rng = random.Random(seed)
+        total = sum(cargo_weight(rng, distribution) for _ in range(orders))
+        company = TransportCompany("intake-bench")
+        company.add_vehicles(generate_fleet(total, seed, slack=slack))
+        intake = OrderIntake(company, strategy, window, batch_size)
+        server = await intake.serve(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    per_connection = [orders // connections + (1 if i < orders % connections else 0)
+                      for i in range(connections)]
+    payloads = [make_orders(n, seed + i, distribution, vip_ratio) for i, n in enumerate(per_connection)]
+    samples: List[float] = []
+    counts: Dict[str, int] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(connection(host, port, p, inflight, samples, counts) for p in payloads))
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "orders": orders,
+        "connections": connections,
+        "inflight": inflight,
+        "orders_per_s": orders / elapsed if elapsed else 0.0,
+        "latency": latency_summary(samples),
+        "replies": counts,
+    }
+    if intake is not None:
+        server.close()
+        await server.wait_closed()
+        await intake.stop()
+        result["batches"] = intake.batches
+        result["mean_batch"] = intake.orders / intake.batches if intake.batches else 0.0
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load generator for the order intake service")
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--inflight", type=int, default=64,
+                        help="unanswered orders per connection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="external service port (default: in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--weights", default="uniform", help="weight distribution: uniform, heavy")
+    parser.add_argument("--vip-ratio", type=float, default=0.1)
+    parser.add_argument("--slack", type=float, default=1.1, help="fleet capacity / total weight")
+    parser.add_argument("--window", type=float, default=0.002, help="batch window, seconds")
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--strategy", default="bfd")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args.orders, args.connections, args.inflight, args.host, args.port,
+                             args.seed, args.weights, args.vip_ratio, args.slack,
+                             args.window, args.batch_size, args.strategy))
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
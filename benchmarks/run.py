@@ -0,0 +1,205 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generators import WEIGHT_DISTRIBUTIONS, generate_clients, generate_fleet, make_company
+from transport.client import Client
+from transport.truck import Truck
+
+# Замеры производительности пакета transport.
+#
+# Запуск:
+#   python -m benchmarks.run --scales 100,10000 --output results.json
+#   python -m benchmarks.run --baseline results.json   # сравнение с прошлым прогоном
+#
+# Для каждого сценария записываются пропускная способность, процентили
+# задержки, пиковая память (tracemalloc) и число задействованного транспорта.
+
+
+# Процентиль по отсортированному списку
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p95_us": percentile(samples, 95) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "max_us": (samples[-1] if samples else 0.0) * 1e6,
+    }
+
+
+# Время выполнения функции
+def timed(func: Callable):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+# Пиковая память функции (отдельный прогон: tracemalloc замедляет код)
+def peak_memory(func: Callable) -> int:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+# Создание объектов Client и Truck: скорость и задержка одного конструктора
+def bench_construction(n: int) -> Dict:
+    samples = []
+    clock = time.perf_counter
+    for i in range(n):
+        t = clock()
+        Client("Клиент", 5.0, i % 10 == 0)
+        samples.append(clock() - t)
+    make_clients = lambda: [Client("Клиент", 5.0) for _ in range(n)]
+    make_trucks = lambda: [Truck(10.0, "Красный") for _ in range(n)]
+    _, client_time = timed(make_clients)
+    _, truck_time = timed(make_trucks)
+    client_peak = peak_memory(make_clients)
+    truck_peak = peak_memory(make_trucks)
+    return {
+        "clients_per_s": n / client_time,
+        "trucks_per_s": n / truck_time,
+        "client_bytes": client_peak / n,
+        "truck_bytes": truck_peak / n,
+        "client_latency": latency_summary(samples),
+    }
+
+
+# Вызовы load_cargo: задержка одного вызова
+def bench_load_cargo(n: int, seed: int, distribution: str) -> Dict:
+    clients = generate_clients(n, seed, distribution)
+    fleet = generate_fleet(sum(c.cargo_weight for c in clients), seed)
+    samples = []
+    clock = time.perf_counter
+    v = 0
+    for client in clients:
+        vehicle = fleet[v % len(fleet)]
+        t = clock()
+        if not vehicle.load_cargo(client):
+            v += 1
+        samples.append(clock() - t)
+    total = sum(samples)
+    return {"calls_per_s": n / total if total else 0.0, "latency": latency_summary(samples)}
+
+
+# Распределение грузов выбранной стратегией
+def bench_distribution(n: int, seed: int, distribution: str, vip_ratio: float,
+                       truck_share: float, strategy: str, repeat: int) -> Dict:
+    times = []
+    for _ in range(repeat):
+        company = make_company(n, seed, distribution, vip_ratio, truck_share)
+        unplaced, elapsed = timed(lambda: company.optimize_cargo_distribution(strategy))
+        times.append(elapsed)
+    result = {
+        "vehicles": len(company.vehicles),
+        "vehicles_used": sum(1 for v in company.vehicles if v.client_count),
+        "unplaced": len(unplaced),
+    }
+    company = make_company(n, seed, distribution, vip_ratio, truck_share)
+    peak = peak_memory(lambda: company.optimize_cargo_distribution(strategy))
+    times.sort()
+    result.update({
+        "clients_per_s": n / times[len(times) // 2],
+        "run_s": latency_summary(times),
+        "peak_bytes": peak,
+    })
+    return result
+
+
+def run(scales: List[int], strategies: List[str], distributions: List[str], vip_ratio: float,
+        truck_share: float, seed: int, repeat: int) -> Dict:
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "vip_ratio": vip_ratio,
+            "truck_share": truck_share,
+        },
+        "cases": {},
+    }
+    cases = results["cases"]
+    for n in scales:
+        cases[f"construction/{n}"] = bench_construction(n)
+        for distribution in distributions:
+            cases[f"load_cargo/{distribution}/{n}"] = bench_load_cargo(n, seed, distribution)
+            for strategy in strategies:
+                key = f"distribution/{strategy}/{distribution}/{n}"
+                cases[key] = bench_distribution(n, seed, distribution, vip_ratio,
+                                                truck_share, strategy, repeat)
+                print(f"{key}: {cases[key]['clients_per_s']:.0f} clients/s, "
+                      f"vehicles used {cases[key]['vehicles_used']}", file=sys.stderr)
+    return results
+
+
+# Сравнение с базовым прогоном: падение скорости больше tolerance
+# или рост числа транспорта считаются регрессией
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    problems = []
+    for key, case in results["cases"].items():
+        base = baseline.get("cases", {}).get(key)
+        if base is None:
+            continue
+        for metric in ("clients_per_s", "trucks_per_s", "calls_per_s"):
+            if metric in case and metric in base and case[metric] < base[metric] * (1 - tolerance):
+                problems.append(f"{key}: {metric} {case[metric]:.0f} < {base[metric]:.0f}")
+        if case.get("vehicles_used", 0) > base.get("vehicles_used", float("inf")):
+            problems.append(f"{key}: vehicles_used {case['vehicles_used']} > {base['vehicles_used']}")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for the transport package")
+    parser.add_argument("--scales", default="100,1000,10000",
+                        help="comma separated client counts (1e2..1e6)")
+    parser.add_argument("--strategies", default="ff,ffd,bfd")
+    parser.add_argument("--weights", default=",".join(WEIGHT_DISTRIBUTIONS),
+                        help="weight distributions: uniform, heavy")
+    parser.add_argument("--vip-ratio", type=float, default=0.1)
+    parser.add_argument("--truck-share", type=float, default=0.8,
+                        help="share of trucks in the fleet, the rest are trains")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare with a previous JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed throughput drop against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(
+        [int(s) for s in args.scales.split(",")],
+        args.strategies.split(","),
+        args.weights.split(","),
+        args.vip_ratio, args.truck_share, args.seed, args.repeat,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    else:
+        json.dump(results, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance)
+        for line in problems:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Время холодного импорта (python -X importtime) для коротких пакетных запусков.
+#
+# Запуск:
+#   python -m benchmarks.startup
+#   python -m benchmarks.startup --budget-ms 60 --repeat 7
+#
+# Каждый сценарий выполняется в новом процессе. Для сценария берется
+# медиана суммарного времени импорта верхнего модуля (cumulative, мкс).
+# Код завершения 1, если медиана превышает бюджет или при импорте
+# загружаются запрещенные модули (GUI, asyncio, профилировщики).
+
+# Сценарий -> код, который выполняется в новом процессе
+SCENARIOS = {
+    "import transport": "import transport",
+    "company": "from transport import TransportCompany, Client, Truck",
+    "distribute": ("from transport import TransportCompany, Client, Truck\n"
+                   "c = TransportCompany('x'); c.add_vehicle(Truck(10.0, 'r'))\n"
+                   "c.add_client(Client('a', 1.0)); c.optimize_cargo_distribution()"),
+    "main_gui (no window)": "import main_gui",
+}
+
+# Модули, которых не должно быть после сценария
+FORBIDDEN = ("dearpygui", "asyncio", "cProfile", "tracemalloc", "concurrent.futures", "mmap",
+             "threading", "logging")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Один запуск: (суммарное время импорта, мкс; загруженные запрещенные модули)
+def measure(code: str) -> Tuple[int, List[str]]:
+    probe = code + "\nimport sys\nprint(' '.join(m for m in %r if m in sys.modules))" % (FORBIDDEN,)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", probe],
+                            capture_output=True, text=True, cwd=ROOT, env=env, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        # Верхний уровень — строки без отступа в имени модуля
+        name = parts[2]
+        if parts[1].strip().isdigit() and not name[1:].startswith(" "):
+            total += int(parts[1])
+    return total, result.stdout.split()
+
+
+def run(repeat: int) -> Dict:
+    results = {}
+    for scenario, code in SCENARIOS.items():
+        samples = []
+        loaded: List[str] = []
+        for _ in range(repeat):
+            total, loaded = measure(code)
+            samples.append(total)
+        samples.sort()
+        results[scenario] = {
+            "median_ms": samples[len(samples) // 2] / 1000,
+            "min_ms": samples[0] / 1000,
+            "forbidden_loaded": loaded,
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import time of the transport package")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=80.0,
+                        help="allowed median import time per scenario")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    problems = []
+    for scenario, case in results.items():
+        print(f"{scenario:<22} median {case['median_ms']:7.1f} ms  min {case['min_ms']:7.1f} ms",
+              file=sys.stderr)
+        if case["median_ms"] > args.budget_ms:
+            problems.append(f"{scenario}: {case['median_ms']:.1f} ms > {args.budget_ms} ms")
+        if case["forbidden_loaded"]:
+            problems.append(f"{scenario}: loads {', '.join(case['forbidden_loaded'])}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    for line in problems:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
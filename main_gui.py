@@ -1,35 +1,80 @@
+import bisect
+import importlib
 import re
-from typing import Optional, List
-
-import dearpygui.dearpygui as dpg
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from transport.client import Client
 from transport.truck import Truck
 from transport.train import Train
 from transport.company import TransportCompany
 
+if TYPE_CHECKING:
+    import logging
+    from transport.background import DistributionWorker
+    from transport.export import Exporter
+
+
+class _LazyModule:
+    """
+    Заглушка модуля, которая импортирует его при первом обращении
+    к атрибуту и затем подменяет себя в глобальных именах.
+
+    Так модуль можно импортировать ради данных и проверок
+    (без окна), не загружая dearpygui.
+    """
+
+    def __init__(self, global_name: str, module_name: str) -> None:
+        self._global_name = global_name
+        self._module_name = module_name
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._module_name)
+        globals()[self._global_name] = module
+        return getattr(module, attr)
+
+
+dpg = _LazyModule("dpg", "dearpygui.dearpygui")
+
 
 # --- Глобальные данные приложения --- #
 
-company: Optional[TransportCompany] = None  # текущая транспортная компания
+# Данные приложения создаются в init_app() при запуске окна, а не при
+# импорте модуля: импорт main_gui ради проверок не загружает экспорт,
+# фоновые потоки и логирование.
 
-# Список клиентов и транспортных средств храним отдельно,
-# чтобы удобно синхронизировать с таблицами.
-clients: List[Client] = []
-vehicles: List[object] = []  # Truck или Train
+# Транспортная компания — единственное хранилище клиентов и транспорта;
+# таблицы и диалоги обращаются к объектам по их ID
+company: Optional[TransportCompany] = None
 
 # Теги элементов интерфейса
 CLIENT_TABLE_TAG = "clients_table"
 VEHICLE_TABLE_TAG = "vehicles_table"
 STATUS_TAG = "status_text"
+PROGRESS_TAG = "distribution_progress"
+CANCEL_TAG = "distribution_cancel"
 LOG_TAG = "log_text"
+LOG_LEVEL_TAG = "log_level"
 
-# Для диалогов
-CURRENT_CLIENT_INDEX: Optional[int] = None
-CURRENT_VEHICLE_INDEX: Optional[int] = None
+# Лог: сколько последних строк держать на экране и куда сбрасывать
+# полную историю (None — не сбрасывать)
+LOG_MAX_LINES = 1000
+LOG_SPILL_FILE: Optional[str] = None
+# Сколько имён неразмещенных клиентов показывать в строке лога
+LOG_UNPLACED_NAMES = 10
 
-# Для экспорта результата
-last_distribution_lines: List[str] = []
+# Для диалогов: ID редактируемого объекта (None — новый)
+CURRENT_CLIENT_ID: Optional[str] = None
+CURRENT_VEHICLE_ID: Optional[str] = None
+
+# Для экспорта результата: строки берутся прямо из компании,
+# exporter помнит, что изменилось после прошлого экспорта
+exporter: Optional["Exporter"] = None
+EXPORT_FILE = "distribution_result.csv"
+EXPORT_CHANGES_FILE = "distribution_changes.csv"
+
+# Фоновое распределение грузов (None — не выполняется)
+distribution_worker: Optional["DistributionWorker"] = None
 
 
 # --- Вспомогательные функции (лог, статус, сообщения) --- #
@@ -39,15 +84,75 @@ def set_status(msg: str) -> None:
     dpg.set_value(STATUS_TAG, msg)
 
 
-def log(msg: str) -> None:
-    """Добавить строку в текстовый лог внизу окна."""
-    prev = dpg.get_value(LOG_TAG)
-    dpg.set_value(LOG_TAG, prev + msg + "\n")
+class LogBuffer:
+    """
+    Кольцевой буфер строк лога.
+
+    Запись в буфер — O(1) и без обращения к виджету; виджет обновляется
+    методом flush() один раз за кадр. Старые строки вытесняются, при
+    заданном spill_path вся история пишется в файл с ротацией.
+    """
+
+    # Числа совпадают с уровнями модуля logging (он нужен только для файла)
+    LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+    def __init__(self, maxlen: int = LOG_MAX_LINES, level: str = "INFO",
+                 spill_path: Optional[str] = None,
+                 spill_bytes: int = 1_000_000, spill_backups: int = 3) -> None:
+        self.lines: deque = deque(maxlen=maxlen)
+        self.level = self.LEVELS[level]
+        self.dirty = False
+        self._pending: List[str] = []  # строки для файла с прошлого flush
+        self._spill: Optional["logging.Logger"] = None
+        if spill_path:
+            import logging
+            import logging.handlers
+            handler = logging.handlers.RotatingFileHandler(
+                spill_path, maxBytes=spill_bytes, backupCount=spill_backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._spill = logging.getLogger(f"transport_gui.{id(self)}")
+            self._spill.propagate = False
+            self._spill.setLevel(logging.DEBUG)
+            self._spill.addHandler(handler)
+
+    def set_level(self, level: str) -> None:
+        self.level = self.LEVELS[level]
+
+    def write(self, msg: str, level: str = "INFO") -> None:
+        """Добавить строку, если её уровень не ниже текущего."""
+        if self.LEVELS[level] < self.level:
+            return
+        line = msg if level == "INFO" else f"[{level}] {msg}"
+        self.lines.append(line)
+        if self._spill is not None:
+            self._pending.append(line)
+        self.dirty = True
+
+    def clear(self) -> None:
+        self.lines.clear()
+        self.dirty = True
+
+    def flush(self) -> None:
+        """Вывести буфер в виджет и файл (вызывается раз за кадр)."""
+        if self._pending:
+            self._spill.info("\n".join(self._pending))
+            self._pending = []
+        if self.dirty:
+            dpg.set_value(LOG_TAG, "\n".join(self.lines))
+            self.dirty = False
+
+
+log_buffer: Optional[LogBuffer] = None
+
+
+def log(msg: str, level: str = "INFO") -> None:
+    """Добавить строку в лог внизу окна (на экран попадёт в следующем кадре)."""
+    log_buffer.write(msg, level)
 
 
 def clear_log() -> None:
     """Очистить лог."""
-    dpg.set_value(LOG_TAG, "")
+    log_buffer.clear()
 
 
 def show_error(message: str) -> None:
@@ -65,6 +170,7 @@ def show_error(message: str) -> None:
             callback=lambda s, a: dpg.delete_item("error_dialog")
         )
     set_status(message)
+    log(message, "ERROR")
 
 
 def show_about(sender, app_data) -> None:
@@ -131,62 +237,361 @@ def validate_number_of_cars(cars: int) -> bool:
     return True
 
 
-# --- Обновление таблиц --- #
+# --- Таблицы с виртуализацией --- #
+
+class VirtualTable:
+    """
+    Таблица, которая создаёт виджеты только для одной страницы строк.
+
+    Данные хранятся в отсортированном индексе (список объектов +
+    bisect по запомненным ключам), виджеты страницы создаются один раз
+    и затем только обновляются через set_value. Изменение одного объекта
+    перерисовывает одну строку, а не всю таблицу; объекты, у которых
+    изменился ключ сортировки, переставляются через reposition.
+    """
+
+    def __init__(self, tag: str, columns: List[Tuple[str, Callable[[Any], str]]],
+                 sort_keys: Dict[str, Callable[[Any], Any]],
+                 filter_func: Callable[[Any, str], bool],
+                 page_size: int = 50,
+                 on_select: Optional[Callable[[Any], None]] = None) -> None:
+        self.tag = tag
+        self.columns = columns
+        self.sort_keys = sort_keys
+        self.filter_func = filter_func
+        self.page_size = page_size
+        self.on_select = on_select
+
+        self.items: Dict[Any, int] = {}      # объект -> порядковый номер (для устойчивой сортировки)
+        self._next_seq = 0
+        self.sort_name = next(iter(sort_keys))
+        self.descending = False
+        self.filter_text = ""
+        self.view: List[Any] = []            # отфильтрованные и отсортированные объекты
+        self._keys: Dict[Any, Tuple[Any, int]] = {}  # ключ, по которому объект стоит в view
+        self.page = 0
+        self.built = False
+
+    # --- индекс --- #
+
+    def _key(self, item: Any) -> Tuple[Any, int]:
+        return self.sort_keys[self.sort_name](item), self.items[item]
+
+    def _position(self, item: Any) -> int:
+        """Позиция объекта в view по запомненному ключу (-1 — объекта нет в view)."""
+        key = self._keys.get(item)
+        if key is None:
+            return -1
+        return bisect.bisect_left(self.view, key, key=self._keys.__getitem__)
+
+    def _insert(self, item: Any) -> int:
+        """Поставить объект в view, если он проходит фильтр; вернуть позицию или -1."""
+        if not self.filter_func(item, self.filter_text):
+            return -1
+        self._keys[item] = self._key(item)
+        bisect.insort(self.view, item, key=self._keys.__getitem__)
+        return self._position(item)
+
+    def _discard(self, item: Any) -> int:
+        """Убрать объект из view; вернуть его прежнюю позицию или -1."""
+        pos = self._position(item)
+        if pos >= 0:
+            self.view.pop(pos)
+            del self._keys[item]
+        return pos
+
+    def set_items(self, items: Iterable[Any]) -> None:
+        """Полностью заменить содержимое таблицы."""
+        self.items = {}
+        self._next_seq = 0
+        for item in items:
+            self.items[item] = self._next_seq
+            self._next_seq += 1
+        self.resort()
+
+    def resort(self) -> None:
+        """Пересобрать индекс (после массовых изменений, например распределения)."""
+        text = self.filter_text
+        self._keys = {i: self._key(i) for i in self.items if self.filter_func(i, text)}
+        self.view = sorted(self._keys, key=self._keys.__getitem__)
+        self.refresh()
+
+    def reposition(self, items: Iterable[Any]) -> None:
+        """
+        Объекты изменились так, что могли сменить место (ключ сортировки,
+        фильтр): переставить только их, без пересборки всего индекса.
+        """
+        for item in items:
+            if item in self.items:
+                self._discard(item)
+                self._insert(item)
+        self.refresh()
+
+    def upsert(self, item: Any, old: Any = None) -> None:
+        """Добавить объект или заменить old на item, перерисовав одну строку."""
+        old_pos = -1
+        if old is not None and old in self.items:
+            seq = self.items[old]
+            old_pos = self._discard(old)
+            del self.items[old]
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        self.items[item] = seq
+        pos = self._insert(item)
+        if pos >= 0 and pos == old_pos:
+            # Строка осталась на месте — перерисовываем только её
+            if self._on_page(pos):
+                self._render_row(pos)
+            return
+        self.refresh()
+
+    def remove(self, item: Any) -> None:
+        """Удалить объект из таблицы."""
+        if item not in self.items:
+            return
+        self._discard(item)
+        del self.items[item]
+        self.refresh()
+
+    def update(self, item: Any) -> None:
+        """Объект изменился на месте, не меняя места в таблице."""
+        pos = self._position(item)
+        if pos >= 0 and self._on_page(pos):
+            self._render_row(pos)
+
+    # --- сортировка, фильтр, страницы --- #
+
+    def set_sort(self, name: str, descending: bool = False) -> None:
+        self.sort_name = name
+        self.descending = descending
+        self.resort()
+
+    def set_filter(self, text: str) -> None:
+        self.filter_text = text.strip()
+        self.page = 0
+        self.resort()
+
+    def page_count(self) -> int:
+        return max(1, (len(self.view) + self.page_size - 1) // self.page_size)
+
+    def set_page(self, page: int) -> None:
+        self.page = min(max(0, page), self.page_count() - 1)
+        self.refresh()
+
+    def _on_page(self, pos: int) -> bool:
+        if self.descending:
+            pos = len(self.view) - 1 - pos
+        return self.page * self.page_size <= pos < (self.page + 1) * self.page_size
+
+    def _item_at(self, slot: int) -> Optional[Any]:
+        pos = self.page * self.page_size + slot
+        if pos >= len(self.view):
+            return None
+        return self.view[len(self.view) - 1 - pos if self.descending else pos]
+
+    # --- виджеты --- #
+
+    def build(self) -> None:
+        """Создать панель управления и строки страницы (внутри текущего окна)."""
+        with dpg.group(horizontal=True):
+            dpg.add_input_text(label="Filter", width=160, callback=lambda s, a: self.set_filter(a),
+                               hint="name, >N, <N, vip")
+            dpg.add_combo(list(self.sort_keys), label="Sort", width=120, default_value=self.sort_name,
+                          callback=lambda s, a: self.set_sort(a, self.descending))
+            dpg.add_checkbox(label="Desc", callback=lambda s, a: self.set_sort(self.sort_name, a))
+            dpg.add_button(label="<", callback=lambda s, a: self.set_page(self.page - 1))
+            dpg.add_text("", tag=f"{self.tag}_page")
+            dpg.add_button(label=">", callback=lambda s, a: self.set_page(self.page + 1))
+
+        with dpg.table(tag=self.tag, header_row=True,
+                       borders_innerH=True, borders_innerV=True,
+                       borders_outerH=True, borders_outerV=True,
+                       resizable=True, row_background=True,
+                       policy=dpg.mvTable_SizingFixedFit):
+            for label, _ in self.columns:
+                dpg.add_table_column(label=label)
+            for slot in range(self.page_size):
+                with dpg.table_row(tag=f"{self.tag}_row{slot}", show=False):
+                    for col in range(len(self.columns)):
+                        if col == 0:
+                            dpg.add_selectable(label="", tag=f"{self.tag}_{slot}_{col}",
+                                               span_columns=True, user_data=slot,
+                                               callback=self._select)
+                        else:
+                            dpg.add_text("", tag=f"{self.tag}_{slot}_{col}")
+        self.built = True
+        self.refresh()
+
+    def _select(self, sender, app_data, slot: int) -> None:
+        dpg.set_value(sender, False)
+        item = self._item_at(slot)
+        if item is not None and self.on_select:
+            self.on_select(item)
+
+    def _render_row(self, pos: int) -> None:
+        if not self.built:
+            return
+        if self.descending:
+            pos = len(self.view) - 1 - pos
+        slot = pos - self.page * self.page_size
+        item = self._item_at(slot)
+        for col, (_, fmt) in enumerate(self.columns):
+            cell = f"{self.tag}_{slot}_{col}"
+            if col == 0:
+                dpg.configure_item(cell, label=fmt(item))
+            else:
+                dpg.set_value(cell, fmt(item))
+        dpg.configure_item(f"{self.tag}_row{slot}", show=True)
+
+    def refresh(self) -> None:
+        """Перерисовать только строки текущей страницы."""
+        if not self.built:
+            return
+        self.page = min(self.page, self.page_count() - 1)
+        for slot in range(self.page_size):
+            pos = self.page * self.page_size + slot
+            if pos < len(self.view):
+                self._render_row(len(self.view) - 1 - pos if self.descending else pos)
+            else:
+                dpg.configure_item(f"{self.tag}_row{slot}", show=False)
+        dpg.set_value(f"{self.tag}_page", f"{self.page + 1}/{self.page_count()} ({len(self.view)})")
+
+
+def _numeric_filter(value: float, text: str) -> Optional[bool]:
+    """Фильтр вида '>N' или '<N'; None, если текст не числовой фильтр."""
+    if text[:1] in "<>" and len(text) > 1:
+        try:
+            limit = float(text[1:])
+        except ValueError:
+            return None
+        return value > limit if text[0] == ">" else value < limit
+    return None
+
+
+def client_matches(c: Client, text: str) -> bool:
+    """Фильтр клиентов: подстрока имени, '>N'/'<N' по весу, 'vip'."""
+    if not text:
+        return True
+    if text.lower() == "vip":
+        return c.is_vip
+    numeric = _numeric_filter(c.cargo_weight, text)
+    if numeric is not None:
+        return numeric
+    return text.lower() in c.name.lower()
+
+
+def vehicle_type_name(v: Any) -> str:
+    return "Truck" if isinstance(v, Truck) else "Train"
+
+
+def vehicle_matches(v: Any, text: str) -> bool:
+    """Фильтр транспорта: подстрока ID или типа, '>N'/'<N' по загрузке."""
+    if not text:
+        return True
+    numeric = _numeric_filter(v.current_load, text)
+    if numeric is not None:
+        return numeric
+    text = text.lower()
+    return text in v.vehicle_id.lower() or text in vehicle_type_name(v).lower()
+
+
+def _edit_client(c: Client) -> None:
+    open_client_dialog(client_id=c.client_id)
+
+
+def _edit_vehicle(v: Any) -> None:
+    open_vehicle_dialog(vehicle_id=v.vehicle_id)
+
+
+clients_view: Optional[VirtualTable] = None
+vehicles_view: Optional[VirtualTable] = None
+
+
+def _make_clients_view() -> VirtualTable:
+    """Таблица клиентов (страница строк, сортировка и фильтр)."""
+    return VirtualTable(
+        CLIENT_TABLE_TAG,
+        columns=[("Name", lambda c: c.name),
+                 ("ID", lambda c: c.client_id or ""),
+                 ("Weight (kg)", lambda c: f"{c.cargo_weight:.1f}"),
+                 ("VIP", lambda c: "Yes" if c.is_vip else "No")],
+        sort_keys={"added": lambda c: 0,
+                   "name": lambda c: c.name.lower(),
+                   "weight": lambda c: c.cargo_weight,
+                   "vip": lambda c: not c.is_vip},
+        filter_func=client_matches,
+        on_select=_edit_client,
+    )
+
+
+def _make_vehicles_view() -> VirtualTable:
+    """Таблица транспорта (страница строк, сортировка и фильтр)."""
+    return VirtualTable(
+        VEHICLE_TABLE_TAG,
+        columns=[("ID", lambda v: getattr(v, "vehicle_id", "")),
+                 ("Type", vehicle_type_name),
+                 ("Capacity (t)", lambda v: f"{v.capacity:.1f}"),
+                 ("Current load (t)", lambda v: f"{v.current_load:.1f}")],
+        sort_keys={"added": lambda v: 0,
+                   "load": lambda v: v.current_load,
+                   "capacity": lambda v: v.capacity,
+                   "type": vehicle_type_name},
+        filter_func=vehicle_matches,
+        on_select=_edit_vehicle,
+    )
+
+
+def init_app() -> None:
+    """
+    Создать данные приложения: компанию, экспорт, буфер лога и таблицы.
+    Модули экспорта и логирования загружаются здесь, при запуске окна.
+    """
+    global company, exporter, log_buffer, clients_view, vehicles_view
+    from transport.export import Exporter
+
+    company = TransportCompany("My transport company")
+    exporter = Exporter(company)
+    log_buffer = LogBuffer(LOG_MAX_LINES, spill_path=LOG_SPILL_FILE)
+    clients_view = _make_clients_view()
+    vehicles_view = _make_vehicles_view()
+
 
 def refresh_clients_table() -> None:
-    """Перерисовать таблицу клиентов по списку clients."""
-    # Удаляем прошлые строки (child items)
-    dpg.delete_item(CLIENT_TABLE_TAG, children_only=True)
-
-    # Заново создаём заголовки
-    with dpg.table_row(parent=CLIENT_TABLE_TAG):
-        dpg.add_text("Name")
-        dpg.add_text("Weight (kg)")
-        dpg.add_text("VIP")
-
-    # Строки с данными
-    for c in clients:
-        with dpg.table_row(parent=CLIENT_TABLE_TAG):
-            dpg.add_text(c.name)
-            dpg.add_text(f"{c.cargo_weight:.1f}")
-            dpg.add_text("Yes" if c.is_vip else "No")
-
-
-def refresh_vehicles_table() -> None:
-    """Перерисовать таблицу транспортных средств по списку vehicles."""
-    dpg.delete_item(VEHICLE_TABLE_TAG, children_only=True)
-
-    with dpg.table_row(parent=VEHICLE_TABLE_TAG):
-        dpg.add_text("ID")
-        dpg.add_text("Type")
-        dpg.add_text("Capacity (t)")
-        dpg.add_text("Current load (t)")
-
-    for v in vehicles:
-        with dpg.table_row(parent=VEHICLE_TABLE_TAG):
-            dpg.add_text(getattr(v, "vehicle_id", ""))
-            v_type = "Truck" if isinstance(v, Truck) else "Train"
-            dpg.add_text(v_type)
-            dpg.add_text(f"{v.capacity:.1f}")
-            dpg.add_text(f"{v.current_load:.1f}")
+    """Перерисовать видимую страницу таблицы клиентов."""
+    clients_view.refresh()
+
+
+def refresh_vehicles_table(changed: Optional[Iterable[Any]] = None) -> None:
+    """
+    Обновить таблицу транспорта после изменения загрузки.
+    changed — транспорт, у которого изменилась загрузка: переставляется
+    только он (сортировка и фильтр могут зависеть от загрузки).
+    None — индекс пересобирается целиком (после распределения).
+    Виджеты обновляются только для видимой страницы.
+    """
+    if changed is None:
+        vehicles_view.resort()
+    else:
+        vehicles_view.reposition(v for v in set(changed) if v is not None)
 
 
 # --- Диалог клиента --- #
 
-def open_client_dialog(sender=None, app_data=None, index: Optional[int] = None) -> None:
+def open_client_dialog(sender=None, app_data=None, client_id: Optional[str] = None) -> None:
     """
     Открыть окно добавления/редактирования клиента.
-    index = None -> новый клиент, иначе редактирование существующего.
+    client_id = None -> новый клиент, иначе редактирование существующего.
     """
-    global CURRENT_CLIENT_INDEX
-    CURRENT_CLIENT_INDEX = index
+    global CURRENT_CLIENT_ID
+    CURRENT_CLIENT_ID = client_id
 
     # Если редактирование — подставляем значения
     default_name = ""
     default_weight = 100.0
     default_vip = False
-    if index is not None and 0 <= index < len(clients):
-        c = clients[index]
+    c = company.get_client(client_id) if client_id is not None else None
+    if c is not None:
         default_name = c.name
         default_weight = c.cargo_weight
         default_vip = c.is_vip
@@ -208,8 +613,6 @@ def open_client_dialog(sender=None, app_data=None, index: Optional[int] = None)
 
 def save_client_from_dialog(sender, app_data) -> None:
     """Считать поля диалога клиента, проверить и сохранить."""
-    global company, clients
-
     name = dpg.get_value("dlg_client_name")
     weight = dpg.get_value("dlg_client_weight")
     is_vip = dpg.get_value("dlg_client_vip")
@@ -228,43 +631,42 @@ def save_client_from_dialog(sender, app_data) -> None:
         show_error(f"Client creation error: {e}")
         return
 
-    if CURRENT_CLIENT_INDEX is None:
+    old = company.get_client(CURRENT_CLIENT_ID) if CURRENT_CLIENT_ID is not None else None
+    if old is None:
         # Новый клиент
-        clients.append(client_obj)
-        if company:
-            company.add_client(client_obj)
+        company.add_client(client_obj)
+        clients_view.upsert(client_obj)
         log(f"Client added: {client_obj}")
     else:
-        # Редактирование существующего
-        idx = CURRENT_CLIENT_INDEX
-        old = clients[idx]
-        clients[idx] = client_obj
-        if company:
-            # Обновляем объект и в списке компании
-            company.clients[idx] = client_obj
+        # Редактирование существующего: клиент сохраняет ID, выгружается
+        # только его груз, новый вес загружается туда же или в подходящий транспорт
+        before = company.vehicle_of(old)
+        after = company.replace_client(old, client_obj)
+        if before is not None or after is not None:
+            refresh_vehicles_table([before, after])
+        clients_view.upsert(client_obj, old)
         log(f"Client updated: {old} -> {client_obj}")
 
-    refresh_clients_table()
     dpg.delete_item("client_dialog")
     set_status("Client saved.")
 
 
 # --- Диалог транспорта --- #
 
-def open_vehicle_dialog(sender=None, app_data=None, index: Optional[int] = None) -> None:
+def open_vehicle_dialog(sender=None, app_data=None, vehicle_id: Optional[str] = None) -> None:
     """
     Окно добавления/редактирования транспортного средства.
     Тип выбирается из списка: Truck / Train.
     """
-    global CURRENT_VEHICLE_INDEX
-    CURRENT_VEHICLE_INDEX = index
+    global CURRENT_VEHICLE_ID
+    CURRENT_VEHICLE_ID = vehicle_id
 
     default_type = "Truck"
     default_capacity = 10.0
     default_cars = 10
 
-    if index is not None and 0 <= index < len(vehicles):
-        v = vehicles[index]
+    v = company.get_vehicle(vehicle_id) if vehicle_id is not None else None
+    if v is not None:
         default_capacity = v.capacity
         if isinstance(v, Truck):
             default_type = "Truck"
@@ -293,8 +695,6 @@ def open_vehicle_dialog(sender=None, app_data=None, index: Optional[int] = None)
 
 def save_vehicle_from_dialog(sender, app_data) -> None:
     """Считать поля диалога транспорта, проверить и сохранить."""
-    global company, vehicles
-
     v_type = dpg.get_value("dlg_vehicle_type")
     capacity = dpg.get_value("dlg_vehicle_capacity")
     cars = dpg.get_value("dlg_vehicle_cars")
@@ -318,20 +718,21 @@ def save_vehicle_from_dialog(sender, app_data) -> None:
         show_error(f"Vehicle creation error: {e}")
         return
 
-    if CURRENT_VEHICLE_INDEX is None:
-        vehicles.append(vehicle_obj)
-        if company:
-            company.add_vehicle(vehicle_obj)
+    old = company.get_vehicle(CURRENT_VEHICLE_ID) if CURRENT_VEHICLE_ID is not None else None
+    if old is None:
+        company.add_vehicle(vehicle_obj)
+        vehicles_view.upsert(vehicle_obj)
         log(f"Vehicle added: {vehicle_obj}")
     else:
-        idx = CURRENT_VEHICLE_INDEX
-        old = vehicles[idx]
-        vehicles[idx] = vehicle_obj
-        if company:
-            company.vehicles[idx] = vehicle_obj
+        # Транспорт сохраняет ID; грузы старого переносятся в новый или в остальной парк
+        vehicle_obj.vehicle_id = old.vehicle_id
+        moved = old.clients_list
+        log_unplaced(company.replace_vehicle(old, vehicle_obj), "Not placed after update")
         log(f"Vehicle updated: {old} -> {vehicle_obj}")
+        vehicles_view.upsert(vehicle_obj, old)
+        # Грузы могли переехать в другой транспорт
+        refresh_vehicles_table(company.vehicle_of(c) for c in moved)
 
-    refresh_vehicles_table()
     dpg.delete_item("vehicle_dialog")
     set_status("Vehicle saved.")
 
@@ -340,110 +741,164 @@ def save_vehicle_from_dialog(sender, app_data) -> None:
 
 def delete_selected_client(sender, app_data) -> None:
     """Удалить последнего клиента в списке (упрощённый вариант)."""
-    global clients, company
-    if not clients:
+    client_id = next(reversed(company.client_ids()), None)
+    if client_id is None:
         set_status("No clients to delete.")
         return
-    removed = clients.pop()
-    if company and removed in company.clients:
-        company.clients.remove(removed)
-    refresh_clients_table()
+    removed = company.get_client(client_id)
+    vehicle = company.vehicle_of(removed)
+    company.remove_client(client_id)
+    clients_view.remove(removed)
+    if vehicle is not None:
+        refresh_vehicles_table([vehicle])
     log(f"Client deleted: {removed}")
     set_status("Client deleted.")
 
 
 def delete_selected_vehicle(sender, app_data) -> None:
     """Удалить последнее транспортное средство (упрощённый вариант)."""
-    global vehicles, company
-    if not vehicles:
+    vehicle_id = next(reversed(company.vehicle_ids()), None)
+    if vehicle_id is None:
         set_status("No vehicles to delete.")
         return
-    removed = vehicles.pop()
-    if company and removed in company.vehicles:
-        company.vehicles.remove(removed)
-    refresh_vehicles_table()
+    removed = company.get_vehicle(vehicle_id)
     log(f"Vehicle deleted: {removed}")
+    # Грузы удаленного транспорта перераспределяются по остальному парку
+    moved = removed.clients_list
+    log_unplaced(company.remove_vehicle(vehicle_id), "Not placed after delete")
+    vehicles_view.remove(removed)
+    refresh_vehicles_table(company.vehicle_of(c) for c in moved)
     set_status("Vehicle deleted.")
 
 
-# --- Создание компании, оптимизация и экспорт --- #
-
-def create_company() -> None:
-    """Создать объект транспортной компании (один на всё приложение)."""
-    global company
-    if company is None:
-        company = TransportCompany("My transport company")
-        # Переносим уже введённые объекты в компанию
-        for c in clients:
-            company.add_client(c)
-        for v in vehicles:
-            company.add_vehicle(v)
-
+# --- Оптимизация и экспорт --- #
 
 def distribute_cargo(sender, app_data) -> None:
-    """Запустить оптимизацию распределения грузов и показать результат."""
-    global last_distribution_lines
+    """Запустить распределение грузов в фоновом потоке."""
+    global distribution_worker
 
-    if not clients:
+    if not company.client_ids():
         show_error("No clients to distribute.")
         return
-    if not vehicles:
+    if not company.vehicle_ids():
         show_error("No vehicles to distribute.")
         return
+    if distribution_worker is not None and distribution_worker.running:
+        set_status("Distribution is already running.")
+        return
 
-    create_company()
+    # Размещаются только клиенты, которые еще не загружены;
+    # окно остаётся отзывчивым, результат применяется в poll_distribution
+    from transport.background import DistributionWorker
+    distribution_worker = DistributionWorker(company)
+    distribution_worker.start()
+    dpg.set_value(PROGRESS_TAG, 0.0)
+    dpg.configure_item(PROGRESS_TAG, show=True)
+    dpg.configure_item(CANCEL_TAG, show=True)
+    set_status("Distributing cargo...")
 
-    try:
-        company.optimize_cargo_distribution()
-    except Exception as e:
-        show_error(f"Optimization error: {e}")
+
+def cancel_distribution(sender, app_data) -> None:
+    """Остановить фоновое распределение (парк остаётся без изменений)."""
+    if distribution_worker is not None and distribution_worker.running:
+        distribution_worker.cancel()
+        set_status("Cancelling distribution...")
+
+
+def poll_distribution() -> None:
+    """
+    Вызывается каждый кадр: обновить прогресс и, когда поток закончил,
+    применить результат к компании одним пакетом в потоке интерфейса.
+    """
+    global distribution_worker
+    worker = distribution_worker
+    if worker is None:
         return
 
+    dpg.set_value(PROGRESS_TAG, worker.fraction)
+    dpg.configure_item(PROGRESS_TAG, overlay=f"{worker.done}/{worker.total} clients, "
+                                             f"{worker.vehicles_used} vehicles")
+    if worker.running:
+        return
+
+    from transport.background import CANCELLED, FAILED, FINISHED
+    distribution_worker = None
+    dpg.configure_item(CANCEL_TAG, show=False)
+    dpg.configure_item(PROGRESS_TAG, show=False)
+    if worker.state == FINISHED:
+        unplaced = worker.apply()
+        show_distribution_result()
+        log_unplaced(unplaced, "Not placed")
+    elif worker.state == CANCELLED:
+        set_status("Distribution cancelled.")
+        log("Distribution cancelled, fleet unchanged.", "WARNING")
+    elif worker.state == FAILED:
+        show_error(f"Optimization error: {worker.error}")
+
+
+def log_unplaced(clients: List[Client], title: str, limit: int = LOG_UNPLACED_NAMES) -> None:
+    """Одна строка о неразмещенных клиентах: число и первые limit имён."""
+    if not clients:
+        return
+    names = ", ".join(c.name for c in clients[:limit])
+    more = f" and {len(clients) - limit} more" if len(clients) > limit else ""
+    log(f"{title}: {len(clients)} clients ({names}{more})", "WARNING")
+
+
+def show_distribution_result() -> None:
+    """
+    Показать сводку распределения в логе (по типам транспорта, без строки
+    на каждого клиента) и обновить таблицу транспорта.
+    """
     clear_log()
-    last_distribution_lines = []
     log(f"Cargo distribution for company '{company.name}':")
-    last_distribution_lines.append(f"Cargo distribution for company '{company.name}':")
 
+    # Тип -> [всего, задействовано, грузоподъемность, загрузка, клиентов]
+    totals: Dict[str, List[float]] = {}
     for v in company.vehicles:
-        v_type = "Truck" if isinstance(v, Truck) else "Train"
-        line = f"{v_type} {v.vehicle_id} | capacity={v.capacity} t, load={v.current_load} t"
-        log(line)
-        last_distribution_lines.append(line)
-        if not v.clients_list:
-            log("  No clients loaded.")
-            last_distribution_lines.append("  No clients loaded.")
-        else:
-            for c in v.clients_list:
-                c_line = f"  - {c.name}, {c.cargo_weight} t, VIP={c.is_vip}"
-                log(c_line)
-                last_distribution_lines.append(c_line)
+        row = totals.setdefault(vehicle_type_name(v), [0, 0, 0.0, 0.0, 0])
+        count = v.client_count
+        row[0] += 1
+        row[1] += count > 0
+        row[2] += v.capacity
+        row[3] += v.current_load
+        row[4] += count
+    for v_type, (count, used, capacity, load, clients) in totals.items():
+        share = load / capacity * 100 if capacity else 0.0
+        log(f"{v_type}: {used}/{count} used, {clients} clients, "
+            f"load {load:.1f}/{capacity:.1f} t ({share:.0f}%)")
+    unplaced = len(company.unplaced_clients())
+    log(f"Clients: {len(company.client_ids()) - unplaced} placed, {unplaced} not placed")
 
     refresh_vehicles_table()
     set_status("Cargo distribution completed.")
 
 
-def export_result(sender, app_data) -> None:
-    """Сохранить результат распределения в файл."""
-    if not last_distribution_lines:
-        show_error("No distribution result to export.")
+def export_result(sender, app_data, changed_only: bool = False) -> None:
+    """
+    Сохранить распределение в CSV (строка на клиента).
+    changed_only=True -> только строки, изменившиеся после прошлого экспорта.
+    """
+    if not company.client_ids() and not changed_only:
+        show_error("No clients to export.")
         return
 
-    filename = "distribution_result.txt"
+    filename = EXPORT_CHANGES_FILE if changed_only else EXPORT_FILE
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            for line in last_distribution_lines:
-                f.write(line + "\n")
+        count = exporter.export(filename, changed_only=changed_only)
     except Exception as e:
         show_error(f"File save error: {e}")
         return
 
-    set_status(f"Result exported to {filename}.")
-    log(f"Result exported to {filename}.")
+    set_status(f"{count} rows exported to {filename}.")
+    log(f"{count} rows exported to {filename}.")
 
 
 # --- Точка входа: построение интерфейса --- #
 
 def main() -> None:
+    init_app()
+
     dpg.create_context()
     dpg.create_viewport(title="LR11 / LR13 - GUI version", width=950, height=700)
 
@@ -453,6 +908,8 @@ def main() -> None:
         with dpg.menu_bar():
             with dpg.menu(label="File"):
                 dpg.add_menu_item(label="Export result", callback=export_result)
+                dpg.add_menu_item(label="Export changes",
+                                  callback=lambda s, a: export_result(s, a, changed_only=True))
             with dpg.menu(label="Help"):
                 dpg.add_menu_item(label="About", callback=show_about)
 
@@ -464,47 +921,47 @@ def main() -> None:
         dpg.add_same_line()
         dpg.add_button(label="Distribute cargo", callback=distribute_cargo)
         dpg.add_same_line()
+        dpg.add_button(label="Cancel", tag=CANCEL_TAG, callback=cancel_distribution, show=False)
+        dpg.add_same_line()
         dpg.add_button(label="Delete client", callback=delete_selected_client)
         dpg.add_same_line()
         dpg.add_button(label="Delete vehicle", callback=delete_selected_vehicle)
 
         dpg.add_separator()
 
-        # Таблица клиентов
+        # Таблица клиентов (видна одна страница, клик по имени — редактирование)
         dpg.add_text("Clients")
-        with dpg.table(tag=CLIENT_TABLE_TAG, header_row=False,
-                       borders_innerH=True, borders_innerV=True,
-                       borders_outerH=True, borders_outerV=True,
-                       resizable=True, row_background=True,
-                       policy=dpg.mvTable_SizingFixedFit):
-            pass  # наполним в refresh_clients_table
+        clients_view.build()
 
         dpg.add_spacing(count=1)
 
         # Таблица транспортных средств
         dpg.add_text("Vehicles")
-        with dpg.table(tag=VEHICLE_TABLE_TAG, header_row=False,
-                       borders_innerH=True, borders_innerV=True,
-                       borders_outerH=True, borders_outerV=True,
-                       resizable=True, row_background=True,
-                       policy=dpg.mvTable_SizingFixedFit):
-            pass
+        vehicles_view.build()
 
         dpg.add_separator()
 
         # Лог и статус
+        dpg.add_combo(list(LogBuffer.LEVELS), label="Log level", tag=LOG_LEVEL_TAG,
+                      default_value="INFO", width=100,
+                      callback=lambda s, a: log_buffer.set_level(a))
         dpg.add_input_text(label="Log", tag=LOG_TAG, multiline=True,
                            readonly=True, width=-1, height=150)
         dpg.add_separator()
+        dpg.add_progress_bar(tag=PROGRESS_TAG, default_value=0.0, width=-1, show=False)
         dpg.add_text("Ready", tag=STATUS_TAG)
 
-    # начальное заполнение таблиц (пока пустые заголовки)
-    refresh_clients_table()
-    refresh_vehicles_table()
+    # начальное заполнение таблиц
+    clients_view.set_items(company.clients)
+    vehicles_view.set_items(company.vehicles)
 
     dpg.setup_dearpygui()
     dpg.show_viewport()
-    dpg.start_dearpygui()
+    # Свой цикл кадров: лог выводится в виджет один раз за кадр
+    while dpg.is_dearpygui_running():
+        poll_distribution()
+        log_buffer.flush()
+        dpg.render_dearpygui_frame()
     dpg.destroy_context()
 
 
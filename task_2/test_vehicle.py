@@ -1,8 +1,10 @@
 from transport.vehicle import Vehicle
 from transport.client import Client
+from transport.events import PrintSink
 
 # Создаём транспорт
 v = Vehicle(10.0)
+v.events = PrintSink()  # Печатаем сообщения о загрузке
 
 # Создаём клиента
 c = Client("Пётр", 4.5)
@@ -2,9 +2,11 @@ from transport.client import Client
 from transport.truck import Truck
 from transport.train import Train
 from transport.company import TransportCompany
+from transport.events import PrintSink
 
 # Создаем компанию
 company = TransportCompany("MegaTrans")
+company.subscribe(PrintSink())  # Печатаем пояснения к действиям
 
 # Добавляем клиентов
 company.add_client(Client("Иван", 5.0))
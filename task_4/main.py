@@ -1,50 +1,256 @@
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
 from transport.client import Client
 from transport.truck import Truck
 from transport.train import Train
 from transport.company import TransportCompany
+from transport.events import PrintSink
+from transport.loader import RowError, iter_clients, iter_vehicles
+from transport.packing import strategy_names
+from transport.snapshot import load_snapshot, save_snapshot
+from transport.export import FORMATS, export_distribution
 
-# Создаём объект компании
-company = TransportCompany("SuperTrans")
-
-# Меню программы
-while True:
-    print("\nМеню:")
-    print("1. Добавить клиента")
-    print("2. Добавить транспорт")
-    print("3. Показать все транспортные средства")
-    print("4. Распределить грузы")
-    print("5. Выход")
-
-    choice = input("Выберите действие: ")
-
-    # Добавление клиента
-    if choice == "1":
-        name = input("Имя клиента: ")
-        weight = float(input("Вес груза: "))
-        vip_input = input("VIP клиент? (y/n): ").lower()
-        is_vip = vip_input == 'y'
-        company.add_client(Client(name, weight, is_vip))
-
-    # Добавление транспорта
-    elif choice == "2":
-        t_type = input("Тип транспорта (truck/train): ").lower()
-        capacity = float(input("Грузоподъемность: "))
-        if t_type == "truck":
-            color = input("Цвет грузовика: ")
-            company.add_vehicle(Truck(capacity, color))
-        elif t_type == "train":
-            cars = int(input("Количество вагонов: "))
-            company.add_vehicle(Train(capacity, cars))
-
-    # Показ всех транспортных средств
-    elif choice == "3":
-        for v in company.list_vehicles():
-            print(v)
-
-    # Оптимизация распределения грузов
-    elif choice == "4":
-        company.optimize_cargo_distribution()
-
-    # Выход
-    elif choice == "5":
-        break
\ No newline at end of file
+# Программа работы с транспортной компанией.
+#
+# Без аргументов (или с командой menu) — интерактивное меню.
+# Пакетный режим без ввода с клавиатуры:
+#   python main.py run --clients clients.csv --vehicles fleet.csv --export result.csv
+#   python main.py load --state company.snap --clients clients.csv --vehicles fleet.csv
+#   python main.py distribute --state company.snap --strategy ffd
+#   python main.py export --state company.snap --output result.jsonl
+# Команды load/distribute/export хранят состояние компании в снимке (--state).
+# -q отключает вывод по каждому клиенту и транспорту, итоговая сводка
+# (время и скорость этапов) печатается всегда в stderr.
+
+# Коды завершения
+EXIT_OK = 0
+EXIT_ERROR = 1       # ошибка файла или данных
+EXIT_USAGE = 2       # неверные аргументы (argparse)
+EXIT_REJECTED = 3    # --strict: пропущены строки с ошибками
+EXIT_UNPLACED = 4    # --strict: остались неразмещенные клиенты
+
+
+# Интерактивное меню
+def menu(company: TransportCompany):
+    company.subscribe(PrintSink())  # Печатаем пояснения к действиям
+
+    # Меню программы
+    while True:
+        print("\nМеню:")
+        print("1. Добавить клиента")
+        print("2. Добавить транспорт")
+        print("3. Показать все транспортные средства")
+        print("4. Распределить грузы")
+        print("5. Показать всех клиентов")
+        print("6. Удалить клиента по ID")
+        print("7. Удалить транспорт по ID")
+        print("8. Выход")
+
+        choice = input("Выберите действие: ")
+
+        # Добавление клиента
+        if choice == "1":
+            name = input("Имя клиента: ")
+            weight = float(input("Вес груза: "))
+            vip_input = input("VIP клиент? (y/n): ").lower()
+            is_vip = vip_input == 'y'
+            company.add_client(Client(name, weight, is_vip))
+
+        # Добавление транспорта
+        elif choice == "2":
+            t_type = input("Тип транспорта (truck/train): ").lower()
+            capacity = float(input("Грузоподъемность: "))
+            if t_type == "truck":
+                color = input("Цвет грузовика: ")
+                company.add_vehicle(Truck(capacity, color))
+            elif t_type == "train":
+                cars = int(input("Количество вагонов: "))
+                company.add_vehicle(Train(capacity, cars))
+
+        # Показ всех транспортных средств
+        elif choice == "3":
+            for v in company.list_vehicles():
+                print(v)
+
+        # Оптимизация распределения грузов
+        elif choice == "4":
+            company.optimize_cargo_distribution()
+
+        # Показ всех клиентов с их ID и транспортом
+        elif choice == "5":
+            for c in company.clients:
+                v = company.vehicle_of(c)
+                print(f"{c.client_id}: {c}, транспорт: {v.vehicle_id if v else 'не загружен'}")
+
+        # Удаление клиента по ID
+        elif choice == "6":
+            client_id = input("ID клиента: ").strip()
+            if company.get_client(client_id) is None:
+                print("Клиент не найден")
+            else:
+                company.remove_client(client_id)
+
+        # Удаление транспорта по ID (его грузы перераспределяются)
+        elif choice == "7":
+            vehicle_id = input("ID транспорта: ").strip()
+            if company.get_vehicle(vehicle_id) is None:
+                print("Транспорт не найден")
+            else:
+                company.remove_vehicle(vehicle_id)
+
+        # Выход
+        elif choice == "8":
+            break
+
+
+# --- пакетный режим --- #
+
+# Сводка пакетного запуска: время и скорость каждого этапа
+class Summary:
+    def __init__(self):
+        self.stages: List[tuple] = []   # (этап, число объектов, секунды)
+        self.rejected_rows = 0
+        self.unplaced = 0               # не разместились при распределении
+
+    def add(self, stage: str, count: int, seconds: float):
+        self.stages.append((stage, count, seconds))
+
+    def print(self, company: TransportCompany):
+        out = sys.stderr
+        for stage, count, seconds in self.stages:
+            rate = f"{count / seconds:,.0f}/s" if seconds > 0 else "-"
+            print(f"{stage:<12} {count:>10,} items  {seconds:8.3f} s  {rate:>14}", file=out)
+        unplaced = len(company.unplaced_clients())
+        used = sum(1 for v in company.vehicles if v.client_count)
+        print(f"clients {len(company.clients):,}, placed {len(company.clients) - unplaced:,}, "
+              f"unplaced {unplaced:,}, "
+              f"vehicles {len(company.vehicles):,} (used {used:,}), "
+              f"rejected rows {self.rejected_rows:,}", file=out)
+
+
+# Загрузка клиентов и транспорта из файлов
+def load_files(company: TransportCompany, args, summary: Summary):
+    def on_errors(errors: List[RowError]):
+        summary.rejected_rows += len(errors)
+        if not args.quiet:
+            for error in errors:
+                print(f"line {error.line}: {error.message}", file=sys.stderr)
+
+    for path in args.vehicles or []:
+        start = time.perf_counter()
+        count = company.add_vehicles(iter_vehicles(path, on_errors))
+        summary.add("vehicles", count, time.perf_counter() - start)
+    for path in args.clients or []:
+        start = time.perf_counter()
+        count = company.add_clients(iter_clients(path, on_errors, known_ids=company.client_ids()))
+        summary.add("clients", count, time.perf_counter() - start)
+
+
+def distribute(company: TransportCompany, args, summary: Summary):
+    clients = len(company.unplaced_clients()) if not args.reset else len(company.clients)
+    start = time.perf_counter()
+    unplaced = company.optimize_cargo_distribution(args.strategy, args.reset)
+    summary.add("distribute", clients, time.perf_counter() - start)
+    summary.unplaced = len(unplaced)
+
+
+def export(company: TransportCompany, path: str, fmt: Optional[str], summary: Summary):
+    start = time.perf_counter()
+    count = export_distribution(company, path, fmt)
+    summary.add("export", count, time.perf_counter() - start)
+
+
+# Компания из снимка (или новая, если снимка нет и это разрешено)
+def open_state(args, create: bool) -> TransportCompany:
+    if args.state and os.path.exists(args.state):
+        return load_snapshot(args.state)
+    if args.state and not create:
+        raise FileNotFoundError(f"Снимок не найден: {args.state}")
+    return TransportCompany(args.name)
+
+
+def save_state(company: TransportCompany, args, summary: Summary):
+    if args.state:
+        start = time.perf_counter()
+        save_snapshot(company, args.state)
+        summary.add("save", len(company.clients) + len(company.vehicles), time.perf_counter() - start)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Transport company: interactive menu or batch mode")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("menu", help="interactive menu (default)")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-q", "--quiet", action="store_true",
+                        help="no per-item output, only the final summary")
+    common.add_argument("--strict", action="store_true",
+                        help="non-zero exit code on rejected rows or unplaced clients")
+    common.add_argument("--name", default="SuperTrans", help="company name for a new state")
+
+    files = argparse.ArgumentParser(add_help=False)
+    files.add_argument("--clients", action="append", metavar="FILE", help="clients CSV/JSONL (repeatable)")
+    files.add_argument("--vehicles", action="append", metavar="FILE", help="vehicles CSV/JSONL (repeatable)")
+
+    packing = argparse.ArgumentParser(add_help=False)
+    packing.add_argument("--strategy", default="bfd", choices=strategy_names())
+    packing.add_argument("--reset", action="store_true", help="unload everything and distribute again")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=FORMATS, help="export format (default: by extension)")
+
+    run = commands.add_parser("run", parents=[common, files, packing, output],
+                              help="load files, distribute and export in one go")
+    run.add_argument("--state", help="optional snapshot to start from and save to")
+    run.add_argument("--export", metavar="PATH", help="export the distribution")
+
+    load = commands.add_parser("load", parents=[common, files], help="load files into the state")
+    load.add_argument("--state", required=True, help="snapshot file (created if missing)")
+
+    dist = commands.add_parser("distribute", parents=[common, packing], help="distribute the state")
+    dist.add_argument("--state", required=True, help="snapshot file")
+
+    exp = commands.add_parser("export", parents=[common, output], help="export the state")
+    exp.add_argument("--state", required=True, help="snapshot file")
+    exp.add_argument("--output", required=True, metavar="PATH")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command in (None, "menu"):
+        menu(TransportCompany("SuperTrans"))
+        return EXIT_OK
+
+    summary = Summary()
+    try:
+        company = open_state(args, create=args.command in ("run", "load"))
+        if not args.quiet:
+            company.subscribe(PrintSink())
+        if args.command in ("run", "load"):
+            load_files(company, args, summary)
+        if args.command in ("run", "distribute"):
+            distribute(company, args, summary)
+        if args.command == "run" and args.export:
+            export(company, args.export, args.format, summary)
+        if args.command == "export":
+            export(company, args.output, args.format, summary)
+        if args.command != "export":
+            save_state(company, args, summary)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    summary.print(company)
+
+    if args.strict and summary.rejected_rows:
+        return EXIT_REJECTED
+    if args.strict and summary.unplaced:
+        return EXIT_UNPLACED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
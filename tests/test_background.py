@@ -0,0 +1,83 @@
+import threading
+import pytest
+from transport.background import CANCELLED, FAILED, FINISHED, IDLE, DistributionWorker
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.packing import BestFitDecreasing
+from transport.truck import Truck
+
+
+# Стратегия, которая ждет сигнала перед размещением (чтобы успеть отменить)
+class GatedBestFit(BestFitDecreasing):
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def order(self, weights, vip):
+        self.gate.wait(5)
+        return super().order(weights, vip)
+
+
+class BrokenStrategy(BestFitDecreasing):
+    def assign(self, order, weights, vip, capacities, loads):
+        raise ArithmeticError("boom")
+
+
+def make_company():
+    company = TransportCompany("test")
+    company.add_vehicles([Truck(10.0, "red"), Truck(10.0, "blue")])
+    company.add_clients([Client(f"c{i}", 4.0) for i in range(6)])
+    return company
+
+
+# Пока результат не применен, парк не меняется
+def test_finished_result_is_applied_in_one_batch():
+    company = make_company()
+    worker = DistributionWorker(company, progress_step=1)
+    worker.start()
+    worker.join(5)
+    assert worker.state == FINISHED and worker.fraction == 1.0
+    assert all(v.current_load == 0 for v in company.vehicles)
+    unplaced = worker.apply()
+    assert len(unplaced) == 2 and worker.state == IDLE
+    assert sum(v.current_load for v in company.vehicles) == 16.0
+
+
+def test_cancel_leaves_fleet_unchanged():
+    company = make_company()
+    strategy = GatedBestFit()
+    worker = DistributionWorker(company, strategy, progress_step=1)
+    worker.start()
+    with pytest.raises(RuntimeError):
+        worker.start()
+    worker.cancel()
+    strategy.gate.set()
+    worker.join(5)
+    assert worker.state == CANCELLED
+    assert company.unplaced_clients() == company.clients
+    with pytest.raises(RuntimeError):
+        worker.apply()
+
+
+# Клиенты, удаленные за время работы, пропускаются при применении
+def test_apply_skips_clients_removed_meanwhile():
+    company = make_company()
+    strategy = GatedBestFit()
+    worker = DistributionWorker(company, strategy)
+    worker.start()
+    gone = company.clients[0]
+    company.remove_client(gone)
+    strategy.gate.set()
+    worker.join(5)
+    unplaced = worker.apply()
+    assert gone not in unplaced and company.vehicle_of(gone) is None
+    # План считался с удаленным клиентом: его место остается свободным
+    assert sum(v.client_count for v in company.vehicles) == 3
+    assert len(unplaced) == 2
+
+
+def test_strategy_error_is_reported():
+    worker = DistributionWorker(make_company(), BrokenStrategy())
+    worker.start()
+    worker.join(5)
+    assert worker.state == FAILED
+    assert isinstance(worker.error, ArithmeticError)
@@ -0,0 +1,55 @@
+import json
+import pytest
+from benchmarks.generators import generate_clients, generate_fleet, make_company
+from benchmarks.run import compare, main, percentile
+
+
+# Одинаковый seed — одинаковые данные
+def test_generators_are_reproducible():
+    for distribution in ("uniform", "heavy"):
+        a = generate_clients(200, seed=3, distribution=distribution)
+        b = generate_clients(200, seed=3, distribution=distribution)
+        assert [(c.cargo_weight, c.is_vip) for c in a] == [(c.cargo_weight, c.is_vip) for c in b]
+        assert all(c.cargo_weight > 0 for c in a)
+    assert [c.cargo_weight for c in generate_clients(50, seed=1)] != \
+        [c.cargo_weight for c in generate_clients(50, seed=2)]
+
+
+def test_unknown_distribution_is_rejected():
+    with pytest.raises(ValueError):
+        generate_clients(1, distribution="normal")
+
+
+def test_fleet_covers_total_weight():
+    fleet = generate_fleet(1000.0, seed=0, slack=1.1)
+    assert sum(v.capacity for v in fleet) >= 1100.0
+    company = make_company(300, seed=0)
+    assert len(company.clients) == 300
+    assert sum(v.capacity for v in company.vehicles) >= sum(c.cargo_weight for c in company.clients)
+
+
+def test_percentile():
+    values = [float(i) for i in range(101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+# Регрессия: падение скорости сверх допуска или больше задействованного транспорта
+def test_compare_reports_regressions():
+    base = {"cases": {"d": {"clients_per_s": 1000.0, "vehicles_used": 10}}}
+    assert compare({"cases": {"d": {"clients_per_s": 900.0, "vehicles_used": 10}}}, base, 0.2) == []
+    problems = compare({"cases": {"d": {"clients_per_s": 700.0, "vehicles_used": 11}}}, base, 0.2)
+    assert len(problems) == 2
+
+
+def test_small_run_writes_json(tmp_path):
+    out = tmp_path / "results.json"
+    assert main(["--scales", "50", "--strategies", "bfd", "--weights", "uniform",
+                 "--repeat", "1", "--output", str(out)]) == 0
+    cases = json.loads(out.read_text(encoding="utf-8"))["cases"]
+    case = cases["distribution/bfd/uniform/50"]
+    assert case["clients_per_s"] > 0 and case["vehicles_used"] <= case["vehicles"]
+    assert main(["--scales", "50", "--strategies", "bfd", "--weights", "uniform",
+                 "--repeat", "1", "--output", str(tmp_path / "again.json"),
+                 "--baseline", str(out), "--tolerance", "1.0"]) == 0
@@ -0,0 +1,32 @@
+import random
+import pytest
+from transport.capacity_index import BestFitIndex
+
+
+# Наивный вариант для сравнения: полный отсортированный список
+def naive_find(free, need, skip=0):
+    keys = sorted((f, i) for i, f in enumerate(free) if f >= need)
+    return keys[skip][1] if skip < len(keys) else -1
+
+
+def naive_largest(free, skip=0):
+    keys = sorted((f, i) for i, f in enumerate(free))
+    return keys[-1 - skip][1] if skip < len(keys) else -1
+
+
+# Маленькие блоки: деление и удаление блоков происходят часто
+@pytest.mark.parametrize("size", [0, 1, 5, 200])
+def test_best_fit_index_matches_sorted_list(monkeypatch, size):
+    monkeypatch.setattr(BestFitIndex, "_LOAD", 4)
+    rnd = random.Random(size)
+    free = [float(rnd.randint(0, 20)) for _ in range(size)]
+    index = BestFitIndex(free)
+    for _ in range(2000):
+        if size and rnd.random() < 0.5:
+            pos = rnd.randrange(size)
+            free[pos] = float(rnd.choice([rnd.randint(0, 20), -1]))
+            index.update(pos, free[pos])
+        need, skip = float(rnd.randint(-1, 21)), rnd.randint(0, 3)
+        assert index.find(need, skip) == naive_find(free, need, skip)
+        assert index.largest(skip) == naive_largest(free, skip)
+    assert [index.get(pos) for pos in range(size)] == free
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "task_4", "main.py")
+
+EXIT_OK, EXIT_REJECTED = 0, 3
+
+
+# Запуск пакетного режима task_4 как отдельного процесса
+def run_cli(*args):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, MAIN, *args], capture_output=True, text=True,
+                          encoding="utf-8", env=env, timeout=60)
+
+
+@pytest.fixture
+def files(tmp_path):
+    vehicles = tmp_path / "fleet.csv"
+    vehicles.write_text("type,capacity,color\ntruck,10,red\n", encoding="utf-8")
+    clients = tmp_path / "clients.csv"
+    clients.write_text("name,cargo_weight,is_vip,client_id\n"
+                       "a,1,0,x1\n"
+                       "b,2,0,x1\n"
+                       "c,nan,0,x2\n"
+                       "d,3,1,x3\n", encoding="utf-8")
+    return str(vehicles), str(clients), tmp_path
+
+
+# Строки с ошибками (повторный ID, NaN) пропускаются и печатаются,
+# остальные загружаются и распределяются
+@pytest.mark.parametrize("strict, code", [(False, EXIT_OK), (True, EXIT_REJECTED)])
+def test_run_reports_rejected_rows(files, strict, code):
+    vehicles, clients, _ = files
+    result = run_cli("run", *(["--strict"] if strict else []),
+                     "--vehicles", vehicles, "--clients", clients)
+    assert result.returncode == code, result.stderr
+    assert "line 3:" in result.stderr and "line 4:" in result.stderr
+    assert "clients 2, placed 2" in result.stderr
+    assert "rejected rows 2" in result.stderr
+
+
+def test_load_reports_rejected_rows(files):
+    vehicles, clients, tmp_path = files
+    state = str(tmp_path / "company.snap")
+    result = run_cli("load", "-q", "--strict", "--state", state,
+                     "--vehicles", vehicles, "--clients", clients)
+    assert result.returncode == EXIT_REJECTED, result.stderr
+    assert "rejected rows 2" in result.stderr
+    # Повторная загрузка того же файла: все ID уже заняты
+    again = run_cli("load", "-q", "--strict", "--state", state, "--clients", clients)
+    assert again.returncode == EXIT_REJECTED, again.stderr
+    assert "rejected rows 4" in again.stderr
@@ -0,0 +1,112 @@
+from transport.client import Client
+from transport.columnar import TRAIN, TRUCK, FleetStore
+from transport.company import TransportCompany
+from transport.train import Train
+from transport.truck import Truck
+
+
+# Загруженные в хранилище клиенты остаются загруженными в компании:
+# повторное распределение не загружает их второй раз
+def test_to_company_keeps_placements_for_later_optimize():
+    store = FleetStore()
+    store.add_vehicle(TRUCK, 10.0, color="red")
+    store.add_client("a", 4.0)
+    store.add_client("b", 3.0)
+    assert store.optimize_cargo_distribution() == 0
+    company = store.to_company("test")
+    truck = company.vehicles[0]
+    assert truck.current_load == 7.0
+    assert company.unplaced_clients() == []
+    assert all(company.vehicle_of(c) is truck for c in company.clients)
+    company.add_client(Client("c", 2.0))
+    assert company.optimize_cargo_distribution() == []
+    assert truck.current_load == 9.0
+    assert truck.client_count == 3
+
+
+def test_round_trip_through_company():
+    company = TransportCompany("test")
+    company.add_vehicles([Truck(10.0, "red"), Train(20.0, 2)])
+    company.add_clients([Client(f"c{i}", float(i + 1), i == 2) for i in range(8)])
+    unplaced = company.optimize_cargo_distribution()
+    store = FleetStore.from_company(company)
+    copy = store.to_company("copy")
+    assert [v.vehicle_id for v in copy.vehicles] == [v.vehicle_id for v in company.vehicles]
+    assert [v.current_load for v in copy.vehicles] == [v.current_load for v in company.vehicles]
+    assert sorted(c.name for c in copy.unplaced_clients()) == sorted(c.name for c in unplaced)
+    for original, restored in zip(company.vehicles, copy.vehicles):
+        assert sorted(c.name for c in restored.clients_list) == sorted(c.name for c in original.clients_list)
+    # Новое распределение не меняет уже загруженный транспорт сверх вместимости
+    copy.optimize_cargo_distribution()
+    for vehicle in copy.vehicles:
+        assert vehicle.current_load <= vehicle.capacity
+        assert abs(vehicle.current_load - sum(c.cargo_weight for c in vehicle.clients_list)) < 1e-9
+
+
+# Объем и паллеты учитываются так же, как в компании: «bfd» с объемом
+# переходит на многоресурсный вариант, «vbfd» читает колонки напрямую
+def test_volume_is_respected():
+    for strategy in ("bfd", "vbfd"):
+        store = FleetStore()
+        small = store.add_vehicle(TRUCK, 10.0, color="red", volume=5.0)
+        big = store.add_vehicle(TRUCK, 10.0, color="blue", volume=20.0)
+        a = store.add_client("a", 1.0, volume=6.0)
+        b = store.add_client("b", 1.0, volume=4.0, pallets=1)
+        assert store.optimize_cargo_distribution(strategy) == 0
+        assert store.client(a).vehicle_row == big
+        for row in (small, big):
+            vehicle = store.vehicle(row)
+            assert vehicle.current_volume <= vehicle.volume_capacity
+        assert store.vehicle(store.client(b).vehicle_row).current_pallets == 1
+
+
+def test_per_car_train_round_trip():
+    company = TransportCompany("test")
+    train = Train(20.0, 2, car_capacity=[6.0, 10.0])
+    company.add_vehicles([train, Truck(5.0, "red", volume=3.0, pallets=2)])
+    company.add_clients([Client("a", 5.0, client_id="A"), Client("b", 5.0, volume=2.0, pallets=1),
+                         Client("c", 4.0), Client("d", 3.0)])
+    company.optimize_cargo_distribution()
+    store = FleetStore.from_company(company)
+    assert store.car_loads[0] == train.car_loads
+    assert store.client(0).client_id == "A"
+    copy = store.to_company("copy")
+    for original, restored in zip(company.vehicles, copy.vehicles):
+        assert [c.name for c in restored.clients_list] == [c.name for c in original.clients_list]
+        assert restored.current_volume == original.current_volume
+        assert restored.current_pallets == original.current_pallets
+        assert restored.volume_capacity == original.volume_capacity
+    restored = copy.vehicles[0]
+    assert restored.car_loads == train.car_loads
+    assert [restored.car_of(c) for c in restored.clients_list] == \
+        [train.car_of(c) for c in train.clients_list]
+    assert copy.clients[0].client_id == "A"
+
+
+# Груз не кладется в поезд, если не помещается ни в один вагон
+def test_per_car_limits_in_store():
+    store = FleetStore()
+    store.add_vehicle(TRAIN, 20.0, number_of_cars=2, car_capacity=[4.0, 4.0])
+    store.add_client("a", 3.0)
+    store.add_client("b", 3.0)
+    store.add_client("c", 5.0)
+    assert store.optimize_cargo_distribution() == 1
+    assert store.car_loads[0] == [3.0, 3.0]
+    assert [c.car for c in store.vehicle(0).clients_list] == [0, 1]
+    assert store.client(2).vehicle_row == -1
+
+
+# Клиенты транспорта — в порядке загрузки, без чужих строк
+def test_clients_list_in_load_order():
+    store = FleetStore()
+    store.add_vehicle(TRUCK, 10.0, color="red")
+    store.add_vehicle(TRUCK, 10.0, color="blue")
+    for name, weight in (("a", 2.0), ("b", 9.0), ("c", 5.0), ("d", 1.0)):
+        store.add_client(name, weight)
+    store.optimize_cargo_distribution()
+    lists = [[c.name for c in store.vehicle(v).clients_list] for v in range(2)]
+    assert lists == [["b", "d"], ["c", "a"]]
+    assert store.vehicle(0).client_count == 2
+    store.add_client("e", 3.0)
+    store.optimize_cargo_distribution()
+    assert [c.name for c in store.vehicle(1).clients_list] == ["c", "a", "e"]
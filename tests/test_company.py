@@ -0,0 +1,180 @@
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.truck import Truck
+
+
+# Инварианты: загрузка совпадает с грузами, назначения — с содержимым транспорта
+def check(company):
+    for vehicle in company.vehicles:
+        assert vehicle.current_load <= vehicle.capacity
+        assert abs(vehicle.current_load - sum(c.cargo_weight for c in vehicle.clients_list)) < 1e-9
+        for client in vehicle.clients_list:
+            assert company.vehicle_of(client) is vehicle
+    loaded = sum(v.client_count for v in company.vehicles)
+    assert loaded + len(company.unplaced_clients()) == len(company.clients)
+
+
+def fleet(*capacities):
+    company = TransportCompany("test")
+    company.add_vehicles([Truck(c, "red") for c in capacities])
+    return company
+
+
+# Повторное распределение не загружает клиентов второй раз
+def test_repeated_distribution_places_only_new_clients():
+    company = fleet(10.0, 10.0)
+    company.add_clients([Client("a", 4.0), Client("b", 3.0)])
+    company.optimize_cargo_distribution()
+    loads = [v.current_load for v in company.vehicles]
+    assert company.optimize_cargo_distribution() == []
+    assert [v.current_load for v in company.vehicles] == loads
+    company.add_client(Client("c", 2.0))
+    company.optimize_cargo_distribution()
+    assert sum(v.current_load for v in company.vehicles) == 9.0
+    check(company)
+
+
+def test_reset_plans_from_scratch():
+    company = fleet(10.0, 10.0)
+    a, b = Client("a", 6.0), Client("b", 6.0)
+    company.add_clients([a, b])
+    company.optimize_cargo_distribution()
+    second = company.vehicle_of(b)
+    company.unload_client(b)
+    assert second.current_load == 0.0
+    assert company.optimize_cargo_distribution(reset=True) == []
+    check(company)
+
+
+# Удаление клиента выгружает только его груз
+def test_remove_client_touches_only_its_vehicle():
+    company = fleet(10.0, 10.0)
+    clients = [Client(f"c{i}", 4.0) for i in range(4)]
+    company.add_clients(clients)
+    company.optimize_cargo_distribution()
+    vehicle = company.vehicle_of(clients[0])
+    other = [v for v in company.vehicles if v is not vehicle][0]
+    other_load = other.current_load
+    company.remove_client(clients[0].client_id)
+    assert vehicle.current_load == 4.0
+    assert other.current_load == other_load
+    check(company)
+
+
+# Новые данные клиента остаются в том же транспорте, если помещаются
+def test_replace_client_keeps_vehicle_when_it_fits():
+    company = fleet(10.0, 10.0)
+    old = Client("a", 4.0)
+    company.add_clients([old, Client("b", 5.0)])
+    company.optimize_cargo_distribution()
+    vehicle = company.vehicle_of(old)
+    new = Client("a2", 5.0)
+    assert company.replace_client(old, new) is vehicle
+    assert new.client_id == old.client_id
+    assert company.get_client(old.client_id) is new
+    check(company)
+
+
+# Грузы удаленного транспорта перераспределяются по остальным
+def test_remove_vehicle_redistributes_orphans():
+    company = fleet(10.0, 10.0, 4.0)
+    company.add_clients([Client("a", 6.0), Client("b", 6.0), Client("c", 3.0)])
+    company.optimize_cargo_distribution()
+    target = max(company.vehicles, key=lambda v: v.current_load)
+    unplaced = company.remove_vehicle(target.vehicle_id)
+    assert target not in company.vehicles
+    assert len(unplaced) == 1
+    check(company)
+
+
+# Грузы заменяемого транспорта сначала идут в новый
+def test_replace_vehicle_moves_cargo_into_new_one():
+    company = fleet(10.0)
+    clients = [Client("a", 4.0), Client("b", 3.0)]
+    company.add_clients(clients)
+    company.optimize_cargo_distribution()
+    old = company.vehicles[0]
+    new = Truck(5.0, "blue")
+    new.vehicle_id = old.vehicle_id
+    unplaced = company.replace_vehicle(old, new)
+    assert company.vehicles == [new]
+    assert old.client_count == 0
+    assert [c.name for c in new.clients_list] == ["a"] and [c.name for c in unplaced] == ["b"]
+    check(company)
+
+
+def test_move_client_checks_space_first():
+    company = fleet(10.0, 5.0)
+    a, b = Client("a", 6.0), Client("b", 4.0)
+    company.add_clients([a, b])
+    company.optimize_cargo_distribution()
+    small = company.vehicles[1]
+    assert not company.move_client(a, small)
+    assert company.vehicle_of(a) is company.vehicles[0]
+    assert company.move_client(b, small)
+    assert company.vehicle_of(b) is small
+    check(company)
+    with pytest.raises(ValueError):
+        company.load_into(a, small)
+
+
+# Реестры по ID: поиск, проверка принадлежности и замена на том же месте
+def test_registry_lookup_by_id():
+    company = fleet(10.0, 20.0)
+    first, second = company.vehicles
+    assert company.get_vehicle(first.vehicle_id) is first
+    assert company.get_vehicle("missing") is None
+    a = Client("a", 1.0)
+    b = Client("b", 1.0, client_id="B-7")
+    company.add_clients([a, b])
+    assert a.client_id == "C1" and company.get_client("B-7") is b
+    assert list(company.client_ids()) == ["C1", "B-7"]
+    assert company.has_client(a) and not company.has_client(Client("a", 1.0))
+
+
+def test_registry_rejects_duplicate_ids():
+    company = fleet(10.0)
+    with pytest.raises(ValueError):
+        company.add_vehicle(company.vehicles[0])
+    company.add_client(Client("a", 1.0, client_id="X"))
+    with pytest.raises(ValueError):
+        company.add_client(Client("b", 1.0, client_id="X"))
+    with pytest.raises(TypeError):
+        company.add_client("c")
+
+
+# Новые ID не совпадают с заданными вручную
+def test_generated_client_ids_skip_taken():
+    company = fleet(10.0)
+    company.add_client(Client("a", 1.0, client_id="C1"))
+    b = Client("b", 1.0)
+    company.add_client(b)
+    assert b.client_id == "C2"
+
+
+def test_replace_keeps_position_and_new_id():
+    company = fleet(10.0, 20.0, 30.0)
+    middle = company.vehicles[1]
+    new = Truck(25.0, "blue")
+    new.vehicle_id = "renamed"
+    company.replace_vehicle(middle, new)
+    assert company.vehicles[1] is new
+    assert company.get_vehicle("renamed") is new and company.get_vehicle(middle.vehicle_id) is None
+    clients = [Client(name, 1.0) for name in "abc"]
+    company.add_clients(clients)
+    company.replace_client("C2", Client("b2", 1.0, client_id="Z"))
+    assert list(company.client_ids()) == ["C1", "Z", "C3"]
+    with pytest.raises(ValueError):
+        company.replace_client("Z", Client("x", 1.0, client_id="C1"))
+
+
+def test_remove_by_id_and_unknown_id():
+    company = fleet(10.0)
+    company.add_client(Client("a", 1.0))
+    company.remove_client("C1")
+    assert company.get_client("C1") is None and company.clients == []
+    with pytest.raises(ValueError):
+        company.remove_client("C1")
+    with pytest.raises(ValueError):
+        company.remove_vehicle("missing")
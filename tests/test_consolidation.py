@@ -0,0 +1,87 @@
+import random
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.consolidation import consolidate
+from transport.train import Train
+from transport.truck import Truck
+
+
+# Инварианты компании: нет перегрузки, загрузка совпадает с грузами,
+# назначения компании совпадают с содержимым транспорта
+def check_company(company):
+    seen = set()
+    for vehicle in company.vehicles:
+        clients = vehicle.clients_list
+        assert vehicle.current_load <= vehicle.capacity + 1e-9
+        assert vehicle.current_volume <= vehicle.volume_capacity + 1e-9
+        assert vehicle.current_pallets <= vehicle.pallet_capacity
+        assert abs(vehicle.current_load - sum(c.cargo_weight for c in clients)) < 1e-6
+        if isinstance(vehicle, Train) and vehicle.per_car:
+            for load, limit in zip(vehicle.car_loads, vehicle.car_capacities):
+                assert load <= limit + 1e-9
+        for client in clients:
+            assert client not in seen
+            seen.add(client)
+            assert company.vehicle_of(client) is vehicle
+    assert len(seen) == len(company.clients) - len(company.unplaced_clients())
+
+
+def scattered_company(seed=3):
+    rnd = random.Random(seed)
+    company = TransportCompany("test")
+    vehicles = [Truck(rnd.choice([10.0, 20.0, 40.0]), "red") for _ in range(300)]
+    vehicles += [Train(200.0, 5, car_capacity=40.0) for _ in range(10)]
+    company.add_vehicles(vehicles)
+    clients = [Client(f"c{i}", rnd.uniform(0.5, 12.0)) for i in range(900)]
+    company.add_clients(clients)
+    # Грузы вразброс — много слабо загруженного транспорта
+    for i, client in enumerate(clients):
+        if not company.load_into(client, vehicles[i % len(vehicles)]):
+            company.place_client(client)
+    return company
+
+
+def test_consolidation_frees_vehicles_and_keeps_invariants():
+    company = scattered_company()
+    check_company(company)
+    unplaced = len(company.unplaced_clients())
+    result = company.consolidate(max_iterations=None)
+    check_company(company)
+    assert result.freed_count > 0
+    assert all(vehicle.client_count == 0 for vehicle in result.freed)
+    assert result.vehicles_after == sum(1 for v in company.vehicles if v.client_count)
+    assert len(company.unplaced_clients()) == unplaced
+
+
+def test_consolidation_respects_iteration_budget():
+    company = scattered_company()
+    result = consolidate(company, max_iterations=20)
+    assert result.stopped == "iterations"
+    check_company(company)
+
+
+def test_swap_frees_vehicle():
+    company = TransportCompany("swap")
+    source, middle, third = Truck(10.0, "a"), Truck(10.0, "b"), Truck(10.0, "c")
+    company.add_vehicles([source, middle, third])
+    loads = [("s4", 4.0, source), ("m5", 5.0, middle), ("m2", 2.0, middle), ("t8", 8.0, third)]
+    for name, weight, vehicle in loads:
+        client = Client(name, weight)
+        company.add_client(client)
+        assert company.load_into(client, vehicle)
+    result = company.consolidate()
+    assert result.freed == [source]
+    check_company(company)
+
+
+def test_move_client_without_room_changes_nothing():
+    company = TransportCompany("move")
+    first, second = Truck(10.0, "a"), Truck(10.0, "b")
+    company.add_vehicles([first, second])
+    a, b = Client("a", 6.0), Client("b", 6.0)
+    company.add_clients([a, b])
+    company.load_into(a, first)
+    company.load_into(b, second)
+    assert not company.move_client(a, second)
+    assert company.vehicle_of(a) is first
+    assert first.current_load == 6.0 and second.current_load == 6.0
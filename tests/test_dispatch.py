@@ -0,0 +1,36 @@
+import random
+from transport.client import Client
+from transport.dispatch import _CargoPool, plan_trips
+from transport.truck import Truck
+
+
+# Пул сравнивается с прямым перебором: самый тяжелый из помещающихся,
+# при равном весе — добавленный позже (как в отсортированном списке ключей)
+def test_cargo_pool_takes_heaviest_that_fits():
+    rnd = random.Random(7)
+    clients = [Client(f"c{i}", float(rnd.randint(1, 30))) for i in range(300)]
+    pool = _CargoPool(clients)
+    left = list(enumerate(clients))
+    while left:
+        load, capacity = float(rnd.randint(0, 10)), float(rnd.randint(5, 40))
+        fitting = [(c.cargo_weight, seq) for seq, c in left if load + c.cargo_weight <= capacity]
+        expected = clients[max(fitting)[1]] if fitting else None
+        assert pool.take(load, capacity) is expected
+        if expected is not None:
+            left = [(seq, c) for seq, c in left if c is not expected]
+        assert len(pool) == len(left)
+        assert pool.lightest() == min((c.cargo_weight for _, c in left), default=float("inf"))
+    assert pool.rest() == []
+
+
+def test_plan_trips_serves_each_client_once():
+    rnd = random.Random(3)
+    clients = [Client(f"c{i}", float(rnd.randint(1, 12)), i % 7 == 0) for i in range(200)]
+    vehicles = [Truck(20.0, "red"), Truck(12.0, "blue"), Truck(5.0, "green")]
+    plan = plan_trips(clients, vehicles, duration=2.0, horizon=16.0)
+    served = [c for trip in plan.trips for c in trip.clients]
+    assert sorted(map(id, served + plan.unplaced)) == sorted(map(id, clients))
+    for trip in plan.trips:
+        assert trip.load == sum(c.cargo_weight for c in trip.clients) <= trip.vehicle.capacity
+        assert trip.end <= 16.0
+    assert plan.unplaced == [c for c in clients if c in set(plan.unplaced)]
@@ -0,0 +1,75 @@
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.events import (CLIENT_ADDED, CLIENT_REMOVED, CLIENT_UNPLACED, LOADED, REJECTED,
+                              UNLOADED, VEHICLE_ADDED, BufferedSink, CountingSink, NULL_SINK,
+                              PrintSink)
+from transport.truck import Truck
+
+
+def small_company():
+    company = TransportCompany("test")
+    company.add_vehicle(Truck(10.0, "red"))
+    company.add_clients([Client("a", 6.0), Client("b", 3.0), Client("c", 5.0)])
+    return company
+
+
+# Без подписчиков ядро ничего не печатает
+def test_core_is_silent_by_default(capsys):
+    company = small_company()
+    company.optimize_cargo_distribution()
+    assert company.events is NULL_SINK
+    assert capsys.readouterr().out == ""
+
+
+def test_buffered_sink_records_events_in_order():
+    company = TransportCompany("test")
+    sink = BufferedSink()
+    company.subscribe(sink)
+    truck = Truck(10.0, "red")
+    a, b, c = Client("a", 6.0), Client("b", 3.0), Client("c", 5.0)
+    company.add_vehicle(truck)
+    company.add_clients([a, b, c])
+    unplaced = company.optimize_cargo_distribution()
+    events = sink.drain()
+    assert events[:4] == [(VEHICLE_ADDED, truck), (CLIENT_ADDED, a), (CLIENT_ADDED, b), (CLIENT_ADDED, c)]
+    assert (LOADED, truck, a) in events and (LOADED, truck, b) in events
+    assert (CLIENT_UNPLACED, c) in events and unplaced == [c]
+    assert sink.drain() == []
+    company.remove_client(a.client_id)
+    assert sink.drain() == [(UNLOADED, truck, a), (CLIENT_REMOVED, a)]
+
+
+def test_buffered_sink_keeps_only_latest():
+    sink = BufferedSink(maxlen=2)
+    for name in "abc":
+        sink.client_added(Client(name, 1.0))
+    assert [e[1].name for e in sink.drain()] == ["b", "c"]
+
+
+# Несколько подписчиков получают одни и те же события; отписка отключает
+def test_subscribe_fans_out_and_unsubscribe_detaches():
+    company = TransportCompany("test")
+    counts, buffer = CountingSink(), BufferedSink()
+    company.subscribe(counts)
+    company.subscribe(buffer)
+    truck = Truck(5.0, "red")
+    company.add_vehicle(truck)
+    truck.load_cargo(Client("a", 4.0))
+    truck.load_cargo(Client("b", 4.0))
+    assert counts.counts[LOADED] == 1 and counts.counts[REJECTED] == 1
+    assert len(buffer.drain()) == 3
+    company.unsubscribe(buffer)
+    company.add_client(Client("c", 1.0))
+    assert buffer.drain() == []
+    assert counts.counts[CLIENT_ADDED] == 1
+    company.unsubscribe(counts)
+    assert company.events is NULL_SINK and truck.events is NULL_SINK
+
+
+def test_print_sink_keeps_console_output(capsys):
+    company = small_company()
+    company.subscribe(PrintSink())
+    company.optimize_cargo_distribution()
+    out = capsys.readouterr().out
+    assert "Загружен клиент a" in out
+    assert "Не удалось загрузить клиента c" in out
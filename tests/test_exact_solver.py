@@ -0,0 +1,65 @@
+import itertools
+import random
+import pytest
+from transport.exact_solver import ExactSolver
+from transport.packing import BestFitDecreasing
+
+
+# Полный перебор: лучшая оценка (VIP без места, обычные без места, транспорт)
+def brute_force(weights, vip, capacities, loads):
+    n, m = len(weights), len(capacities)
+    best = None
+    for assignment in itertools.product(range(-1, m), repeat=n):
+        total = list(loads)
+        for i, v in enumerate(assignment):
+            if v >= 0:
+                total[v] += weights[i]
+        if any(t > c for t, c in zip(total, capacities)):
+            continue
+        score = (sum(1 for i, v in enumerate(assignment) if v < 0 and vip[i]),
+                 sum(1 for i, v in enumerate(assignment) if v < 0 and not vip[i]),
+                 sum(1 for t in total if t > 0))
+        if best is None or score < best:
+            best = score
+    return best
+
+
+def solve(weights, vip, capacities, loads):
+    solver = ExactSolver(time_limit=10.0)
+    order = solver.order(weights, vip)
+    assignment = solver.assign(order, weights, vip, capacities, loads)
+    total = list(loads)
+    for i, v in enumerate(assignment):
+        if v >= 0:
+            total[v] += weights[i]
+    assert all(t <= c for t, c in zip(total, capacities))
+    score = (sum(1 for i, v in enumerate(assignment) if v < 0 and vip[i]),
+             sum(1 for i, v in enumerate(assignment) if v < 0 and not vip[i]),
+             sum(1 for t in total if t > 0))
+    return score, solver
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_brute_force(seed):
+    rnd = random.Random(seed)
+    n, m = rnd.randint(1, 6), rnd.randint(1, 3)
+    weights = [float(rnd.randint(1, 9)) for _ in range(n)]
+    vip = [rnd.random() < 0.3 for _ in range(n)]
+    capacities = [float(rnd.randint(4, 14)) for _ in range(m)]
+    loads = [float(rnd.choice([0, 0, rnd.randint(1, 3)])) for _ in range(m)]
+    score, solver = solve(weights, vip, capacities, loads)
+    assert solver.proven_optimal
+    assert score == brute_force(weights, vip, capacities, loads)
+
+
+# Жадный best-fit здесь открывает лишний транспорт, точный — нет
+def test_beats_greedy_on_known_instance():
+    weights = [5.0, 4.0, 4.0, 3.0, 2.0, 2.0]
+    vip = [False] * 6
+    capacities = [10.0, 10.0, 10.0]
+    greedy = BestFitDecreasing()
+    assignment = greedy.assign(greedy.order(weights, vip), weights, vip, capacities, [0.0] * 3)
+    assert len(set(assignment)) == 3
+    score, solver = solve(weights, vip, capacities, [0.0] * 3)
+    assert solver.proven_optimal
+    assert score == brute_force(weights, vip, capacities, [0.0] * 3) == (0, 0, 2)
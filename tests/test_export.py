@@ -0,0 +1,66 @@
+import csv
+import json
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.export import Exporter, export_distribution, read_binary_export
+from transport.truck import Truck
+
+
+def make_company():
+    company = TransportCompany("test")
+    truck = Truck(10.0, "red")
+    truck.vehicle_id = "T1"
+    company.add_vehicle(truck)
+    company.add_clients([Client("Анна", 6.0, True), Client("b", 3.0), Client("c", 5.0)])
+    company.optimize_cargo_distribution()
+    return company
+
+
+EXPECTED = [("C1", "Анна", 6.0, True, "T1", "placed"),
+            ("C2", "b", 3.0, False, "T1", "placed"),
+            ("C3", "c", 5.0, False, "", "unplaced")]
+
+
+# Три формата дают одни и те же строки
+def test_formats_agree(tmp_path):
+    company = make_company()
+    for fmt in ("csv", "jsonl", "bin"):
+        assert export_distribution(company, str(tmp_path / f"out.{fmt}")) == 3
+    with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["client_id", "name", "cargo_weight", "is_vip", "vehicle_id", "status"]
+    assert rows[1:] == [[str(x) for x in row] for row in EXPECTED]
+    with open(tmp_path / "out.jsonl", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [tuple(r.values()) for r in records] == EXPECTED
+    assert list(read_binary_export(str(tmp_path / "out.bin"))) == EXPECTED
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_distribution(make_company(), str(tmp_path / "out.xml"))
+    (tmp_path / "bad.bin").write_bytes(b"\x00" * 32)
+    with pytest.raises(ValueError):
+        list(read_binary_export(str(tmp_path / "bad.bin")))
+
+
+# Выгрузка изменений: только строки, изменившиеся после прошлой выгрузки
+def test_exporter_writes_only_changes(tmp_path):
+    company = make_company()
+    exporter = Exporter(company)
+    path = str(tmp_path / "changes.jsonl")
+    assert exporter.export(path, changed_only=True) == 3   # первая выгрузка — полная
+    assert exporter.pending == 0
+    company.remove_client("C1")
+    company.add_client(Client("d", 1.0))
+    company.optimize_cargo_distribution()
+    assert exporter.pending == 3
+    assert exporter.export(path, changed_only=True) == 3
+    with open(path, encoding="utf-8") as f:
+        status = {r["client_id"]: r["status"] for r in map(json.loads, f)}
+    assert status == {"C1": "removed", "C3": "placed", "C4": "placed"}
+    exporter.close()
+    company.add_client(Client("e", 1.0))
+    assert exporter.pending == 0
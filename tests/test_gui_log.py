@@ -0,0 +1,58 @@
+import main_gui
+from main_gui import LogBuffer
+
+
+def test_ring_buffer_keeps_latest_lines():
+    buffer = LogBuffer(maxlen=3)
+    for i in range(5):
+        buffer.write(f"line {i}")
+    assert list(buffer.lines) == ["line 2", "line 3", "line 4"]
+    assert buffer.dirty
+
+
+def test_level_filter_and_prefix():
+    buffer = LogBuffer(level="WARNING")
+    buffer.write("hidden")
+    buffer.write("careful", "WARNING")
+    buffer.write("broken", "ERROR")
+    assert list(buffer.lines) == ["[WARNING] careful", "[ERROR] broken"]
+    buffer.set_level("DEBUG")
+    buffer.write("details", "DEBUG")
+    assert buffer.lines[-1] == "[DEBUG] details"
+
+
+# Виджет обновляется одним set_value за flush и только при изменениях
+def test_flush_updates_widget_once(monkeypatch):
+    calls = []
+
+    class FakeDpg:
+        def set_value(self, tag, value):
+            calls.append((tag, value))
+
+    monkeypatch.setattr(main_gui, "dpg", FakeDpg())
+    buffer = LogBuffer()
+    buffer.write("a")
+    buffer.write("b")
+    buffer.flush()
+    buffer.flush()
+    assert calls == [(main_gui.LOG_TAG, "a\nb")]
+    buffer.clear()
+    buffer.flush()
+    assert calls[-1] == (main_gui.LOG_TAG, "")
+
+
+# Полная история уходит в файл, даже когда строки вытеснены из буфера
+def test_spill_file_keeps_full_history(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_gui, "dpg", type("FakeDpg", (), {"set_value": lambda self, t, v: None})())
+    path = tmp_path / "gui.log"
+    buffer = LogBuffer(maxlen=2, spill_path=str(path))
+    for i in range(5):
+        buffer.write(f"line {i}")
+    buffer.flush()
+    for handler in buffer._spill.handlers:
+        handler.flush()
+    assert path.read_text(encoding="utf-8").splitlines() == [f"line {i}" for i in range(5)]
+    assert len(buffer.lines) == 2
+    for handler in list(buffer._spill.handlers):
+        handler.close()
+        buffer._spill.removeHandler(handler)
@@ -0,0 +1,80 @@
+import pytest
+from main_gui import VirtualTable, client_matches, vehicle_matches
+from transport.client import Client
+from transport.truck import Truck
+
+# Индекс VirtualTable проверяется без окна: пока build() не вызван,
+# таблица не обращается к dearpygui
+
+
+def make_table(page_size=3):
+    return VirtualTable("t", columns=[("Name", lambda c: c.name)],
+                        sort_keys={"added": lambda c: 0, "weight": lambda c: c.cargo_weight},
+                        filter_func=client_matches, page_size=page_size)
+
+
+def names(table):
+    return [c.name for c in table.view]
+
+
+def test_sort_keeps_insertion_order_for_ties():
+    table = make_table()
+    clients = [Client("a", 3.0), Client("b", 1.0), Client("c", 3.0)]
+    table.set_items(clients)
+    assert names(table) == ["a", "b", "c"]
+    table.set_sort("weight")
+    assert names(table) == ["b", "a", "c"]
+    table.set_sort("weight", descending=True)
+    assert table._item_at(0).name == "c"
+
+
+def test_filter_and_pages():
+    table = make_table(page_size=2)
+    table.set_items([Client(f"c{i}", float(i), i == 4) for i in range(5)])
+    assert table.page_count() == 3
+    table.set_page(10)
+    assert table.page == 2 and table._item_at(0).name == "c4" and table._item_at(1) is None
+    table.set_filter(">2")
+    assert names(table) == ["c3", "c4"] and table.page == 0
+    table.set_filter("vip")
+    assert names(table) == ["c4"]
+
+
+# Изменения одного объекта не пересобирают индекс
+def test_upsert_reposition_and_remove():
+    table = make_table()
+    a, b, c = Client("a", 1.0), Client("b", 2.0), Client("c", 3.0)
+    table.set_items([a, b, c])
+    table.set_sort("weight")
+    a.cargo_weight = 5.0
+    table.reposition([a])
+    assert names(table) == ["b", "c", "a"]
+    new = Client("b2", 0.5)
+    table.upsert(new, old=b)
+    assert names(table) == ["b2", "c", "a"]
+    assert table.items[new] == 1          # место в порядке добавления сохранено
+    table.upsert(Client("d", 4.0))
+    assert names(table) == ["b2", "c", "d", "a"]
+    table.remove(c)
+    assert names(table) == ["b2", "d", "a"] and c not in table.items
+    table.remove(c)
+
+
+# Объект, переставший проходить фильтр, убирается из view
+def test_reposition_applies_filter():
+    table = VirtualTable("v", columns=[("ID", lambda v: v.vehicle_id)],
+                         sort_keys={"load": lambda v: v.current_load},
+                         filter_func=vehicle_matches)
+    trucks = [Truck(10.0, "red"), Truck(10.0, "blue")]
+    table.set_items(trucks)
+    table.set_filter(">1")
+    assert table.view == []
+    trucks[1].current_load = 5.0
+    table.reposition([trucks[1]])
+    assert table.view == [trucks[1]]
+
+
+@pytest.mark.parametrize("text, expected", [("", True), ("ann", True), ("vip", False),
+                                            (">4", True), ("<4", False), ("bob", False)])
+def test_client_filter(text, expected):
+    assert client_matches(Client("Anna", 5.0), text) is expected
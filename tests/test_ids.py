@@ -0,0 +1,62 @@
+import uuid
+import pytest
+from transport.client import Client
+from transport.ids import IdGenerator, get_id_generator, set_id_generator
+from transport.train import Train
+from transport.truck import Truck
+from transport.vehicle import Vehicle
+
+
+@pytest.fixture
+def sequential_ids():
+    previous = set_id_generator(IdGenerator(sequential=True))
+    yield
+    set_id_generator(previous)
+
+
+# У сущностей нет __dict__: лишние атрибуты не заводятся
+@pytest.mark.parametrize("obj", [Client("a", 1.0), Vehicle(5.0), Truck(5.0, "red"), Train(5.0, 2)])
+def test_entities_use_slots(obj):
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.unknown = 1
+
+
+def test_sequential_ids(sequential_ids):
+    first, second = Truck(5.0, "red"), Train(5.0, 2)
+    assert second.uid == first.uid + 1
+    assert second.vehicle_id == str(int(first.vehicle_id) + 1)
+
+
+def test_seeded_ids_repeat():
+    a, b = IdGenerator(seed=7), IdGenerator(seed=7)
+    numbers = [a.next() for _ in range(3)]
+    assert numbers == [b.next() for _ in range(3)]
+    text = a.format(numbers[0])
+    assert uuid.UUID(text).version == 4
+
+
+# Строка ID создается при первом обращении и дальше не меняется
+def test_vehicle_id_is_formatted_lazily():
+    truck = Truck(5.0, "red")
+    assert truck._vehicle_id is None
+    assert truck.vehicle_id == get_id_generator().format(truck.uid)
+    assert truck.vehicle_id is truck.vehicle_id
+    truck.vehicle_id = "T-1"
+    assert truck.vehicle_id == "T-1"
+    with pytest.raises(TypeError):
+        truck.vehicle_id = 1
+
+
+# Пустой транспорт не заводит свой словарь клиентов до первой загрузки
+def test_empty_vehicles_share_client_storage():
+    a, b = Truck(5.0, "red"), Truck(5.0, "blue")
+    assert a._clients is b._clients
+    a.load_cargo(Client("x", 1.0))
+    assert a._clients is not b._clients
+    assert b.client_count == 0
+
+
+def test_set_id_generator_checks_type():
+    with pytest.raises(TypeError):
+        set_id_generator(object())
@@ -0,0 +1,61 @@
+import asyncio
+import json
+from transport.company import TransportCompany
+from transport.intake import OrderIntake
+from transport.truck import Truck
+
+
+def company():
+    company = TransportCompany("intake")
+    company.add_vehicle(Truck(10.0, "red"))
+    return company
+
+
+async def exchange(intake, payload: bytes):
+    server = await intake.serve()
+    host, port = server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(payload)
+    await writer.drain()
+    writer.write_eof()
+    lines = []
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            lines.append(json.loads(line))
+    except ConnectionError:
+        pass
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    await intake.stop()
+    return lines
+
+
+def test_replies_and_failed_requests():
+    intake = OrderIntake(company(), window=0.0)
+    payload = (b'{"name": "a", "cargo_weight": 4}\n'
+               b'{"name": "b", "cargo_weight": "nan"}\n'
+               b'[1, 2]\n'
+               b'{"name": "c", "cargo_weight": 20}\n')
+    lines = asyncio.run(exchange(intake, payload))
+    assert [line.get("status", "error" if "error" in line else None) for line in lines] == \
+        ["placed", "error", "error", "unplaced"]
+    assert intake.failed == 2
+    assert intake.orders == 2
+
+
+# Строка длиннее предела чтения: соединение закрывается, сервис продолжает работу
+def test_oversized_line_fails_only_its_connection():
+    async def run():
+        intake = OrderIntake(company(), window=0.0)
+        first = await exchange(intake, b'{"name": "' + b"x" * 100_000 + b'", "cargo_weight": 1}\n')
+        failed = intake.failed
+        second = await exchange(intake, b'{"name": "a", "cargo_weight": 1}\n')
+        return first, failed, second
+
+    first, failed, second = asyncio.run(run())
+    assert first == [] and failed == 1
+    assert second[0]["status"] == "placed"
@@ -0,0 +1,106 @@
+import pytest
+from transport.client import Client
+from transport.journal import Journal, open_company
+from transport.train import Train
+from transport.truck import Truck
+
+
+# Состояние компании для сравнения: транспорт и клиенты в порядке списков
+def state(company):
+    return ([(v.vehicle_id, v.capacity, [c.client_id for c in v.clients_list])
+             for v in company.vehicles],
+            [(c.client_id, c.name, c.cargo_weight) for c in company.clients])
+
+
+def populate(company):
+    company.add_vehicles([Truck(10.0, "red"), Train(30.0, 3, car_capacity=10.0), Truck(5.0, "blue")])
+    company.add_clients([Client(f"c{i}", 1.0 + i % 4, i % 5 == 0) for i in range(12)])
+    company.optimize_cargo_distribution()
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "company.snap"), str(tmp_path / "company.journal")
+
+
+def test_reopen_replays_journal(paths):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+    company.remove_client(company.clients[3])
+    journal.close()
+    reopened, journal = open_company(*paths)
+    assert state(reopened) == state(company)
+    journal.close()
+
+
+def test_checkpoint_then_reopen(paths):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+    journal.checkpoint(paths[0])
+    company.add_client(Client("late", 1.0))
+    company.optimize_cargo_distribution()
+    journal.close()
+    reopened, journal = open_company(*paths)
+    assert state(reopened) == state(company)
+    journal.close()
+
+
+# Сбой после записи снимка, но до очистки журнала:
+# старый журнал не воспроизводится поверх нового снимка
+def test_crash_during_checkpoint(paths, monkeypatch):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+
+    def crash():
+        raise OSError("crash")
+
+    monkeypatch.setattr(journal, "_reset_file", crash)
+    with pytest.raises(OSError):
+        journal.checkpoint(paths[0])
+    journal.close()
+    monkeypatch.undo()
+    reopened, journal = open_company(*paths)
+    assert state(reopened) == state(company)
+    # Журнал снова пишется и воспроизводится в новом поколении
+    reopened.add_client(Client("after", 2.0))
+    journal.close()
+    again, journal = open_company(*paths)
+    assert state(again) == state(reopened)
+    journal.close()
+
+
+# Замена клиента и транспорта сохраняет их место в списках
+def test_replace_keeps_position(paths):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+    old_client = company.clients[2]
+    company.replace_client(old_client, Client("renamed", 2.5, client_id=old_client.client_id))
+    company.replace_vehicle(company.vehicles[0], Truck(12.0, "green"))
+    journal.close()
+    reopened, journal = open_company(*paths)
+    assert state(reopened) == state(company)
+    assert reopened.clients[2].name == "renamed"
+    assert reopened.vehicles[0].capacity == 12.0
+    journal.close()
+
+
+def test_torn_last_record_is_dropped(paths):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+    journal.close()
+    with open(paths[1], "ab") as f:
+        f.write(b"\x01\xff\x00")
+    reopened, journal = open_company(*paths)
+    assert state(reopened) == state(company)
+    journal.close()
+
+
+def test_journal_newer_than_snapshot_is_an_error(paths):
+    company, journal = open_company(*paths, name="test")
+    populate(company)
+    journal.checkpoint(paths[0])
+    company.add_client(Client("x", 1.0))
+    journal.close()
+    stale = Journal(company, paths[1], generation=0)
+    with pytest.raises(ValueError):
+        stale.replay()
@@ -0,0 +1,44 @@
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.loader import client_from_row, iter_clients
+
+
+def write(tmp_path, text, name="clients.csv"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+# Строка с занятым client_id — ошибка строки, загрузка продолжается
+def test_duplicate_client_id_is_a_row_error(tmp_path):
+    path = write(tmp_path, "name,cargo_weight,is_vip,client_id\n"
+                           "a,1,0,x1\n"
+                           "b,2,0,x2\n"
+                           "c,3,0,x1\n"
+                           "d,4,0,old\n"
+                           "e,5,0,x3\n")
+    company = TransportCompany("test")
+    company.add_client(Client("old", 1.0, client_id="old"))
+    errors = []
+    count = company.add_clients(iter_clients(path, errors.extend, known_ids=company.client_ids()))
+    assert count == 3
+    assert [e.line for e in errors] == [4, 5]
+    assert all("уже есть" in e.message for e in errors)
+    assert [c.name for c in company.clients] == ["old", "a", "b", "e"]
+
+
+# Накопленные ошибки передаются, даже если чтение прервано
+def test_errors_flushed_when_consumer_stops(tmp_path):
+    path = write(tmp_path, "name,cargo_weight,is_vip\nbad,x,0\na,1,0\nb,2,0\n")
+    errors = []
+    clients = iter_clients(path, errors.extend)
+    next(clients)
+    clients.close()
+    assert [e.line for e in errors] == [2]
+
+
+@pytest.mark.parametrize("weight", ["nan", "inf", "-inf", float("nan"), float("inf")])
+def test_non_finite_weight_is_rejected(weight):
+    with pytest.raises(ValueError):
+        client_from_row({"name": "a", "cargo_weight": weight, "is_vip": "0"})
@@ -0,0 +1,35 @@
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.metrics import Metrics
+from transport.packing import get_strategy
+from transport.train import Train
+from transport.truck import Truck
+
+
+def company():
+    company = TransportCompany("metrics")
+    company.add_vehicles([Truck(10.0, "red"), Truck(6.0, "blue"), Train(30.0, 3)])
+    company.add_clients([Client(f"c{i}", 1.0 + i % 5, i % 4 == 0) for i in range(20)])
+    return company
+
+
+# Счетчики поиска идут из стратегии, а не из событий загрузки
+@pytest.mark.parametrize("strategy", ["ff", "ffd", "bfd", "cars", "vbfd", "exact"])
+def test_search_effort_is_counted_by_strategies(strategy):
+    c = company()
+    metrics = Metrics(c)
+    unplaced = c.optimize_cargo_distribution(strategy)
+    counters = metrics.snapshot()["counters"]
+    placed = len(c.clients) - len(unplaced)
+    assert counters["placements"] == placed == counters["loads"]
+    assert counters["index_lookups"] >= len(c.clients)
+    assert counters["fit_checks"] >= placed
+
+
+def test_strategy_stats_are_restored_after_distribution():
+    c = company()
+    Metrics(c)
+    engine = get_strategy("ffd")
+    c.optimize_cargo_distribution(engine)
+    assert engine.stats is None
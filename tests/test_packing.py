@@ -0,0 +1,159 @@
+import random
+import pytest
+from transport.car_packing import CarBestFit
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.multi_resource import VectorBestFit, packing_inputs
+from transport.packing import BestFitDecreasing, get_strategy, strategy_names
+from transport.sharding import distribute_sharded
+from transport.train import Train
+from transport.truck import Truck
+
+
+def per_car_fleet():
+    return [Truck(10.0, "red"), Train(60.0, 3, car_capacity=20.0)]
+
+
+# Стратегия без учета вагонов не подменяется другой
+@pytest.mark.parametrize("strategy", ["ff", "ffd", "exact"])
+def test_weight_only_strategy_rejects_per_car_trains(strategy):
+    clients = [Client("a", 5.0)]
+    with pytest.raises(ValueError, match="вагоны"):
+        packing_inputs(strategy, clients, per_car_fleet())
+
+
+def test_bfd_uses_its_car_aware_variant():
+    engine = packing_inputs("bfd", [Client("a", 5.0)], per_car_fleet())[0]
+    assert isinstance(engine, CarBestFit)
+
+
+def test_plain_fleet_keeps_requested_strategy():
+    engine = packing_inputs("bfd", [Client("a", 5.0)], [Truck(10.0, "red")])[0]
+    assert type(engine) is BestFitDecreasing
+
+
+def test_per_car_train_distribution_respects_cars():
+    company = TransportCompany("cars")
+    train = Train(60.0, 3, car_capacity=20.0)
+    company.add_vehicle(train)
+    company.add_clients([Client(f"c{i}", 12.0) for i in range(4)] + [Client("big", 21.0)])
+    unplaced = company.optimize_cargo_distribution("cars")
+    assert len(unplaced) == 2 and "big" in {c.name for c in unplaced}
+    assert all(load <= limit for load, limit in zip(train.car_loads, train.car_capacities))
+
+
+def volume_clients():
+    return [Client("a", 5.0, volume=2.0), Client("b", 1.0)]
+
+
+# Клиенты с объемом: стратегия только по весу не подменяется
+@pytest.mark.parametrize("strategy", ["ff", "ffd", "exact", "cars"])
+def test_weight_only_strategy_rejects_volume(strategy):
+    with pytest.raises(ValueError, match="объем"):
+        packing_inputs(strategy, volume_clients(), [Truck(10.0, "red", volume=5.0)])
+
+
+def test_bfd_uses_multi_resource_variant():
+    engine = packing_inputs("bfd", volume_clients(), [Truck(10.0, "red", volume=5.0)])[0]
+    assert isinstance(engine, VectorBestFit)
+    assert packing_inputs("vbfd", volume_clients(), [Truck(10.0, "red")])[0].multi_resource
+
+
+def volume_company():
+    company = TransportCompany("volume")
+    company.add_vehicles([Truck(10.0, "red", volume=4.0) for _ in range(4)])
+    company.add_clients([Client(f"c{i}", 2.0, volume=1.5) for i in range(12)])
+    return company
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sharded_multi_resource(workers):
+    company = volume_company()
+    unplaced = distribute_sharded(company, "vbfd", workers=workers, shards=2)
+    # В каждый грузовик помещаются два груза по объему
+    assert len(unplaced) == 4
+    for vehicle in company.vehicles:
+        assert vehicle.current_volume <= vehicle.volume_capacity
+
+
+def test_sharded_rejects_strategy_before_loading():
+    company = volume_company()
+    with pytest.raises(ValueError):
+        distribute_sharded(company, "ffd", workers=1, shards=2)
+    assert all(v.client_count == 0 for v in company.vehicles)
+
+
+# Наивные варианты стратегий для сравнения: полный перебор транспорта
+def naive_first_fit(order, weights, capacities, loads):
+    loads = list(loads)
+    assignment = [-1] * len(weights)
+    for i in order:
+        for v in range(len(capacities)):
+            if loads[v] + weights[i] <= capacities[v]:
+                loads[v] += weights[i]
+                assignment[i] = v
+                break
+    return assignment
+
+
+def naive_best_fit(order, weights, capacities, loads):
+    loads = list(loads)
+    used = [l > 0 for l in loads]
+    assignment = [-1] * len(weights)
+    for i in order:
+        w = weights[i]
+        fits = [(capacities[v] - loads[v], v) for v in range(len(capacities))
+                if used[v] and loads[v] + w <= capacities[v]]
+        if fits:
+            v = min(fits)[1]
+        else:
+            spare = sorted((v for v in range(len(capacities)) if not used[v]),
+                           key=lambda v: -capacities[v])
+            if not spare or w > capacities[spare[0]]:
+                continue
+            v = spare[0]
+            used[v] = True
+        loads[v] += w
+        assignment[i] = v
+    return assignment
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("name, naive", [("ff", naive_first_fit), ("ffd", naive_first_fit),
+                                         ("bfd", naive_best_fit)])
+def test_indexed_strategy_matches_naive(seed, name, naive):
+    rnd = random.Random(seed)
+    weights = [float(rnd.randint(1, 30)) for _ in range(300)]
+    vip = [rnd.random() < 0.1 for _ in weights]
+    capacities = [float(rnd.randint(10, 60)) for _ in range(40)]
+    loads = [float(rnd.choice([0, 0, rnd.randint(1, 9)])) for _ in capacities]
+    engine = get_strategy(name)
+    order = engine.order(weights, vip)
+    assert engine.assign(order, weights, vip, capacities, loads) == naive(order, weights, capacities, loads)
+
+
+# Сначала VIP, внутри группы — по убыванию веса (у «ff» — порядок добавления)
+def test_order_puts_vip_first():
+    weights, vip = [1.0, 5.0, 3.0, 2.0], [False, False, True, False]
+    assert get_strategy("ffd").order(weights, vip) == [2, 1, 3, 0]
+    assert get_strategy("bfd").order(weights, vip) == [2, 1, 3, 0]
+    assert get_strategy("ff").order(weights, vip) == [2, 0, 1, 3]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        get_strategy("nope")
+    assert {"ff", "ffd", "bfd", "vbfd", "cars", "exact"} <= set(strategy_names())
+
+
+# Компания загружает грузы по плану стратегии: без перегрузки, VIP размещены
+@pytest.mark.parametrize("strategy", ["ff", "ffd", "bfd"])
+def test_company_distribution_uses_strategy(strategy):
+    company = TransportCompany("test")
+    company.add_vehicles([Truck(10.0, "red"), Truck(15.0, "blue"), Train(30.0, 2)])
+    company.add_clients([Client(f"c{i}", float(i % 7 + 1), i % 5 == 0) for i in range(20)])
+    unplaced = company.optimize_cargo_distribution(strategy)
+    assert all(not c.is_vip for c in unplaced)
+    for vehicle in company.vehicles:
+        assert vehicle.current_load <= vehicle.capacity
+    assert len(unplaced) + sum(v.client_count for v in company.vehicles) == 20
@@ -0,0 +1,48 @@
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.train import Train
+from transport.truck import Truck
+
+
+# Строка берется из кэша, пока поля транспорта не менялись
+def test_str_is_cached_until_fields_change():
+    truck = Truck(10.0, "red", volume=5.0)
+    truck.vehicle_id = "T1"
+    first = str(truck)
+    assert first.startswith("Грузовик red, ID: T1") and "объем: 0.0/5.0" in first
+    assert str(truck) is first
+    truck.load_cargo(Client("a", 4.0, volume=1.0))
+    loaded = str(truck)
+    assert "текущая загрузка: 4.0 т" in loaded and "объем: 1.0/5.0" in loaded
+    # Прямое присваивание поля тоже учитывается
+    truck.color = "blue"
+    assert str(truck).startswith("Грузовик blue")
+    truck.vehicle_id = "T2"
+    assert "ID: T2" in str(truck)
+
+
+def test_train_text_follows_car_count():
+    train = Train(100.0, 4)
+    assert str(train).startswith("Поезд с 4 вагонами")
+    train.number_of_cars = 5
+    assert str(train).startswith("Поезд с 5 вагонами")
+
+
+def make_company(n):
+    company = TransportCompany("test")
+    company.add_vehicles([Truck(float(i + 1), "red") for i in range(n)])
+    return company
+
+
+def test_list_vehicles_pages():
+    company = make_company(7)
+    everything = company.list_vehicles()
+    assert len(everything) == 7
+    assert company.vehicle_pages(3) == 3
+    assert company.list_vehicles(page=0, page_size=3) == everything[:3]
+    assert company.list_vehicles(page=2, page_size=3) == everything[6:]
+    assert company.list_vehicles(page=5, page_size=3) == []
+    assert list(company.iter_vehicle_lines(5)) == everything[5:]
+    with pytest.raises(ValueError):
+        company.list_vehicles(page=-1)
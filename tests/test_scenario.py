@@ -0,0 +1,47 @@
+import pytest
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.truck import Truck
+
+
+def company():
+    company = TransportCompany("base")
+    company.add_vehicles([Truck(10.0, "red"), Truck(8.0, "blue")])
+    company.add_clients([Client(f"c{i}", 2.0 + i, client_id=f"c{i}") for i in range(5)])
+    company.optimize_cargo_distribution()
+    return company
+
+
+def state(company):
+    return ([(v.vehicle_id, v.current_load, [c.client_id for c in v.clients_list]) for v in company.vehicles],
+            [c.client_id for c in company.clients])
+
+
+# Конфликт ID обнаруживается до изменений: компания остается прежней
+def test_commit_with_id_clash_changes_nothing():
+    base = company()
+    scenario = base.fork("what-if")
+    scenario.remove_vehicle(base.vehicles[0])
+    scenario.add_vehicle(Truck(20.0, "green"))
+    scenario.add_client(Client("late", 1.0, client_id="x"))
+    scenario.optimize_cargo_distribution()
+    base.add_client(Client("clash", 1.0, client_id="x"))
+    before = state(base)
+    with pytest.raises(ValueError):
+        scenario.commit()
+    assert state(base) == before
+
+
+def test_commit_applies_scenario():
+    base = company()
+    scenario = base.fork("what-if")
+    removed = base.vehicles[0]
+    scenario.remove_vehicle(removed)
+    scenario.add_vehicle(Truck(20.0, "green"))
+    expected = scenario.optimize_cargo_distribution()
+    assert scenario.commit() == []
+    assert not base.has_vehicle(removed)
+    assert sorted(c.client_id for c in base.unplaced_clients()) == sorted(c.client_id for c in expected)
+    for vehicle in base.vehicles:
+        assert vehicle.current_load == pytest.approx(sum(c.cargo_weight for c in vehicle.clients_list))
+        assert all(base.vehicle_of(c) is vehicle for c in vehicle.clients_list)
@@ -0,0 +1,45 @@
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.events import EventSink
+from transport.sharding import distribute_sharded
+from transport.train import Train
+from transport.truck import Truck
+
+
+class UnplacedSink(EventSink):
+    def __init__(self):
+        self.unplaced = []
+
+    def client_unplaced(self, client):
+        self.unplaced.append(client.name)
+
+
+# Шард «rail» — поезд, «road» — грузовик; клиенты — по первой букве имени
+def depot(obj):
+    if isinstance(obj, Train):
+        return "rail"
+    if isinstance(obj, Truck):
+        return "road"
+    return "rail" if obj.name[0] == "r" else "road"
+
+
+# Многоресурсная стратегия не различает вагоны: груз тяжелее вагона
+# назначается поезду, не проходит проверку при загрузке и уходит в слияние
+def company_with_overflow():
+    company = TransportCompany("shards")
+    company.add_vehicles([Train(60.0, 3, car_capacity=20.0), Truck(30.0, "blue", volume=10.0)])
+    company.add_clients([Client("r1", 10.0, volume=1.0), Client("r2", 25.0, volume=1.0),
+                         Client("b1", 1.0, volume=1.0), Client("r3", 45.0, volume=1.0)])
+    return company
+
+
+# Остаток шарда, размещенный проходом слияния, не считается неразмещенным
+def test_shard_leftovers_placed_by_merge_are_not_reported():
+    company = company_with_overflow()
+    sink = UnplacedSink()
+    company.subscribe(sink)
+    unplaced = distribute_sharded(company, key=depot, workers=1)
+    assert [c.name for c in unplaced] == ["r3"]
+    assert sink.unplaced == ["r3"]
+    assert isinstance(company.vehicle_of(company.clients[0]), Train)
+    assert isinstance(company.vehicle_of(company.clients[1]), Truck)
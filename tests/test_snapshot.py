@@ -0,0 +1,60 @@
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.snapshot import load_snapshot, save_snapshot, snapshot_generation
+from transport.train import Train
+from transport.truck import Truck
+
+
+def company():
+    company = TransportCompany("Снимок")
+    company.add_vehicles([Truck(10.0, "red", volume=6.0), Train(30.0, 3, car_capacity=10.0),
+                          Truck(4.0, "blue", pallets=2)])
+    company.add_clients([Client(f"клиент {i}", 1.0 + i % 4, i % 3 == 0,
+                                volume=0.5 * (i % 2), pallets=i % 2) for i in range(14)])
+    company.optimize_cargo_distribution()
+    return company
+
+
+def state(company):
+    vehicles = [(type(v).__name__, v.vehicle_id, v.uid, v.capacity, v.current_load, v.current_volume,
+                 v.current_pallets, v.volume_capacity, v.pallet_capacity,
+                 [c.client_id for c in v.clients_list]) for v in company.vehicles]
+    clients = [(c.client_id, c.name, c.cargo_weight, c.is_vip, c.volume, c.pallets)
+               for c in company.clients]
+    cars = [(list(v.car_capacities), list(v.car_loads)) for v in company.vehicles if isinstance(v, Train)]
+    return company.name, vehicles, clients, cars
+
+
+def test_round_trip(tmp_path):
+    original = company()
+    path = str(tmp_path / "company.snap")
+    save_snapshot(original, path, generation=3)
+    restored = load_snapshot(path)
+    assert state(restored) == state(original)
+    assert snapshot_generation(path) == 3
+    assert all(restored.vehicle_of(c) is v for v in restored.vehicles for c in v.clients_list)
+
+
+# После загрузки снимка распределение продолжается без повторной загрузки
+def test_restored_company_keeps_distributing(tmp_path):
+    original = company()
+    path = str(tmp_path / "company.snap")
+    save_snapshot(original, path)
+    restored = load_snapshot(path)
+    loads = [v.current_load for v in restored.vehicles]
+    restored.optimize_cargo_distribution()
+    for vehicle, before in zip(restored.vehicles, loads):
+        assert vehicle.current_load >= before
+        assert vehicle.current_load <= vehicle.capacity + 1e-9
+
+
+# Порядок загрузки транспорта не совпадает с порядком клиентов и сохраняется
+def test_keeps_load_order(tmp_path):
+    original = TransportCompany("order")
+    original.add_vehicle(Truck(10.0, "red"))
+    original.add_clients([Client("a", 2.0), Client("b", 5.0), Client("c", 1.0)])
+    original.optimize_cargo_distribution("bfd")
+    assert [c.name for c in original.vehicles[0].clients_list] == ["b", "a", "c"]
+    path = str(tmp_path / "company.snap")
+    save_snapshot(original, path)
+    assert [c.name for c in load_snapshot(path).vehicles[0].clients_list] == ["b", "a", "c"]
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.startup import FORBIDDEN, ROOT
+
+
+# Модули из FORBIDDEN, загруженные кодом в новом процессе
+def loaded_after(code: str):
+    probe = code + "\nimport sys\nprint(' '.join(m for m in %r if m in sys.modules))" % (FORBIDDEN,)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                            cwd=ROOT, env=env, check=True)
+    return result.stdout.split()
+
+
+# Импорт пакета и компании не загружает потоки, asyncio и профилировщики
+def test_import_transport_is_lazy():
+    assert loaded_after("import transport") == []
+    assert loaded_after("from transport import TransportCompany, Client, Truck") == []
+
+
+# Имена пакета по-прежнему доступны (загружаются при обращении)
+def test_lazy_names_resolve():
+    assert loaded_after("import transport\nassert transport.FleetStore.__name__ == 'FleetStore'") == []
+
+
+# main_gui без окна: ни GUI, ни экспорта, ни фонового потока, ни logging
+def test_import_main_gui_is_lazy():
+    assert loaded_after("import main_gui\nassert main_gui.company is None") == []
+    assert loaded_after("import main_gui, sys\nassert 'transport.export' not in sys.modules") == []
@@ -0,0 +1,84 @@
+import pytest
+from transport.client import Client
+from transport.train import Train
+from transport.truck import Truck
+
+
+# Повторная загрузка того же клиента не меняет загрузку
+def test_load_same_client_twice_is_rejected():
+    truck = Truck(10.0, "red")
+    heavy, light = Client("a", 3.0), Client("b", 2.0)
+    assert truck.load_cargo(heavy)
+    assert not truck.load_cargo(heavy)
+    assert truck.current_load == 3.0
+    assert truck.client_count == 1
+    assert truck.load_cargo(light)
+    assert truck.unload_cargo(heavy)
+    assert truck.current_load == 2.0
+    assert truck.clients_list == (light,)
+
+
+def test_load_same_client_twice_into_per_car_train():
+    train = Train(100.0, 3, car_capacity=30.0)
+    client = Client("a", 10.0)
+    assert train.load_cargo(client)
+    assert not train.load_cargo(client)
+    assert train.current_load == 10.0
+    assert sum(train.car_loads) == 10.0
+
+
+def test_unload_keeps_load_order():
+    truck = Truck(100.0, "red")
+    clients = [Client(f"c{i}", 1.0) for i in range(5)]
+    for client in clients:
+        truck.load_cargo(client)
+    truck.unload_cargo(clients[1])
+    truck.unload_cargo(clients[3])
+    assert truck.clients_list == (clients[0], clients[2], clients[4])
+    assert truck.current_load == 3.0
+    assert not truck.unload_cargo(clients[1])
+
+
+def test_unload_last_client_resets_load():
+    truck = Truck(1.0, "red")
+    clients = [Client(f"c{i}", 0.1) for i in range(10)]
+    for client in clients:
+        truck.load_cargo(client)
+    for client in clients:
+        truck.unload_cargo(client)
+    assert truck.current_load == 0.0
+    assert truck.clients_list == ()
+
+
+# fits(without=...) совпадает с фактической загрузкой после выгрузки
+@pytest.mark.parametrize("weight", [5.0, 25.0, 29.0, 30.0, 31.0])
+def test_fits_without_matches_unload_then_load(weight):
+    train = Train(100.0, 4, car_capacity=30.0)
+    first, second = Client("a", 25.0), Client("b", 20.0)
+    train.load_cargo(first)
+    train.load_cargo(second)
+    candidate = Client("x", weight)
+    predicted = train.fits(candidate, without=first)
+    train.unload_cargo(first)
+    assert train.fits(candidate) == predicted
+    assert train.load_cargo(candidate) == predicted
+
+
+def test_load_cargo_rejects_non_client():
+    with pytest.raises(TypeError):
+        Truck(10.0, "red").load_cargo("not a client")
+
+
+# clients_list — один и тот же кортеж, пока загрузка не изменилась
+def test_clients_list_is_cached_until_load_changes():
+    truck = Truck(10.0, "red")
+    a, b = Client("a", 1.0), Client("b", 2.0)
+    truck.load_cargo(a)
+    first = truck.clients_list
+    assert truck.clients_list is first
+    truck.load_cargo(b)
+    assert truck.clients_list == (a, b)
+    truck.unload_cargo(a)
+    assert truck.clients_list == (b,)
+    truck.unload_all()
+    assert truck.clients_list == ()
@@ -1,5 +1,97 @@
-from .client import Client
-from .vehicle import Vehicle
-from .truck import Truck
-from .train import Train
-from .company import TransportCompany
\ No newline at end of file
+# Пакет transport: имена пакета загружаются лениво (PEP 562).
+# Модуль импортируется при первом обращении к его имени, поэтому
+# «import transport» не тянет asyncio, потоки, профилировщики и т.п.,
+# пока они не нужны.
+import importlib
+from typing import TYPE_CHECKING
+
+# Имя -> модуль пакета, где оно определено
+_EXPORTS = {
+    "Client": ".client",
+    "Vehicle": ".vehicle",
+    "Truck": ".truck",
+    "Train": ".train",
+    "TransportCompany": ".company",
+    "PackingStrategy": ".packing",
+    "FirstFit": ".packing",
+    "FirstFitDecreasing": ".packing",
+    "BestFitDecreasing": ".packing",
+    "get_strategy": ".packing",
+    "EventSink": ".events",
+    "BufferedSink": ".events",
+    "CountingSink": ".events",
+    "PrintSink": ".events",
+    "FanoutSink": ".events",
+    "FleetStore": ".columnar",
+    "ClientView": ".columnar",
+    "VehicleView": ".columnar",
+    "iter_clients": ".loader",
+    "iter_vehicles": ".loader",
+    "RowError": ".loader",
+    "IdGenerator": ".ids",
+    "set_id_generator": ".ids",
+    "ExactSolver": ".exact_solver",
+    "distribute_sharded": ".sharding",
+    "save_snapshot": ".snapshot",
+    "load_snapshot": ".snapshot",
+    "SnapshotView": ".snapshot",
+    "Journal": ".journal",
+    "open_company": ".journal",
+    "DistributionWorker": ".background",
+    "Exporter": ".export",
+    "export_distribution": ".export",
+    "read_binary_export": ".export",
+    "CarBestFit": ".car_packing",
+    "OrderIntake": ".intake",
+    "run_service": ".intake",
+    "Metrics": ".metrics",
+    "profile_distribution": ".metrics",
+    "Scenario": ".scenario",
+    "compare_scenarios": ".scenario",
+    "plan_trips": ".dispatch",
+    "DispatchPlan": ".dispatch",
+    "Trip": ".dispatch",
+    "consolidate": ".consolidation",
+    "ConsolidationResult": ".consolidation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value   # следующие обращения — без __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+# Для проверки типов и подсказок IDE — обычные импорты
+if TYPE_CHECKING:
+    from .client import Client
+    from .vehicle import Vehicle
+    from .truck import Truck
+    from .train import Train
+    from .company import TransportCompany
+    from .packing import PackingStrategy, FirstFit, FirstFitDecreasing, BestFitDecreasing, get_strategy
+    from .events import EventSink, BufferedSink, CountingSink, PrintSink, FanoutSink
+    from .columnar import FleetStore, ClientView, VehicleView
+    from .loader import iter_clients, iter_vehicles, RowError
+    from .ids import IdGenerator, set_id_generator
+    from .exact_solver import ExactSolver
+    from .sharding import distribute_sharded
+    from .snapshot import save_snapshot, load_snapshot, SnapshotView
+    from .journal import Journal, open_company
+    from .background import DistributionWorker
+    from .export import Exporter, export_distribution, read_binary_export
+    from .car_packing import CarBestFit
+    from .intake import OrderIntake, run_service
+    from .metrics import Metrics, profile_distribution
+    from .scenario import Scenario, compare_scenarios
+    from .dispatch import plan_trips, DispatchPlan, Trip
+    from .consolidation import consolidate, ConsolidationResult
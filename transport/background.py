@@ -0,0 +1,122 @@
+import threading
+from typing import List, Optional, Union
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.packing import PackingCancelled, PackingStrategy, get_strategy
+from transport.multi_resource import packing_inputs
+
+# Распределение грузов в фоновом потоке.
+# Поток работает только с копиями чисел (веса, вместимость, загрузка)
+# и не трогает объекты компании. Результат загружается в компанию
+# одним пакетом методом apply() в потоке владельца (например, GUI),
+# поэтому отмена в любой момент оставляет парк в прежнем состоянии.
+
+IDLE = "idle"
+RUNNING = "running"
+FINISHED = "finished"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+
+class DistributionWorker:
+    def __init__(self, company: TransportCompany, strategy: Union[str, PackingStrategy] = "bfd",
+                 progress_step: int = 1000):
+        self.company = company
+        self.engine = get_strategy(strategy)
+        self.engine.progress_step = progress_step
+        self.state = IDLE
+        self.error: Optional[BaseException] = None
+        # Ход работы (обновляется фоновым потоком)
+        self.total = 0
+        self.done = 0
+        self.placed = 0
+        self.vehicles_used = 0
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._clients: List[Client] = []
+        self._vehicles = []
+        self._order: List[int] = []
+        self._assignment: Optional[List[int]] = None
+
+    # Запуск: данные копируются сразу, в вызывающем потоке
+    def start(self):
+        if self.state == RUNNING:
+            raise RuntimeError("Распределение уже выполняется")
+        company = self.company
+        self._clients = company.unplaced_clients()
+        self._vehicles = list(company.vehicles)
+        # При объеме/паллетах стратегия может смениться на многоресурсную
+        engine, weights, vip, capacities, loads = packing_inputs(
+            self.engine, self._clients, self._vehicles)
+        engine.progress_step = self.engine.progress_step
+        self.total = len(self._clients)
+        self.done = self.placed = 0
+        self.vehicles_used = sum(1 for v in self._vehicles if v.client_count)
+        self._cancel.clear()
+        self._assignment = None
+        self.error = None
+        self.state = RUNNING
+        self._thread = threading.Thread(
+            target=self._run, args=(engine, weights, vip, capacities, loads),
+            name="distribution-worker", daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, engine, weights, vip, capacities, loads):
+        engine.progress = self._progress
+        engine.should_stop = self._cancel.is_set
+        try:
+            self._order = engine.order(weights, vip)
+            self._assignment = engine.assign(self._order, weights, vip, capacities, loads)
+            self.state = FINISHED
+        except PackingCancelled:
+            self.state = CANCELLED
+        except Exception as e:
+            self.error = e
+            self.state = FAILED
+        finally:
+            engine.progress = None
+            engine.should_stop = None
+
+    def _progress(self, done: int, total: int, placed: int, used: int):
+        self.done = done
+        self.placed = placed
+        self.vehicles_used = used
+
+    # Запрос отмены (поток остановится на ближайшей проверке)
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return self.state == RUNNING
+
+    # Доля выполненной работы 0..1
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    # Загрузка результата в компанию одним пакетом (в потоке владельца).
+    # Клиенты и транспорт, удаленные или размещенные за время работы,
+    # пропускаются. Возвращает список неразмещенных клиентов
+    def apply(self) -> List[Client]:
+        if self.state != FINISHED or self._assignment is None:
+            raise RuntimeError("Нет готового результата распределения")
+        company = self.company
+        assignment = list(self._assignment)
+        keep = []
+        for i in self._order:
+            client = self._clients[i]
+            if not company.has_client(client) or company.vehicle_of(client) is not None:
+                continue
+            v = assignment[i]
+            if v >= 0 and not company.has_vehicle(self._vehicles[v]):
+                assignment[i] = -1
+            keep.append(i)
+        self._assignment = None
+        self.state = IDLE
+        return company.apply_assignment(self._clients, self._vehicles, assignment, keep)
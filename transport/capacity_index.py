@@ -0,0 +1,304 @@
+from bisect import bisect_left, insort
+from typing import List, Sequence, Tuple
+
+# Индексы остаточной грузоподъемности транспорта.
+# Позиция в индексе совпадает с позицией транспорта в списке компании.
+
+
+# Дерево отрезков по максимуму остатка: первый подходящий транспорт за O(log m)
+class FirstFitIndex:
+    def __init__(self, free: Sequence[float]):
+        self.size = len(free)
+        n = 1
+        while n < self.size:
+            n *= 2
+        self._n = n
+        self._tree: List[float] = [float("-inf")] * (2 * n)
+        self._tree[n:n + self.size] = free
+        for i in range(n - 1, 0, -1):
+            left, right = self._tree[2 * i], self._tree[2 * i + 1]
+            self._tree[i] = left if left >= right else right
+
+    # Остаток транспорта на позиции pos
+    def get(self, pos: int) -> float:
+        return self._tree[self._n + pos]
+
+    # Изменение остатка транспорта на позиции pos
+    def update(self, pos: int, free: float):
+        tree = self._tree
+        i = self._n + pos
+        tree[i] = free
+        i //= 2
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if left >= right else right
+            i //= 2
+
+    # Наибольший остаток
+    def max(self) -> float:
+        return self._tree[1]
+
+    # Самая левая позиция с наибольшим остатком (-1 — индекс пуст)
+    def argmax(self) -> int:
+        return self.find(self._tree[1]) if self.size else -1
+
+    # Самая левая позиция >= start с остатком не меньше need, иначе -1
+    def find(self, need: float, start: int = 0) -> int:
+        tree = self._tree
+        if start == 0:
+            # Быстрый путь: спуск от корня без рекурсии
+            if tree[1] < need:
+                return -1
+            i = 1
+            while i < self._n:
+                i *= 2
+                if tree[i] < need:
+                    i += 1
+            return i - self._n
+        if start >= self.size:
+            return -1
+        return self._find(1, 0, self._n, start, need)
+
+    def _find(self, node: int, lo: int, hi: int, start: int, need: float) -> int:
+        if hi <= start or self._tree[node] < need:
+            return -1
+        if node >= self._n:
+            return node - self._n
+        mid = (lo + hi) // 2
+        found = self._find(2 * node, lo, mid, start, need)
+        if found < 0:
+            found = self._find(2 * node + 1, mid, hi, start, need)
+        return found
+
+
+# Отсортированные остатки: самый плотный подходящий транспорт.
+# Пары (остаток, позиция) хранятся блоками по _LOAD..2*_LOAD штук, у каждого
+# блока запоминается наибольшая пара. Поиск — двоичный по блокам и внутри
+# блока, O(log m). Изменение остатка — удаление и вставка в своих блоках,
+# O(log m + _LOAD); переполненный блок делится пополам, список блоков при
+# этом сдвигается за O(m / _LOAD), но не чаще раза на _LOAD вставок
+class BestFitIndex:
+    _LOAD = 256
+
+    def __init__(self, free: Sequence[float]):
+        self.size = len(free)
+        self._free: List[float] = list(free)
+        keys = sorted((f, i) for i, f in enumerate(free))
+        load = self._LOAD
+        self._buckets: List[List[Tuple[float, int]]] = (
+            [keys[k:k + load] for k in range(0, len(keys), load)] or [[]])
+        # Наибольшая пара каждого блока
+        self._maxes: List[Tuple[float, int]] = [b[-1] for b in self._buckets if b]
+
+    # Остаток транспорта на позиции pos
+    def get(self, pos: int) -> float:
+        return self._free[pos]
+
+    # Изменение остатка транспорта на позиции pos
+    def update(self, pos: int, free: float):
+        buckets, maxes = self._buckets, self._maxes
+        key = (self._free[pos], pos)
+        b = bisect_left(maxes, key)
+        bucket = buckets[b]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            maxes[b] = bucket[-1]
+        elif len(buckets) > 1:
+            del buckets[b], maxes[b]
+        else:
+            maxes.clear()
+
+        key = (free, pos)
+        b = min(bisect_left(maxes, key), len(buckets) - 1)
+        bucket = buckets[b]
+        insort(bucket, key)
+        if maxes:
+            maxes[b] = bucket[-1]
+        else:
+            maxes.append(bucket[-1])
+        if len(bucket) > 2 * self._LOAD:
+            half = len(bucket) // 2
+            buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+        self._free[pos] = free
+
+    # Позиция с наименьшим остатком не меньше need, иначе -1.
+    # skip — сколько подходящих кандидатов пропустить (для повторных попыток)
+    def find(self, need: float, skip: int = 0) -> int:
+        key = (need, -1)
+        b = bisect_left(self._maxes, key)
+        if b >= len(self._maxes):
+            return -1
+        buckets = self._buckets
+        k = bisect_left(buckets[b], key) + skip
+        while k >= len(buckets[b]):
+            k -= len(buckets[b])
+            b += 1
+            if b >= len(self._maxes):
+                return -1
+        return buckets[b][k][1]
+
+    # Позиция с наибольшим остатком (skip — сколько самых больших пропустить), иначе -1
+    def largest(self, skip: int = 0) -> int:
+        buckets = self._buckets
+        b = len(self._maxes) - 1
+        while b >= 0 and skip >= len(buckets[b]):
+            skip -= len(buckets[b])
+            b -= 1
+        if b < 0:
+            return -1
+        return buckets[b][-1 - skip][1]
+
+
+# Дерево отрезков по нескольким ресурсам (вес, объем, паллеты):
+# в узле — максимум остатка по каждому ресурсу. Поддеревья, где хотя бы
+# одного ресурса не хватает, отсекаются целиком
+class VectorFitIndex:
+    def __init__(self, free: Sequence[Sequence[float]]):
+        # free[d][pos] — остаток ресурса d у транспорта pos
+        self.dims = len(free)
+        self.size = len(free[0]) if free else 0
+        n = 1
+        while n < self.size:
+            n *= 2
+        self._n = n
+        self._trees: List[List[float]] = []
+        for column in free:
+            tree = [float("-inf")] * (2 * n)
+            tree[n:n + self.size] = column
+            for i in range(n - 1, 0, -1):
+                left, right = tree[2 * i], tree[2 * i + 1]
+                tree[i] = left if left >= right else right
+            self._trees.append(tree)
+
+    # Остатки транспорта на позиции pos
+    def get(self, pos: int) -> Tuple[float, ...]:
+        i = self._n + pos
+        return tuple(tree[i] for tree in self._trees)
+
+    # Изменение остатков транспорта на позиции pos
+    def update(self, pos: int, free: Sequence[float]):
+        for tree, value in zip(self._trees, free):
+            i = self._n + pos
+            tree[i] = value
+            i //= 2
+            while i:
+                left, right = tree[2 * i], tree[2 * i + 1]
+                best = left if left >= right else right
+                if tree[i] == best:
+                    break
+                tree[i] = best
+                i //= 2
+
+    # Самая левая позиция >= start, где хватает всех ресурсов need, иначе -1
+    def find(self, need: Sequence[float], start: int = 0) -> int:
+        found = self.find_all(need, 1, start)
+        return found[0] if found else -1
+
+    # До limit позиций >= start (слева направо), где хватает всех ресурсов need.
+    # Все кандидаты собираются за один обход дерева
+    def find_all(self, need: Sequence[float], limit: int, start: int = 0) -> List[int]:
+        trees = self._trees
+        n = self._n
+        found: List[int] = []
+        if start >= self.size:
+            return found
+        # Обход в глубину слева направо по узлам (номер узла, начало диапазона, длина)
+        stack = [(1, 0, n)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            i, lo, span = pop()
+            if lo + span <= start:
+                continue
+            fits = True
+            for tree, x in zip(trees, need):
+                if tree[i] < x:
+                    fits = False
+                    break
+            if not fits:
+                continue
+            if i >= n:
+                found.append(lo)
+                if len(found) == limit:
+                    break
+                continue
+            span //= 2
+            push((2 * i + 1, lo + span, span))
+            push((2 * i, lo, span))
+        return found
+
+
+# Отсортированные остатки по каждому ресурсу: кандидаты берутся из самого
+# короткого «хвоста» (транспорт, где остаток ресурса не меньше нужного),
+# начиная с самого плотного, остальные ресурсы проверяются по месту.
+# Если в начале хвоста подходящих мало, хвосты пересекаются как множества
+class VectorBestFitIndex:
+    # Сколько позиций хвоста проверять по одной до пересечения множеств
+    scan_limit = 32
+
+    def __init__(self, free: Sequence[Sequence[float]]):
+        self.dims = len(free)
+        self.size = len(free[0]) if free else 0
+        self._free: List[List[float]] = [list(column) for column in free]
+        self._keys: List[List[Tuple[float, int]]] = [
+            sorted((f, i) for i, f in enumerate(column)) for column in free]
+        # Позиции в том же порядке, что и _keys (для пересечения множеств)
+        self._order: List[List[int]] = [[i for _, i in keys] for keys in self._keys]
+
+    # Остатки транспорта на позиции pos
+    def get(self, pos: int) -> Tuple[float, ...]:
+        return tuple(column[pos] for column in self._free)
+
+    # Изменение остатков транспорта на позиции pos
+    def update(self, pos: int, free: Sequence[float]):
+        for keys, order, column, value in zip(self._keys, self._order, self._free, free):
+            old = column[pos]
+            if old == value:
+                continue
+            k = bisect_left(keys, (old, pos))
+            del keys[k]
+            del order[k]
+            k = bisect_left(keys, (value, pos))
+            keys.insert(k, (value, pos))
+            order.insert(k, pos)
+            column[pos] = value
+
+    # До limit позиций, где хватает всех ресурсов need (от самого плотного
+    # остатка по самому дефицитному ресурсу)
+    def find_all(self, need: Sequence[float], limit: int) -> List[int]:
+        tails = sorted((len(keys) - start, start, d) for d, (keys, start) in enumerate(
+            (keys, bisect_left(keys, (x, -1))) for keys, x in zip(self._keys, need)))
+        length, start, d = tails[0]
+        found: List[int] = []
+        if not length:
+            return found
+        columns = self._free
+        order = self._order[d]
+        end = min(len(order), start + self.scan_limit)
+        for k in range(start, end):
+            pos = order[k]
+            for column, x in zip(columns, need):
+                if column[pos] < x:
+                    break
+            else:
+                found.append(pos)
+                if len(found) == limit:
+                    return found
+        if end == len(order):
+            return found
+        # Остаток хвоста: пересечение с хвостами остальных ресурсов,
+        # затем первые подходящие в порядке хвоста
+        rest = set(order[end:])
+        for _, other_start, other in tails[1:]:
+            if not rest:
+                return found
+            if need[other] > 0:
+                rest.intersection_update(self._order[other][other_start:])
+        if rest:
+            for k in range(end, len(order)):
+                if order[k] in rest:
+                    found.append(order[k])
+                    if len(found) == limit:
+                        break
+        return found
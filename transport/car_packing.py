@@ -0,0 +1,107 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from transport.capacity_index import BestFitIndex, FirstFitIndex
+from transport.packing import PackingStrategy, register_strategy
+
+# Двухуровневая упаковка для поездов с загрузкой по вагонам.
+# Верхний уровень — индекс транспорта по «доступному» остатку: у обычного
+# транспорта это свободная грузоподъемность, у поезда по вагонам —
+# меньшее из свободной грузоподъемности поезда и наибольшего остатка вагона
+# (больший груз в поезд не поместится). Нижний уровень — дерево остатков
+# вагонов каждого поезда. Вагон выбирается так же, как в Train.load_cargo:
+# с наибольшим свободным местом, поэтому план совпадает с фактической загрузкой.
+
+# Вагоны транспорта: (пределы вагонов, загрузка вагонов) или None
+CarState = Optional[Tuple[Sequence[float], Sequence[float]]]
+
+
+# Вагоны транспорта компании для стратегии (None, если поездов по вагонам нет)
+def car_states(vehicles) -> Optional[List[CarState]]:
+    states = [v.car_state() if getattr(v, "car_capacities", None) is not None else None
+              for v in vehicles]
+    return states if any(s is not None for s in states) else None
+
+
+# Лучший подходящий транспорт с учетом вагонов (как BestFitDecreasing:
+# новый транспорт берется, только если груз не помещается в задействованный)
+@register_strategy
+class CarBestFit(PackingStrategy):
+    name = "cars"
+
+    def __init__(self, cars: Optional[Sequence[CarState]] = None):
+        # cars[v] — вагоны транспорта v (None — транспорт без вагонов)
+        self.cars = cars
+
+    def with_cars(self, cars) -> PackingStrategy:
+        return CarBestFit(cars)
+
+    def assign(self, order, weights, vip, capacities, loads):
+        loads = list(loads)
+        m = len(capacities)
+        cars = self.cars or [None] * m
+        car_limits: Dict[int, Sequence[float]] = {}
+        car_loads: Dict[int, List[float]] = {}
+        car_index: Dict[int, FirstFitIndex] = {}
+        for v, state in enumerate(cars):
+            if state is not None:
+                car_limits[v] = state[0]
+                car_loads[v] = list(state[1])
+                car_index[v] = FirstFitIndex([c - l for c, l in zip(state[0], state[1])])
+
+        def available(v: int) -> float:
+            free = capacities[v] - loads[v]
+            if v in car_index:
+                return min(free, car_index[v].max())
+            return free
+
+        checks = 0
+
+        # Груз помещается в транспорт (и в вагон с наибольшим остатком)
+        def fits(v: int, w: float) -> bool:
+            nonlocal checks
+            checks += 1
+            if loads[v] + w > capacities[v]:
+                return False
+            if v in car_index:
+                car = car_index[v].argmax()
+                return car_loads[v][car] + w <= car_limits[v][car]
+            return True
+
+        closed = float("-inf")
+        index = BestFitIndex([available(v) if loads[v] > 0 else closed for v in range(m)])
+        spare = sorted((v for v in range(m) if loads[v] <= 0), key=lambda v: -available(v))
+        next_spare = 0
+        assignment = [-1] * len(weights)
+        watched = self.progress is not None or self.should_stop is not None
+        step = self.progress_step
+        total = len(order)
+        placed = lookups = 0
+        for k, i in enumerate(order):
+            if watched and k % step == 0:
+                self._report(k, total, placed, m - len(spare) + next_spare)
+            w = weights[i]
+            skip = 0
+            v = index.find(w)
+            lookups += 1
+            # Остаток в индексе может отличаться от проверки при загрузке
+            # на погрешность округления — тогда берем следующий транспорт
+            while v >= 0 and not fits(v, w):
+                skip += 1
+                v = index.find(w, skip)
+                lookups += 1
+            if v < 0:
+                if next_spare == len(spare) or not fits(spare[next_spare], w):
+                    continue
+                v = spare[next_spare]
+                next_spare += 1
+            loads[v] += w
+            if v in car_index:
+                car = car_index[v].argmax()
+                car_loads[v][car] += w
+                car_index[v].update(car, car_limits[v][car] - car_loads[v][car])
+            index.update(v, available(v))
+            assignment[i] = v
+            placed += 1
+        if watched:
+            self._report(total, total, placed, m - len(spare) + next_spare)
+        self._count(lookups, checks, placed)
+        return assignment
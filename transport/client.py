@@ -1,9 +1,12 @@
 # Импортируем стандартные типы для аннотации
-from typing import Union
+from typing import Optional, Union
 
 # Класс для представления клиента
 class Client:
-    def __init__(self, name: str, cargo_weight: Union[int, float], is_vip: bool = False):
+    __slots__ = ("name", "cargo_weight", "is_vip", "client_id", "volume", "pallets")
+
+    def __init__(self, name: str, cargo_weight: Union[int, float], is_vip: bool = False,
+                 client_id: Optional[str] = None, volume: Union[int, float] = 0.0, pallets: int = 0):
         # Проверяем, что имя — строка
         if not isinstance(name, str):
             raise TypeError("Имя клиента должно быть строкой")
@@ -19,6 +22,19 @@ class Client:
             raise TypeError("is_vip должен быть булевым значением")
         self.is_vip = is_vip
 
+        # Идентификатор клиента (None — назначит компания при добавлении)
+        if client_id is not None and not isinstance(client_id, str):
+            raise TypeError("ID клиента должен быть строкой")
+        self.client_id = client_id
+
+        # Объем груза (м³) и число паллет (0 — не учитываются)
+        if not isinstance(volume, (int, float)) or volume < 0:
+            raise ValueError("Объем груза должен быть неотрицательным числом")
+        self.volume = volume
+        if not isinstance(pallets, int) or pallets < 0:
+            raise ValueError("Число паллет должно быть неотрицательным целым")
+        self.pallets = pallets
+
     # Строковое представление клиента
     def __str__(self):
         vip_status = "VIP" if self.is_vip else "обычный"
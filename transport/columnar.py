@@ -0,0 +1,417 @@
+import math
+from array import array
+from typing import List, Optional, Sequence, Union
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.truck import Truck
+from transport.train import Train
+from transport.company import TransportCompany
+from transport.ids import get_id_generator
+from transport.packing import PackingStrategy, get_strategy
+
+# Колоночное хранилище клиентов и транспорта.
+# Вместо объекта на каждую запись — плотные массивы чисел (модуль array),
+# которые стратегии упаковки читают напрямую, без обращения к атрибутам.
+# Хранятся те же данные, что у Client/Vehicle: объем, паллеты и вагоны
+# поездов, поэтому распределение идет по тем же правилам, что в компании.
+
+# Коды типов транспорта
+VEHICLE = 0
+TRUCK = 1
+TRAIN = 2
+
+
+# Представление строки клиента (без копирования данных)
+class ClientView:
+    __slots__ = ("_store", "row")
+
+    def __init__(self, store: "FleetStore", row: int):
+        self._store = store
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self._store.client_names[self.row]
+
+    @property
+    def client_id(self) -> Optional[str]:
+        return self._store.client_ids[self.row]
+
+    @property
+    def cargo_weight(self) -> float:
+        return self._store.cargo_weight[self.row]
+
+    @property
+    def volume(self) -> float:
+        return self._store.volume[self.row]
+
+    @property
+    def pallets(self) -> int:
+        return self._store.pallets[self.row]
+
+    @property
+    def is_vip(self) -> bool:
+        return bool(self._store.is_vip[self.row])
+
+    # Номер строки транспорта, куда загружен клиент (-1 — не загружен)
+    @property
+    def vehicle_row(self) -> int:
+        return self._store.assigned[self.row]
+
+    # Номер вагона с грузом (-1 — не загружен или поезд без вагонов)
+    @property
+    def car(self) -> int:
+        return self._store.car[self.row]
+
+    def __str__(self):
+        vip_status = "VIP" if self.is_vip else "обычный"
+        return f"Клиент {self.name}, вес груза: {self.cargo_weight} т, статус: {vip_status}"
+
+
+# Представление строки транспорта: грузовик, поезд или базовый транспорт
+class VehicleView:
+    __slots__ = ("_store", "row")
+
+    def __init__(self, store: "FleetStore", row: int):
+        self._store = store
+        self.row = row
+
+    @property
+    def kind(self) -> int:
+        return self._store.vehicle_type[self.row]
+
+    @property
+    def vehicle_id(self) -> str:
+        return self._store.vehicle_id(self.row)
+
+    @property
+    def capacity(self) -> float:
+        return self._store.capacity[self.row]
+
+    @property
+    def current_load(self) -> float:
+        return self._store.current_load[self.row]
+
+    @property
+    def volume_capacity(self) -> float:
+        return self._store.volume_capacity[self.row]
+
+    @property
+    def current_volume(self) -> float:
+        return self._store.current_volume[self.row]
+
+    @property
+    def pallet_capacity(self) -> float:
+        return self._store.pallet_capacity[self.row]
+
+    @property
+    def current_pallets(self) -> int:
+        return self._store.current_pallets[self.row]
+
+    @property
+    def color(self) -> Optional[str]:
+        return self._store.colors[self.row]
+
+    @property
+    def number_of_cars(self) -> int:
+        return self._store.number_of_cars[self.row]
+
+    # Пределы и загрузка вагонов (None — транспорт без вагонов)
+    @property
+    def car_capacities(self) -> Optional[List[float]]:
+        return self._store.car_capacities[self.row]
+
+    @property
+    def car_loads(self) -> Optional[List[float]]:
+        return self._store.car_loads[self.row]
+
+    @property
+    def client_count(self) -> int:
+        return len(self._store._cargo[self.row])
+
+    # Клиенты, загруженные в этот транспорт, в порядке загрузки
+    # (по индексу строк транспорта, без просмотра всех клиентов)
+    @property
+    def clients_list(self) -> List[ClientView]:
+        store = self._store
+        return [ClientView(store, i) for i in store._cargo[self.row]]
+
+    def __str__(self):
+        base = f"ID: {self.vehicle_id}, грузоподъемность: {self.capacity} т, текущая загрузка: {self.current_load} т"
+        if self.kind == TRUCK:
+            return f"Грузовик {self.color}, " + base
+        if self.kind == TRAIN:
+            return f"Поезд с {self.number_of_cars} вагонами, " + base
+        return base
+
+
+# Хранилище клиентов и транспорта по колонкам
+class FleetStore:
+    def __init__(self):
+        # Колонки клиентов
+        self.client_names: List[str] = []
+        self.client_ids: List[Optional[str]] = []
+        self.cargo_weight = array("d")
+        self.volume = array("d")
+        self.pallets = array("l")
+        self.is_vip = array("b")
+        self.assigned = array("l")  # строка транспорта или -1
+        self.car = array("l")       # вагон поезда или -1
+        # Колонки транспорта
+        self.vehicle_type = array("b")
+        self.capacity = array("d")
+        self.current_load = array("d")
+        self.volume_capacity = array("d")   # math.inf — без ограничения
+        self.current_volume = array("d")
+        self.pallet_capacity = array("d")   # math.inf — без ограничения
+        self.current_pallets = array("l")
+        self.number_of_cars = array("l")
+        self.colors: List[Optional[str]] = []
+        self.car_capacities: List[Optional[List[float]]] = []
+        self.car_loads: List[Optional[List[float]]] = []
+        self._vehicle_ids: List[Optional[str]] = []  # создаются по запросу
+        # Строки клиентов каждого транспорта в порядке загрузки
+        self._cargo: List[List[int]] = []
+
+    @property
+    def client_count(self) -> int:
+        return len(self.cargo_weight)
+
+    @property
+    def vehicle_count(self) -> int:
+        return len(self.capacity)
+
+    # Добавление клиента (те же проверки, что в Client), возвращает номер строки
+    def add_client(self, name: str, cargo_weight: Union[int, float], is_vip: bool = False,
+                   client_id: Optional[str] = None, volume: Union[int, float] = 0.0,
+                   pallets: int = 0) -> int:
+        if not isinstance(name, str):
+            raise TypeError("Имя клиента должно быть строкой")
+        if not isinstance(cargo_weight, (int, float)) or cargo_weight < 0:
+            raise ValueError("Вес груза должен быть положительным числом")
+        if not isinstance(is_vip, bool):
+            raise TypeError("is_vip должен быть булевым значением")
+        if client_id is not None and not isinstance(client_id, str):
+            raise TypeError("ID клиента должен быть строкой")
+        if not isinstance(volume, (int, float)) or volume < 0:
+            raise ValueError("Объем груза должен быть неотрицательным числом")
+        if not isinstance(pallets, int) or pallets < 0:
+            raise ValueError("Число паллет должно быть неотрицательным целым")
+        self.client_names.append(name)
+        self.client_ids.append(client_id)
+        self.cargo_weight.append(cargo_weight)
+        self.volume.append(volume)
+        self.pallets.append(pallets)
+        self.is_vip.append(is_vip)
+        self.assigned.append(-1)
+        self.car.append(-1)
+        return len(self.cargo_weight) - 1
+
+    # Добавление транспорта (те же проверки, что в Vehicle/Truck/Train).
+    # car_capacity — пределы вагонов поезда с загрузкой по вагонам
+    def add_vehicle(self, kind: int, capacity: float, color: Optional[str] = None,
+                    number_of_cars: int = 0, vehicle_id: Optional[str] = None,
+                    volume: Optional[Union[int, float]] = None, pallets: Optional[int] = None,
+                    car_capacity: Optional[Sequence[float]] = None) -> int:
+        if not isinstance(capacity, (int, float)) or capacity <= 0:
+            raise ValueError("Грузоподъемность должна быть положительным числом")
+        if volume is not None and (not isinstance(volume, (int, float)) or volume <= 0):
+            raise ValueError("Объем кузова должен быть положительным числом")
+        if pallets is not None and (not isinstance(pallets, int) or pallets <= 0):
+            raise ValueError("Число паллет должно быть положительным целым")
+        if kind == TRUCK and not isinstance(color, str):
+            raise TypeError("Цвет должен быть строкой")
+        if kind == TRAIN and (not isinstance(number_of_cars, int) or number_of_cars <= 0):
+            raise ValueError("Количество вагонов должно быть положительным числом")
+        if kind not in (VEHICLE, TRUCK, TRAIN):
+            raise ValueError("Неизвестный тип транспорта")
+        if car_capacity is not None:
+            if kind != TRAIN:
+                raise ValueError("Вагоны бывают только у поезда")
+            car_capacity = list(car_capacity)
+            if len(car_capacity) != number_of_cars:
+                raise ValueError("Число пределов вагонов не совпадает с числом вагонов")
+            if any(not isinstance(c, (int, float)) or c <= 0 for c in car_capacity):
+                raise ValueError("Предел вагона должен быть положительным числом")
+        self.vehicle_type.append(kind)
+        self.capacity.append(capacity)
+        self.current_load.append(0.0)
+        self.volume_capacity.append(math.inf if volume is None else volume)
+        self.current_volume.append(0.0)
+        self.pallet_capacity.append(math.inf if pallets is None else pallets)
+        self.current_pallets.append(0)
+        self.number_of_cars.append(number_of_cars if kind == TRAIN else 0)
+        self.colors.append(color if kind == TRUCK else None)
+        self.car_capacities.append(car_capacity)
+        self.car_loads.append(None if car_capacity is None else [0.0] * len(car_capacity))
+        self._vehicle_ids.append(vehicle_id)
+        self._cargo.append([])
+        return len(self.capacity) - 1
+
+    # ID транспорта: генерируется при первом обращении
+    def vehicle_id(self, row: int) -> str:
+        vid = self._vehicle_ids[row]
+        if vid is None:
+            generator = get_id_generator()
+            vid = self._vehicle_ids[row] = generator.format(generator.next())
+        return vid
+
+    def client(self, row: int) -> ClientView:
+        return ClientView(self, row)
+
+    def vehicle(self, row: int) -> VehicleView:
+        return VehicleView(self, row)
+
+    # Вагон для груза: с наибольшим свободным местом (левый при равенстве,
+    # как в Train), -1 — не помещается. Для транспорта без вагонов — -1
+    def _choose_car(self, v: int, weight: float) -> int:
+        caps = self.car_capacities[v]
+        if caps is None:
+            return -1
+        loads = self.car_loads[v]
+        car = max(range(len(caps)), key=lambda k: caps[k] - loads[k])
+        return car if loads[car] + weight <= caps[car] else -1
+
+    # Помещается ли груз клиента i в транспорт v (те же проверки, что в fits)
+    def _fits(self, i: int, v: int) -> bool:
+        if self.current_load[v] + self.cargo_weight[i] > self.capacity[v]:
+            return False
+        if self.current_volume[v] + self.volume[i] > self.volume_capacity[v]:
+            return False
+        if self.current_pallets[v] + self.pallets[i] > self.pallet_capacity[v]:
+            return False
+        return self.car_capacities[v] is None or self._choose_car(v, self.cargo_weight[i]) >= 0
+
+    # Загрузка клиента i в транспорт v (в вагон car, -1 — выбрать вагон)
+    def _load(self, i: int, v: int, car: int = -1):
+        weight = self.cargo_weight[i]
+        self.current_load[v] += weight
+        self.current_volume[v] += self.volume[i]
+        self.current_pallets[v] += self.pallets[i]
+        if self.car_capacities[v] is not None:
+            if car < 0:
+                car = self._choose_car(v, weight)
+            self.car_loads[v][car] += weight
+            self.car[i] = car
+        self.assigned[i] = v
+        self._cargo[v].append(i)
+
+    # Распределение грузов по колонкам: стратегия получает массивы напрямую,
+    # загрузка обновляется одним проходом. Входные данные выбираются так же,
+    # как в multi_resource.packing_inputs: при заданных объеме или паллетах —
+    # вариант стратегии по нескольким ресурсам, при поездах по вагонам — с
+    # учетом вагонов. Возвращает число неразмещенных клиентов
+    def optimize_cargo_distribution(self, strategy: Union[str, PackingStrategy] = "bfd") -> int:
+        engine = get_strategy(strategy)
+        pending = [i for i, v in enumerate(self.assigned) if v < 0]
+        if len(pending) == self.client_count:
+            rows = None
+            vip = self.is_vip
+        else:
+            # Повторный запуск размещает только еще не загруженных клиентов
+            rows = pending
+            vip = [self.is_vip[i] for i in pending]
+        if any(self.volume[i] or self.pallets[i] for i in pending):
+            engine = engine.with_resources()
+        if engine.multi_resource:
+            demands = [self.cargo_weight, self.volume, self.pallets]
+            if rows is not None:
+                demands = [[column[i] for i in rows] for column in demands]
+            capacities = [self.capacity, self.volume_capacity, self.pallet_capacity]
+            loads = [self.current_load, self.current_volume, self.current_pallets]
+        else:
+            engine = engine.with_cars(self._car_states())
+            demands = self.cargo_weight if rows is None else [self.cargo_weight[i] for i in rows]
+            capacities = self.capacity
+            loads = self.current_load
+        order = engine.order(demands, vip)
+        assignment = engine.assign(order, demands, vip, capacities, loads)
+        unplaced = 0
+        for k in order:
+            v = assignment[k]
+            i = k if rows is None else rows[k]
+            # Многоресурсная стратегия вагоны не различает: вагон (как и
+            # погрешность округления) проверяется при загрузке
+            if v < 0 or not self._fits(i, v):
+                unplaced += 1
+                continue
+            self._load(i, v)
+        return unplaced
+
+    # Вагоны транспорта для стратегии (None, если поездов по вагонам нет)
+    def _car_states(self):
+        states = [None if caps is None else (list(caps), list(loads))
+                  for caps, loads in zip(self.car_capacities, self.car_loads)]
+        return states if any(s is not None for s in states) else None
+
+    # Построение хранилища по компании (загруженные клиенты сохраняют привязку,
+    # вагон и порядок загрузки)
+    @classmethod
+    def from_company(cls, company: TransportCompany) -> "FleetStore":
+        store = cls()
+        rows = {}
+        for client in company.clients:
+            rows[client] = store.add_client(client.name, client.cargo_weight, client.is_vip,
+                                            client.client_id, client.volume, client.pallets)
+        for vehicle in company.vehicles:
+            volume = None if vehicle.volume_capacity == math.inf else vehicle.volume_capacity
+            pallets = None if vehicle.pallet_capacity == math.inf else vehicle.pallet_capacity
+            if isinstance(vehicle, Truck):
+                row = store.add_vehicle(TRUCK, vehicle.capacity, color=vehicle.color,
+                                        vehicle_id=vehicle.vehicle_id, volume=volume, pallets=pallets)
+            elif isinstance(vehicle, Train):
+                row = store.add_vehicle(TRAIN, vehicle.capacity, number_of_cars=vehicle.number_of_cars,
+                                        vehicle_id=vehicle.vehicle_id, volume=volume, pallets=pallets,
+                                        car_capacity=vehicle.car_capacities)
+                if vehicle.per_car:
+                    store.car_loads[row] = list(vehicle.car_loads)
+            else:
+                row = store.add_vehicle(VEHICLE, vehicle.capacity, vehicle_id=vehicle.vehicle_id,
+                                        volume=volume, pallets=pallets)
+            # Загрузку переносим как есть, без повторного сложения весов
+            store.current_load[row] = vehicle.current_load
+            store.current_volume[row] = vehicle.current_volume
+            store.current_pallets[row] = vehicle.current_pallets
+            for client in vehicle.clients_list:
+                i = rows[client]
+                store.assigned[i] = row
+                car = vehicle.car_of(client) if isinstance(vehicle, Train) else None
+                store.car[i] = -1 if car is None else car
+                store._cargo[row].append(i)
+        return store
+
+    # Создание объектов Client/Truck/Train по строкам хранилища.
+    # Грузы привязываются к транспорту до добавления в компанию, поэтому
+    # компания регистрирует их как загруженные (как и при загрузке снимка)
+    def to_company(self, name: str) -> TransportCompany:
+        company = TransportCompany(name)
+        vehicles: List[Vehicle] = []
+        for row in range(self.vehicle_count):
+            kind = self.vehicle_type[row]
+            volume = None if self.volume_capacity[row] == math.inf else self.volume_capacity[row]
+            pallets = None if self.pallet_capacity[row] == math.inf else int(self.pallet_capacity[row])
+            if kind == TRUCK:
+                vehicle = Truck(self.capacity[row], self.colors[row], volume, pallets)
+            elif kind == TRAIN:
+                vehicle = Train(self.capacity[row], self.number_of_cars[row], volume, pallets,
+                                car_capacity=self.car_capacities[row])
+            else:
+                vehicle = Vehicle(self.capacity[row], volume, pallets)
+            vehicle.vehicle_id = self.vehicle_id(row)
+            vehicles.append(vehicle)
+        clients = [Client(self.client_names[i], self.cargo_weight[i], bool(self.is_vip[i]),
+                          self.client_ids[i], self.volume[i], self.pallets[i])
+                   for i in range(self.client_count)]
+        for row, vehicle in enumerate(vehicles):
+            for i in self._cargo[row]:
+                if isinstance(vehicle, Train):
+                    vehicle._attach(clients[i], self.car[i])
+                else:
+                    vehicle._attach(clients[i])
+            # Загрузку переносим как есть, без повторного сложения весов
+            vehicle.current_load = self.current_load[row]
+            vehicle.current_volume = self.current_volume[row]
+            vehicle.current_pallets = self.current_pallets[row]
+        company.add_vehicles(vehicles)
+        company.add_clients(clients)
+        return company
@@ -1,42 +1,411 @@
-from typing import List
+from itertools import islice
+from typing import Dict, Iterable, Iterator, KeysView, List, Optional, Union
 from transport.vehicle import Vehicle
 from transport.client import Client
+from transport.events import EventSink, FanoutSink, NULL_SINK
+from transport.packing import PackingStrategy
+from transport.multi_resource import packing_inputs
+from transport.metrics import PhaseTimer
 
 # Класс транспортной компании
 class TransportCompany:
     def __init__(self, name: str):
         self.name = name
-        self.vehicles: List[Vehicle] = []  # Список транспорта
-        self.clients: List[Client] = []    # Список клиентов
+        # Реестры: транспорт по vehicle_id, клиенты по client_id
+        # (словари сохраняют порядок добавления)
+        self._vehicles: Dict[str, Vehicle] = {}
+        self._clients: Dict[str, Client] = {}
+        self._next_client = 0               # счетчик для новых client_id
+        self.events: EventSink = NULL_SINK  # Получатель событий
+        # Куда загружен каждый клиент (размещенные компанией и
+        # пришедшие вместе с уже загруженным транспортом)
+        self._assignment: Dict[Client, Vehicle] = {}
+        self.metrics = None                 # Метрики (transport.metrics.Metrics) или None
 
-    # Добавление транспортного средства
-    def add_vehicle(self, vehicle: Vehicle):
+    # Список транспорта в порядке добавления (копия)
+    @property
+    def vehicles(self) -> List[Vehicle]:
+        return list(self._vehicles.values())
+
+    # Список клиентов в порядке добавления (копия)
+    @property
+    def clients(self) -> List[Client]:
+        return list(self._clients.values())
+
+    # ID транспорта и клиентов (живое представление, без копирования)
+    def vehicle_ids(self) -> KeysView[str]:
+        return self._vehicles.keys()
+
+    def client_ids(self) -> KeysView[str]:
+        return self._clients.keys()
+
+    # Транспорт по ID (None — нет такого)
+    def get_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
+        return self._vehicles.get(vehicle_id)
+
+    # Клиент по ID (None — нет такого)
+    def get_client(self, client_id: str) -> Optional[Client]:
+        return self._clients.get(client_id)
+
+    # Принадлежит ли объект компании
+    def has_vehicle(self, vehicle: Vehicle) -> bool:
+        return self._vehicles.get(vehicle.vehicle_id) is vehicle
+
+    def has_client(self, client: Client) -> bool:
+        return client.client_id is not None and self._clients.get(client.client_id) is client
+
+    # Объект компании по объекту или ID, иначе ValueError
+    def _vehicle(self, vehicle: Union[str, Vehicle]) -> Vehicle:
+        found = self._vehicles.get(vehicle if isinstance(vehicle, str) else vehicle.vehicle_id)
+        if found is None or not (isinstance(vehicle, str) or found is vehicle):
+            raise ValueError("Транспорт не найден в компании")
+        return found
+
+    def _client(self, client: Union[str, Client]) -> Client:
+        found = self._clients.get(client if isinstance(client, str) else client.client_id)
+        if found is None or not (isinstance(client, str) or found is client):
+            raise ValueError("Клиент не найден в компании")
+        return found
+
+    # Регистрация транспорта в реестре
+    def _register_vehicle(self, vehicle: Vehicle):
         if not isinstance(vehicle, Vehicle):
             raise TypeError("Можно добавлять только Vehicle")
-        self.vehicles.append(vehicle)
-        print(f"Добавлен транспорт: {vehicle}")
+        vehicle_id = vehicle.vehicle_id
+        if vehicle_id in self._vehicles:
+            raise ValueError(f"Транспорт с ID {vehicle_id} уже есть в компании")
+        self._vehicles[vehicle_id] = vehicle
+
+    # Регистрация клиента в реестре, клиенту без ID назначается новый
+    def _register_client(self, client: Client):
+        if not isinstance(client, Client):
+            raise TypeError("Можно добавлять только Client")
+        client_id = client.client_id
+        if client_id is None:
+            client.client_id = self._new_client_id()
+        elif client_id in self._clients:
+            raise ValueError(f"Клиент с ID {client_id} уже есть в компании")
+        self._clients[client.client_id] = client
+
+    def _new_client_id(self) -> str:
+        while True:
+            self._next_client += 1
+            client_id = f"C{self._next_client}"
+            if client_id not in self._clients:
+                return client_id
+
+    # Замена значения в реестре с сохранением позиции.
+    # Если ключ меняется, словарь пересобирается (O(n))
+    @staticmethod
+    def _replace_entry(registry: Dict[str, object], old_key: str, new_key: str, obj) -> Dict[str, object]:
+        if new_key == old_key:
+            registry[old_key] = obj
+            return registry
+        if new_key in registry:
+            raise ValueError(f"ID {new_key} уже занят")
+        return {(new_key if key == old_key else key): (obj if key == old_key else value)
+                for key, value in registry.items()}
+
+    # Подписка получателя на события компании и ее транспорта
+    def subscribe(self, sink: EventSink):
+        if not isinstance(sink, EventSink):
+            raise TypeError("Подписать можно только EventSink")
+        if self.events is NULL_SINK:
+            self._set_events(sink)
+        elif isinstance(self.events, FanoutSink):
+            self.events.sinks.append(sink)
+        else:
+            self._set_events(FanoutSink(self.events, sink))
+
+    # Отписка получателя
+    def unsubscribe(self, sink: EventSink):
+        if self.events is sink:
+            self._set_events(NULL_SINK)
+        elif isinstance(self.events, FanoutSink) and sink in self.events.sinks:
+            self.events.sinks.remove(sink)
+            if len(self.events.sinks) == 1:
+                self._set_events(self.events.sinks[0])
+
+    # Передаем получателя всему транспорту компании
+    def _set_events(self, sink: EventSink):
+        self.events = sink
+        for vehicle in self._vehicles.values():
+            vehicle.events = sink
+
+    # Добавление транспортного средства
+    def add_vehicle(self, vehicle: Vehicle):
+        self._register_vehicle(vehicle)
+        vehicle.events = self.events
+        for client in vehicle.clients_list:
+            self._assignment[client] = vehicle
+        self.events.vehicle_added(vehicle)
+
+    # Добавление множества транспортных средств, возвращает их количество
+    def add_vehicles(self, vehicles: Iterable[Vehicle]) -> int:
+        count = 0
+        events = self.events
+        register = self._register_vehicle
+        for vehicle in vehicles:
+            register(vehicle)
+            vehicle.events = events
+            for client in vehicle.clients_list:
+                self._assignment[client] = vehicle
+            events.vehicle_added(vehicle)
+            count += 1
+        return count
 
     # Вывод списка всех транспортных средств
-    def list_vehicles(self):
-        return [str(v) for v in self.vehicles]
+    # page — номер страницы по page_size строк (None — весь список).
+    # Строки берутся из кэша транспорта, форматируется только измененный
+    def list_vehicles(self, page: Optional[int] = None, page_size: int = 50) -> List[str]:
+        if page is None:
+            return [str(v) for v in self._vehicles.values()]
+        if page < 0 or page_size <= 0:
+            raise ValueError("Номер страницы и ее размер должны быть неотрицательными")
+        start = page * page_size
+        return [str(v) for v in islice(self._vehicles.values(), start, start + page_size)]
+
+    # Число страниц списка транспорта
+    def vehicle_pages(self, page_size: int = 50) -> int:
+        return -(-len(self._vehicles) // page_size)
+
+    # Потоковый вывод списка транспорта: строка форматируется при обращении
+    def iter_vehicle_lines(self, start: int = 0) -> Iterator[str]:
+        for vehicle in islice(self._vehicles.values(), start, None):
+            yield str(vehicle)
 
     # Добавление клиента
     def add_client(self, client: Client):
-        if not isinstance(client, Client):
-            raise TypeError("Можно добавлять только Client")
-        self.clients.append(client)
-        print(f"Добавлен клиент: {client}")
+        self._register_client(client)
+        self.events.client_added(client)
+
+    # Добавление множества клиентов, возвращает их количество
+    def add_clients(self, clients: Iterable[Client]) -> int:
+        count = 0
+        events = self.events
+        register = self._register_client
+        for client in clients:
+            register(client)
+            events.client_added(client)
+            count += 1
+        return count
+
+    # Транспорт, в который загружен клиент (None — не загружен).
+    # Клиента можно указать объектом или client_id
+    def vehicle_of(self, client: Union[str, Client]) -> Optional[Vehicle]:
+        if isinstance(client, str):
+            client = self._clients.get(client)
+        return self._assignment.get(client)
 
-    # Оптимизация распределения грузов
-    def optimize_cargo_distribution(self):
+    # Клиенты, которые еще не загружены
+    def unplaced_clients(self) -> List[Client]:
+        assignment = self._assignment
+        return [c for c in self._clients.values() if c not in assignment]
+
+    # Оптимизация распределения грузов.
+    # strategy — имя стратегии ("bfd", "ffd", "ff", "exact") или объект PackingStrategy.
+    # Повторный вызов размещает только еще не загруженных клиентов,
+    # reset=True выгружает всё и распределяет заново.
+    # Возвращает список клиентов, которых не удалось загрузить
+    def optimize_cargo_distribution(self, strategy: Union[str, PackingStrategy] = "bfd",
+                                    reset: bool = False) -> List[Client]:
+        if reset:
+            self.reset_distribution()
+        return self.place_clients(self.unplaced_clients(), strategy)
+
+    # Выгрузка всех грузов из всего транспорта
+    def reset_distribution(self):
+        for vehicle in self._vehicles.values():
+            vehicle.unload_all()
+        self._assignment.clear()
+
+    # Размещение указанных клиентов в текущем транспорте (без перестановки
+    # уже загруженных). Возвращает список неразмещенных
+    def place_clients(self, clients: List[Client],
+                      strategy: Union[str, PackingStrategy] = "bfd") -> List[Client]:
+        timer = PhaseTimer(self.metrics) if self.metrics is not None else None
+        vehicles = self.vehicles
+        # Если заданы объем или паллеты — колонки по всем ресурсам
+        engine, demands, vip, capacities, loads = packing_inputs(strategy, clients, vehicles)
+        if timer:
+            timer.mark("inputs")
         # Сначала VIP клиенты
-        sorted_clients = sorted(self.clients, key=lambda c: not c.is_vip)
-        for client in sorted_clients:
-            loaded = False
-            # Ищем транспорт с доступным местом
-            for vehicle in self.vehicles:
-                if vehicle.load_cargo(client):
-                    loaded = True
-                    break
-            if not loaded:
-                print(f"Не удалось загрузить клиента {client.name}, не хватает места")
\ No newline at end of file
+        order = engine.order(demands, vip)
+        if timer:
+            timer.mark("order")
+        if timer:
+            # Счетчики поиска стратегии — в метрики компании
+            stats, engine.stats = engine.stats, self.metrics.counters
+            try:
+                assignment = engine.assign(order, demands, vip, capacities, loads)
+            finally:
+                engine.stats = stats
+        else:
+            assignment = engine.assign(order, demands, vip, capacities, loads)
+        if timer:
+            timer.mark("assign")
+            self.metrics.counters["distributions"] += 1
+            self.metrics.counters["clients_in"] += len(clients)
+        return self.apply_assignment(clients, vehicles, assignment, order, timer)
+
+    # Загрузка по готовому плану: assignment[i] — номер транспорта в vehicles
+    # для clients[i] (-1 — не размещать), order — порядок загрузки.
+    # Сообщения о неразмещенных отправляются после загрузки; notify=False —
+    # без сообщений (неразмещенных потом размещает вызывающий, как в шардах).
+    # Возвращает список неразмещенных клиентов
+    def apply_assignment(self, clients: List[Client], vehicles: List[Vehicle],
+                         assignment: List[int], order: Optional[List[int]] = None,
+                         timer: Optional[PhaseTimer] = None, notify: bool = True) -> List[Client]:
+        unplaced = []
+        placed = self._assignment
+        for i in (range(len(clients)) if order is None else order):
+            client = clients[i]
+            v = assignment[i]
+            if v >= 0 and vehicles[v].load_cargo(client):
+                placed[client] = vehicles[v]
+            else:
+                unplaced.append(client)
+        if timer:
+            timer.mark("apply")
+        if notify:
+            events = self.events
+            for client in unplaced:
+                events.client_unplaced(client)
+        if timer:
+            timer.mark("unplaced")
+        return unplaced
+
+    # Размещение одного клиента, возвращает транспорт или None
+    def place_client(self, client: Client,
+                     strategy: Union[str, PackingStrategy] = "bfd") -> Optional[Vehicle]:
+        if client in self._assignment:
+            return self._assignment[client]
+        self.place_clients([client], strategy)
+        return self._assignment.get(client)
+
+    # Загрузка клиента в указанный транспорт, возвращает успех
+    def load_into(self, client: Client, vehicle: Vehicle) -> bool:
+        if client in self._assignment:
+            raise ValueError("Клиент уже загружен")
+        if not vehicle.load_cargo(client):
+            return False
+        self._assignment[client] = vehicle
+        return True
+
+    # Выгрузка клиента из его транспорта, возвращает этот транспорт
+    def unload_client(self, client: Union[str, Client]) -> Optional[Vehicle]:
+        if isinstance(client, str):
+            client = self._client(client)
+        vehicle = self._assignment.pop(client, None)
+        if vehicle is not None:
+            vehicle.unload_cargo(client)
+        return vehicle
+
+    # Выгрузка всех клиентов из транспорта (загрузка считается с нуля).
+    # Возвращает выгруженных клиентов
+    def unload_vehicle(self, vehicle: Union[str, Vehicle]) -> List[Client]:
+        vehicle = self._vehicle(vehicle)
+        unloaded = vehicle.unload_all()
+        placed = self._assignment
+        for client in unloaded:
+            del placed[client]
+        return unloaded
+
+    # Перенос загруженного клиента в другой транспорт, возвращает успех.
+    # Место проверяется до выгрузки, поэтому при неудаче ничего не меняется
+    def move_client(self, client: Union[str, Client], vehicle: Vehicle) -> bool:
+        client = self._client(client)
+        old = self._assignment.get(client)
+        if old is None:
+            raise ValueError("Клиент не загружен")
+        if old is vehicle:
+            return True
+        if not vehicle.fits(client):
+            return False
+        old.unload_cargo(client)
+        vehicle.load_cargo(client)
+        self._assignment[client] = vehicle
+        return True
+
+    # Удаление клиента (объект или client_id): выгружается только его груз
+    def remove_client(self, client: Union[str, Client]):
+        client = self._client(client)
+        self.unload_client(client)
+        del self._clients[client.client_id]
+        self.events.client_removed(client)
+
+    # Замена клиента (редактирование) на том же месте списка.
+    # Новый клиент без ID получает ID старого. Если старый клиент был загружен,
+    # новый пробуем загрузить в тот же транспорт, иначе — в любой подходящий
+    def replace_client(self, old: Union[str, Client], new: Client) -> Optional[Vehicle]:
+        if not isinstance(new, Client):
+            raise TypeError("Можно добавлять только Client")
+        old = self._client(old)
+        if new.client_id is None:
+            new.client_id = old.client_id
+        self._clients = self._replace_entry(self._clients, old.client_id, new.client_id, new)
+        vehicle = self.unload_client(old)
+        self.events.client_replaced(old, new)
+        if vehicle is None:
+            return None
+        if vehicle.load_cargo(new):
+            self._assignment[new] = vehicle
+            return vehicle
+        return self.place_client(new)
+
+    # Удаление транспорта (объект или vehicle_id): его грузы перераспределяются
+    # по остальному транспорту (redistribute=False — остаются неразмещенными).
+    # Возвращает клиентов, которых не удалось разместить
+    def remove_vehicle(self, vehicle: Union[str, Vehicle], redistribute: bool = True) -> List[Client]:
+        vehicle = self._vehicle(vehicle)
+        orphans = self.unload_vehicle(vehicle)
+        del self._vehicles[vehicle.vehicle_id]
+        self.events.vehicle_removed(vehicle)
+        if not redistribute:
+            return orphans
+        return self.place_clients(orphans)
+
+    # Сценарий «что если» поверх компании (см. transport.scenario):
+    # компания не меняется, пока сценарий не применен через commit()
+    def fork(self, name: str = ""):
+        from transport.scenario import Scenario
+        return Scenario(self, name)
+
+    # Уплотнение распределения (см. transport.consolidation): грузы мало
+    # загруженного транспорта перекладываются в другой, чтобы освободить его
+    def consolidate(self, max_iterations: Optional[int] = 100_000,
+                    time_limit: Optional[float] = None, swaps: bool = True):
+        from transport.consolidation import consolidate
+        return consolidate(self, max_iterations, time_limit, swaps)
+
+    # План рейсов на смену для всех клиентов компании (см. transport.dispatch):
+    # транспорт делает несколько рейсов, компания не меняется
+    def plan_trips(self, duration, horizon: float = 24.0, available=None):
+        from transport.dispatch import plan_trips
+        return plan_trips(self._clients.values(), self._vehicles.values(), duration,
+                          horizon, available)
+
+    # Замена транспорта (редактирование) на том же месте списка: грузы
+    # старого транспорта сначала загружаются в новый, не поместившиеся —
+    # в остальной транспорт. Возвращает клиентов, которых не удалось разместить
+    def replace_vehicle(self, old: Union[str, Vehicle], new: Vehicle) -> List[Client]:
+        if not isinstance(new, Vehicle):
+            raise TypeError("Можно добавлять только Vehicle")
+        old = self._vehicle(old)
+        self._vehicles = self._replace_entry(self._vehicles, old.vehicle_id, new.vehicle_id, new)
+        orphans = old.unload_all()
+        for client in orphans:
+            del self._assignment[client]
+        new.events = self.events
+        for client in new.clients_list:
+            self._assignment[client] = new
+        self.events.vehicle_replaced(old, new)
+        # Сначала VIP, затем тяжелые грузы
+        orphans.sort(key=lambda c: (not c.is_vip, -c.cargo_weight))
+        rest = []
+        for client in orphans:
+            if new.load_cargo(client):
+                self._assignment[client] = new
+            else:
+                rest.append(client)
+        return self.place_clients(rest)
@@ -0,0 +1,198 @@
+import time
+from typing import Dict, List, Optional, Tuple
+from transport.capacity_index import BestFitIndex
+from transport.client import Client
+from transport.vehicle import Vehicle
+
+# Уплотнение распределения: освобождение мало загруженного транспорта.
+#
+# После жадного распределения часть транспорта загружена слабо. Проход
+# берет задействованный транспорт от наименее загруженного и пытается
+# переложить все его грузы в другой задействованный транспорт:
+#   перенос  груз переходит в транспорт с наименьшим подходящим остатком
+#            (индекс остатков BestFitIndex);
+#   обмен    если места нет нигде, груз занимает место более легкого груза
+#            в транспорте с наибольшим остатком, а тот переносится в третий.
+# Если транспорт не удалось опустошить целиком, его переносы отменяются.
+#
+# Все изменения — через TransportCompany.move_client: место проверяется по
+# настоящему транспорту (объем, паллеты, вагоны поездов), поэтому
+# перегруженного транспорта не бывает. Индекс учитывает только вес, при
+# отказе по другим ресурсам пробуются следующие кандидаты (tries).
+#
+# Проход ограничен числом итераций (попыток размещения) и временем.
+
+
+# Результат уплотнения
+class ConsolidationResult:
+    def __init__(self):
+        self.vehicles_before = 0            # задействованный транспорт до прохода
+        self.freed: List[Vehicle] = []      # освобожденный транспорт
+        self.moves = 0                      # выполненные переносы грузов
+        self.iterations = 0
+        self.elapsed = 0.0                  # секунды
+        self.stopped = "done"               # "done", "iterations" или "time"
+
+    @property
+    def freed_count(self) -> int:
+        return len(self.freed)
+
+    @property
+    def vehicles_after(self) -> int:
+        return self.vehicles_before - len(self.freed)
+
+    # Сводка прохода
+    def summary(self) -> Dict:
+        return {
+            "vehicles_before": self.vehicles_before,
+            "vehicles_after": self.vehicles_after,
+            "freed": self.freed_count,
+            "moves": self.moves,
+            "iterations": self.iterations,
+            "elapsed_s": self.elapsed,
+            "stopped": self.stopped,
+        }
+
+
+# Проход уплотнения над загруженным транспортом компании
+class _Consolidator:
+    def __init__(self, company, max_iterations: Optional[int], time_limit: Optional[float],
+                 swaps: bool, tries: int, swap_candidates: int):
+        self.company = company
+        self.max_iterations = max_iterations
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.swaps = swaps
+        self.tries = tries
+        self.swap_candidates = swap_candidates
+        self.vehicles = company.vehicles
+        self.position = {vehicle: i for i, vehicle in enumerate(self.vehicles)}
+        # Пустой транспорт не принимает грузы (остаток -1): перенос в него
+        # ничего не освобождает
+        self.index = BestFitIndex([v.capacity - v.current_load if v.client_count else -1.0
+                                   for v in self.vehicles])
+        self.closed = set()                 # позиции, которые не принимают грузы
+        self.result = ConsolidationResult()
+        self.journal: List[Tuple[Client, Vehicle]] = []   # (клиент, откуда) для отмены
+
+    # Проверка бюджета; False — проход пора остановить
+    def _budget(self) -> bool:
+        result = self.result
+        if self.max_iterations is not None and result.iterations >= self.max_iterations:
+            result.stopped = "iterations"
+            return False
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            result.stopped = "time"
+            return False
+        return True
+
+    def _refresh(self, vehicle: Vehicle):
+        pos = self.position[vehicle]
+        if pos not in self.closed:
+            self.index.update(pos, vehicle.capacity - vehicle.current_load)
+
+    def _move(self, client: Client, source: Vehicle, target: Vehicle) -> bool:
+        if not self.company.move_client(client, target):
+            return False
+        self.journal.append((client, source))
+        self.result.moves += 1
+        self._refresh(source)
+        self._refresh(target)
+        return True
+
+    # Перенос в транспорт с наименьшим подходящим остатком (кроме exclude)
+    def _relocate(self, client: Client, source: Vehicle, exclude: Vehicle = None) -> bool:
+        index, vehicles = self.index, self.vehicles
+        skip = 0
+        for _ in range(self.tries):
+            pos = index.find(client.cargo_weight, skip)
+            if pos < 0:
+                return False
+            skip += 1
+            target = vehicles[pos]
+            if target is not exclude and target.fits(client):
+                return self._move(client, source, target)
+        return False
+
+    # Обмен: client занимает место более легкого груза other в транспорте
+    # с наибольшим остатком, other переносится в третий транспорт
+    def _swap(self, client: Client, source: Vehicle) -> bool:
+        weight = client.cargo_weight
+        for skip in range(self.swap_candidates):
+            pos = self.index.largest(skip)
+            if pos < 0 or pos in self.closed:
+                return False
+            target = self.vehicles[pos]
+            free = target.capacity - target.current_load
+            for other in target.clients_list:
+                if not self._budget():
+                    return False
+                self.result.iterations += 1
+                if other.cargo_weight >= weight or free + other.cargo_weight < weight:
+                    continue
+                if not target.fits(client, without=other):
+                    continue
+                if self._relocate(other, target, exclude=target):
+                    if self._move(client, source, target):
+                        return True
+                    # Место в target проверено заранее, сюда попадать не должны
+                    self._undo(len(self.journal) - 1)
+        return False
+
+    # Отмена переносов журнала начиная с позиции mark
+    def _undo(self, mark: int):
+        journal = self.journal
+        while len(journal) > mark:
+            client, source = journal.pop()
+            target = self.company.vehicle_of(client)
+            # Обратный перенос может не пройти из-за погрешности сложения —
+            # тогда груз остается в новом транспорте (перегрузки нет)
+            if self.company.move_client(client, source):
+                self.result.moves -= 1
+                self._refresh(source)
+                self._refresh(target)
+
+    # Попытка опустошить транспорт source
+    def _empty(self, source: Vehicle) -> bool:
+        pos = self.position[source]
+        self.closed.add(pos)
+        self.index.update(pos, -1.0)
+        mark = len(self.journal)
+        for client in sorted(source.clients_list, key=lambda c: c.cargo_weight, reverse=True):
+            self.result.iterations += 1
+            if self._budget():
+                if self._relocate(client, source):
+                    continue
+                if self.swaps and self._swap(client, source):
+                    continue
+            # Бюджет исчерпан или груз некуда деть: транспорт остается как был
+            self._undo(mark)
+            self.closed.discard(pos)
+            self._refresh(source)
+            return False
+        return True
+
+    def run(self) -> ConsolidationResult:
+        started = time.perf_counter()
+        result = self.result
+        used = [v for v in self.vehicles if v.client_count]
+        result.vehicles_before = len(used)
+        used.sort(key=lambda v: v.current_load)
+        for vehicle in used:
+            if not self._budget():
+                break
+            # Транспорт мог принять грузы от уже освобожденного — это нормально
+            if vehicle.client_count and self._empty(vehicle):
+                result.freed.append(vehicle)
+            del self.journal[:]
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+# Уплотнение распределения компании: освобождает мало загруженный транспорт,
+# перекладывая его грузы в другой задействованный транспорт.
+# max_iterations и time_limit (секунды) ограничивают проход (None — без ограничения),
+# swaps=False — только переносы, без обменов
+def consolidate(company, max_iterations: Optional[int] = 100_000,
+                time_limit: Optional[float] = None, swaps: bool = True,
+                tries: int = 8, swap_candidates: int = 4) -> ConsolidationResult:
+    return _Consolidator(company, max_iterations, time_limit, swaps, tries, swap_candidates).run()
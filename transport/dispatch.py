@@ -0,0 +1,163 @@
+import heapq
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from transport.client import Client
+from transport.vehicle import Vehicle
+
+# Планирование рейсов: транспорт делает несколько рейсов за смену.
+#
+# Каждый рейс занимает duration(vehicle) часов, после чего транспорт снова
+# свободен. Очередь событий — куча (время освобождения, -грузоподъемность,
+# номер транспорта): рейс получает транспорт, который освобождается раньше
+# всех (при равенстве — более вместительный). Рейс заполняется по принципу
+# «лучший подходящий»: сначала VIP-клиенты, затем остальные, каждый раз
+# самый тяжелый груз, который еще помещается. Грузы хранятся в списках,
+# отсортированных по весу, поэтому поиск груза — бинарный.
+#
+# Сложность: O(рейсы * log транспорта + клиенты * log клиентов).
+#
+# План не изменяет компанию: транспорт считается пустым в начале смены,
+# объект Vehicle не загружается. Учитывается только вес груза.
+
+# Длительность рейса: число часов для всего транспорта или функция от транспорта
+Duration = Union[float, Callable[[Vehicle], float]]
+
+
+# Рейс: транспорт, начало и конец (часы от начала смены), клиенты, вес
+class Trip(NamedTuple):
+    vehicle: Vehicle
+    start: float
+    end: float
+    clients: List[Client]
+    load: float
+
+
+# Результат планирования
+class DispatchPlan:
+    def __init__(self, trips: List[Trip], unplaced: List[Client], horizon: float):
+        self.trips = trips          # в порядке отправления
+        self.unplaced = unplaced    # клиенты, не попавшие ни в один рейс
+        self.horizon = horizon
+
+    # Рейсы по транспорту: vehicle_id -> рейсы в порядке времени
+    def timeline(self) -> Dict[str, List[Trip]]:
+        result: Dict[str, List[Trip]] = {}
+        for trip in self.trips:
+            result.setdefault(trip.vehicle.vehicle_id, []).append(trip)
+        return result
+
+    # Время окончания последнего рейса
+    @property
+    def makespan(self) -> float:
+        return max((trip.end for trip in self.trips), default=0.0)
+
+    @property
+    def vehicles_used(self) -> int:
+        return len({id(trip.vehicle) for trip in self.trips})
+
+    # Сводка плана
+    def summary(self) -> Dict:
+        return {
+            "trips": len(self.trips),
+            "vehicles_used": self.vehicles_used,
+            "clients_served": sum(len(trip.clients) for trip in self.trips),
+            "unplaced": len(self.unplaced),
+            "unplaced_weight": sum(c.cargo_weight for c in self.unplaced),
+            "makespan": self.makespan,
+        }
+
+
+# Грузы, отсортированные по весу: самый тяжелый из помещающихся за O(log n).
+# Список ключей не меняется: забранный груз только помечается, а поиск
+# ближайшего незабранного слева идет по ссылкам «предыдущий незабранный»
+# со сжатием путей (почти O(1) в среднем), поэтому рейс не сдвигает список
+class _CargoPool:
+    def __init__(self, clients: Iterable[Client]):
+        self._keys: List[Tuple[float, int]] = []
+        self._clients: Dict[int, Client] = {}
+        for seq, client in enumerate(clients):
+            self._keys.append((client.cargo_weight, seq))
+            self._clients[seq] = client
+        self._keys.sort()
+        # _prev[k + 1] == k + 1 — груз k не забран; _prev[0] — граница слева
+        self._prev: List[int] = list(range(len(self._keys) + 1))
+        self._lightest = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    # Ближайший незабранный груз с номером не больше k, иначе -1
+    def _alive(self, k: int) -> int:
+        prev = self._prev
+        x = k + 1
+        while prev[x] != x:
+            prev[x] = prev[prev[x]]
+            x = prev[x]
+        return x - 1
+
+    # Самый легкий груз (inf — пусто)
+    def lightest(self) -> float:
+        keys, prev = self._keys, self._prev
+        k = self._lightest
+        while k < len(keys) and prev[k + 1] != k + 1:
+            k += 1
+        self._lightest = k
+        return keys[k][0] if k < len(keys) else float("inf")
+
+    # Забрать самый тяжелый груз, с которым загрузка load не превысит capacity
+    def take(self, load: float, capacity: float) -> Optional[Client]:
+        keys = self._keys
+        k = self._alive(bisect_right(keys, (capacity - load, float("inf"))) - 1)
+        # Остаток capacity - load может отличаться от проверки load + w <= capacity
+        # на погрешность округления — тогда берем следующий по весу
+        while k >= 0 and load + keys[k][0] > capacity:
+            k = self._alive(k - 1)
+        if k < 0:
+            return None
+        self._prev[k + 1] = k
+        return self._clients.pop(keys[k][1])
+
+    def rest(self) -> List[Client]:
+        return [self._clients[seq] for seq in sorted(self._clients)]
+
+
+# Планирование рейсов для клиентов clients на транспорте vehicles.
+# duration — длительность рейса (часы), horizon — длина смены: рейс должен
+# закончиться не позже horizon. available — время, с которого транспорт
+# свободен (vehicle_id -> часы, по умолчанию 0)
+def plan_trips(clients: Iterable[Client], vehicles: Iterable[Vehicle], duration: Duration,
+               horizon: float = 24.0, available: Optional[Dict[str, float]] = None) -> DispatchPlan:
+    clients = list(clients)
+    vehicles = list(vehicles)
+    available = available or {}
+    durations = [duration(v) if callable(duration) else duration for v in vehicles]
+    if any(d <= 0 for d in durations):
+        raise ValueError("Длительность рейса должна быть положительной")
+
+    pools = [_CargoPool(c for c in clients if c.is_vip),
+             _CargoPool(c for c in clients if not c.is_vip)]
+    heap = [(available.get(v.vehicle_id, 0.0), -v.capacity, i) for i, v in enumerate(vehicles)]
+    heapq.heapify(heap)
+    trips: List[Trip] = []
+    while heap and (pools[0] or pools[1]):
+        start, _, i = heapq.heappop(heap)
+        vehicle = vehicles[i]
+        end = start + durations[i]
+        # Рейс не успевает до конца смены — транспорт больше не используется
+        if end > horizon:
+            continue
+        # Транспорт, в который не помещается ни один груз, больше не нужен
+        if min(pools[0].lightest(), pools[1].lightest()) > vehicle.capacity:
+            continue
+        load = 0.0
+        loaded: List[Client] = []
+        for pool in pools:
+            while pool:
+                client = pool.take(load, vehicle.capacity)
+                if client is None:
+                    break
+                loaded.append(client)
+                load += client.cargo_weight
+        trips.append(Trip(vehicle, start, end, loaded, load))
+        heapq.heappush(heap, (end, -vehicle.capacity, i))
+    return DispatchPlan(trips, pools[0].rest() + pools[1].rest(), horizon)
@@ -0,0 +1,206 @@
+from collections import Counter, deque
+from typing import List, Optional, Tuple
+
+# События транспортной компании.
+# Ядро вызывает методы получателя (sink) и само ничего не печатает:
+# форматирование и вывод происходят только у подписанных получателей.
+
+# Виды событий
+VEHICLE_ADDED = "vehicle_added"
+CLIENT_ADDED = "client_added"
+LOADED = "loaded"
+REJECTED = "rejected"
+CLIENT_UNPLACED = "client_unplaced"
+UNLOADED = "unloaded"
+VEHICLE_REMOVED = "vehicle_removed"
+CLIENT_REMOVED = "client_removed"
+
+
+# Получатель событий по умолчанию — ничего не делает
+class EventSink:
+    # Добавлен транспорт
+    def vehicle_added(self, vehicle):
+        pass
+
+    # Добавлен клиент
+    def client_added(self, client):
+        pass
+
+    # Груз клиента загружен в транспорт
+    def loaded(self, vehicle, client):
+        pass
+
+    # Транспорт отказал клиенту (не хватает места)
+    def rejected(self, vehicle, client):
+        pass
+
+    # Клиента не удалось разместить ни в одном транспорте
+    def client_unplaced(self, client):
+        pass
+
+    # Груз клиента выгружен из транспорта
+    def unloaded(self, vehicle, client):
+        pass
+
+    # Транспорт удален из компании
+    def vehicle_removed(self, vehicle):
+        pass
+
+    # Клиент удален из компании
+    def client_removed(self, client):
+        pass
+
+    # Транспорт заменен новым на том же месте списка
+    # (по умолчанию — как удаление старого и добавление нового)
+    def vehicle_replaced(self, old, new):
+        self.vehicle_removed(old)
+        self.vehicle_added(new)
+
+    # Клиент заменен новым на том же месте списка
+    def client_replaced(self, old, new):
+        self.client_removed(old)
+        self.client_added(new)
+
+
+# Общий пустой получатель
+NULL_SINK = EventSink()
+
+
+# Получатель, который складывает события в буфер (kind, объекты...)
+class BufferedSink(EventSink):
+    def __init__(self, maxlen: Optional[int] = None):
+        # maxlen ограничивает буфер: старые события вытесняются
+        self.events: deque = deque(maxlen=maxlen)
+
+    def vehicle_added(self, vehicle):
+        self.events.append((VEHICLE_ADDED, vehicle))
+
+    def client_added(self, client):
+        self.events.append((CLIENT_ADDED, client))
+
+    def loaded(self, vehicle, client):
+        self.events.append((LOADED, vehicle, client))
+
+    def rejected(self, vehicle, client):
+        self.events.append((REJECTED, vehicle, client))
+
+    def client_unplaced(self, client):
+        self.events.append((CLIENT_UNPLACED, client))
+
+    def unloaded(self, vehicle, client):
+        self.events.append((UNLOADED, vehicle, client))
+
+    def vehicle_removed(self, vehicle):
+        self.events.append((VEHICLE_REMOVED, vehicle))
+
+    def client_removed(self, client):
+        self.events.append((CLIENT_REMOVED, client))
+
+    # Забрать накопленные события и очистить буфер
+    def drain(self) -> List[Tuple]:
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+
+# Получатель, который только считает события по видам
+class CountingSink(EventSink):
+    def __init__(self):
+        self.counts: Counter = Counter()
+
+    def vehicle_added(self, vehicle):
+        self.counts[VEHICLE_ADDED] += 1
+
+    def client_added(self, client):
+        self.counts[CLIENT_ADDED] += 1
+
+    def loaded(self, vehicle, client):
+        self.counts[LOADED] += 1
+
+    def rejected(self, vehicle, client):
+        self.counts[REJECTED] += 1
+
+    def client_unplaced(self, client):
+        self.counts[CLIENT_UNPLACED] += 1
+
+    def unloaded(self, vehicle, client):
+        self.counts[UNLOADED] += 1
+
+    def vehicle_removed(self, vehicle):
+        self.counts[VEHICLE_REMOVED] += 1
+
+    def client_removed(self, client):
+        self.counts[CLIENT_REMOVED] += 1
+
+
+# Получатель, который печатает события в консоль (для учебных программ)
+class PrintSink(EventSink):
+    def vehicle_added(self, vehicle):
+        print(f"Добавлен транспорт: {vehicle}")
+
+    def client_added(self, client):
+        print(f"Добавлен клиент: {client}")
+
+    def loaded(self, vehicle, client):
+        print(f"Загружен клиент {client.name}, текущая загрузка: {vehicle.current_load} т")
+
+    def rejected(self, vehicle, client):
+        print(f"Не хватает места для клиента {client.name}")
+
+    def client_unplaced(self, client):
+        print(f"Не удалось загрузить клиента {client.name}, не хватает места")
+
+    def unloaded(self, vehicle, client):
+        print(f"Выгружен клиент {client.name}, текущая загрузка: {vehicle.current_load} т")
+
+    def vehicle_removed(self, vehicle):
+        print(f"Удален транспорт: {vehicle}")
+
+    def client_removed(self, client):
+        print(f"Удален клиент: {client}")
+
+
+# Рассылка событий нескольким получателям
+class FanoutSink(EventSink):
+    def __init__(self, *sinks: EventSink):
+        self.sinks = list(sinks)
+
+    def vehicle_added(self, vehicle):
+        for sink in self.sinks:
+            sink.vehicle_added(vehicle)
+
+    def client_added(self, client):
+        for sink in self.sinks:
+            sink.client_added(client)
+
+    def loaded(self, vehicle, client):
+        for sink in self.sinks:
+            sink.loaded(vehicle, client)
+
+    def rejected(self, vehicle, client):
+        for sink in self.sinks:
+            sink.rejected(vehicle, client)
+
+    def client_unplaced(self, client):
+        for sink in self.sinks:
+            sink.client_unplaced(client)
+
+    def unloaded(self, vehicle, client):
+        for sink in self.sinks:
+            sink.unloaded(vehicle, client)
+
+    def vehicle_removed(self, vehicle):
+        for sink in self.sinks:
+            sink.vehicle_removed(vehicle)
+
+    def client_removed(self, client):
+        for sink in self.sinks:
+            sink.client_removed(client)
+
+    def vehicle_replaced(self, old, new):
+        for sink in self.sinks:
+            sink.vehicle_replaced(old, new)
+
+    def client_replaced(self, old, new):
+        for sink in self.sinks:
+            sink.client_replaced(old, new)
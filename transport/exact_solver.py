@@ -0,0 +1,202 @@
+import time
+from typing import List, Optional
+from transport.packing import BestFitDecreasing, PackingStrategy, register_strategy
+
+# Точное (или близкое к точному) распределение методом ветвей и границ.
+# Цель сравнивается лексикографически:
+#   1) меньше неразмещенных VIP клиентов,
+#   2) меньше неразмещенных обычных клиентов,
+#   3) меньше задействованного транспорта.
+# Начальное решение — best-fit-decreasing, затем поиск улучшает его,
+# пока не закончится время. По истечении time_limit возвращается
+# лучшее найденное решение.
+
+
+@register_strategy
+class ExactSolver(PackingStrategy):
+    name = "exact"
+
+    def __init__(self, time_limit: float = 5.0, node_limit: Optional[int] = None):
+        if not isinstance(time_limit, (int, float)) or time_limit <= 0:
+            raise ValueError("Лимит времени должен быть положительным числом")
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        # Сведения о последнем запуске
+        self.nodes = 0
+        self.proven_optimal = False
+        self.elapsed = 0.0
+
+    def assign(self, order, weights, vip, capacities, loads):
+        start = time.perf_counter()
+        deadline = start + self.time_limit
+        items = list(order)
+        n = len(items)
+        m = len(capacities)
+        loads = list(loads)
+        opened = [l > 0 for l in loads]
+        used = sum(opened)
+
+        # Начальное решение — жадное (его поиск тоже входит в счетчики)
+        greedy = BestFitDecreasing()
+        greedy.stats = {}
+        best = greedy.assign(items, weights, vip, capacities, loads)
+        lookups = greedy.stats["index_lookups"]
+        checks = greedy.stats["fit_checks"]
+        best_score = self._score(best, items, vip, weights, capacities, loads)
+
+        # Суффиксные суммы: вес оставшихся грузов и число "больших" грузов.
+        # Большой груз тяжелее половины самого вместительного транспорта,
+        # два таких груза не поместятся в один транспорт (идея оценки L2)
+        half = max(capacities, default=0) / 2
+        rest_weight = [0.0] * (n + 1)
+        rest_big = [0] * (n + 1)
+        for k in range(n - 1, -1, -1):
+            w = weights[items[k]]
+            rest_weight[k] = rest_weight[k + 1] + w
+            rest_big[k] = rest_big[k + 1] + (w > half)
+        by_capacity = sorted(range(m), key=lambda v: -capacities[v])
+
+        assignment = [-1] * len(weights)
+        choices: List[Optional[list]] = [None] * (n + 1)
+        position = [0] * (n + 1)
+        applied: List[Optional[tuple]] = [None] * (n + 1)
+        vip_left = 0
+        regular_left = 0
+        nodes = 0
+        stopped = False
+        k = 0
+        enter = True
+        while k >= 0:
+            if enter:
+                nodes += 1
+                if nodes & 1023 == 0:
+                    if time.perf_counter() > deadline or (self.node_limit and nodes > self.node_limit):
+                        stopped = True
+                        break
+                    if self.progress is not None or self.should_stop is not None:
+                        self._report(k, n, n - best_score[0] - best_score[1], best_score[2])
+                applied[k] = None
+                prune = (vip_left, regular_left) > best_score[:2]
+                if not prune and k == n:
+                    score = (vip_left, regular_left, used)
+                    if score < best_score:
+                        best_score = score
+                        best = assignment[:]
+                    prune = True
+                elif not prune and (vip_left, regular_left) == best_score[:2]:
+                    # Ничья по неразмещенным: все оставшиеся грузы должны
+                    # поместиться, а транспорта — меньше, чем в рекорде
+                    prune = used + self._extra_vehicles(
+                        rest_weight[k], rest_big[k], half, capacities, loads, opened, by_capacity
+                    ) >= best_score[2]
+                if prune:
+                    k -= 1
+                    enter = False
+                    continue
+                choices[k] = self._choices(weights[items[k]], capacities, loads, opened)
+                # Выбор вариантов — просмотр всего транспорта
+                lookups += 1
+                checks += m
+                position[k] = 0
+            # Отменяем предыдущий выбор на этом уровне
+            undo = applied[k]
+            if undo is not None:
+                v, prev_load, was_opened = undo
+                i = items[k]
+                if v < 0:
+                    if vip[i]:
+                        vip_left -= 1
+                    else:
+                        regular_left -= 1
+                else:
+                    loads[v] = prev_load
+                    if not was_opened:
+                        opened[v] = False
+                        used -= 1
+                assignment[i] = -1
+                applied[k] = None
+            if position[k] == len(choices[k]):
+                k -= 1
+                enter = False
+                continue
+            v = choices[k][position[k]]
+            position[k] += 1
+            i = items[k]
+            if v < 0:
+                if vip[i]:
+                    vip_left += 1
+                else:
+                    regular_left += 1
+                applied[k] = (v, 0.0, True)
+            else:
+                applied[k] = (v, loads[v], opened[v])
+                loads[v] += weights[i]
+                if not opened[v]:
+                    opened[v] = True
+                    used += 1
+            assignment[i] = v
+            k += 1
+            enter = True
+
+        self.nodes = nodes
+        self.proven_optimal = not stopped
+        self.elapsed = time.perf_counter() - start
+        self._count(lookups, checks, sum(1 for v in best if v >= 0))
+        return best
+
+    # Варианты для груза: задействованный транспорт (лучший остаток первым),
+    # по одному пустому транспорту каждой вместимости, затем "не размещать"
+    @staticmethod
+    def _choices(w, capacities, loads, opened):
+        fits = []
+        seen = set()
+        spare = {}
+        for v in range(len(capacities)):
+            if loads[v] + w > capacities[v]:
+                continue
+            if opened[v]:
+                state = (capacities[v], loads[v])
+                if state not in seen:
+                    seen.add(state)
+                    fits.append(v)
+            elif capacities[v] not in spare:
+                spare[capacities[v]] = v
+        fits.sort(key=lambda v: capacities[v] - loads[v])
+        fits.extend(sorted(spare.values(), key=lambda v: -capacities[v]))
+        fits.append(-1)
+        return fits
+
+    # Нижняя оценка числа нового транспорта для оставшихся грузов
+    @staticmethod
+    def _extra_vehicles(rest_weight, rest_big, half, capacities, loads, opened, by_capacity):
+        free = 0.0
+        absorb = 0
+        for v in range(len(capacities)):
+            if opened[v]:
+                f = capacities[v] - loads[v]
+                free += f
+                if f > half:
+                    absorb += 1
+        need = rest_weight - free
+        extra = 0
+        if need > 1e-9:
+            for v in by_capacity:
+                if opened[v]:
+                    continue
+                extra += 1
+                need -= capacities[v]
+                if need <= 1e-9:
+                    break
+            else:
+                # Даже весь пустой транспорт не вмещает остаток
+                return len(capacities) + 1
+        return max(extra, rest_big - absorb)
+
+    # Оценка готового решения
+    @staticmethod
+    def _score(assignment, items, vip, weights, capacities, loads):
+        vip_left = sum(1 for i in items if assignment[i] < 0 and vip[i])
+        regular_left = sum(1 for i in items if assignment[i] < 0 and not vip[i])
+        used = {v for v in range(len(loads)) if loads[v] > 0}
+        used.update(assignment[i] for i in items if assignment[i] >= 0)
+        return vip_left, regular_left, len(used)
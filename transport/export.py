@@ -0,0 +1,204 @@
+import csv
+import io
+import json
+import os
+import struct
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.events import EventSink
+
+# Потоковая выгрузка результата распределения в файл.
+# Строки формируются по одной прямо из состояния компании и сразу уходят
+# в буферизованный файл — полная копия вывода в памяти не собирается.
+#
+# Одна строка на клиента: client_id, name, cargo_weight, is_vip,
+# vehicle_id (пусто — не загружен), status.
+#
+# Форматы:
+#   csv    заголовок и строки CSV
+#   jsonl  по одному JSON-объекту в строке
+#   bin    колонки: заголовок, веса (double), VIP (byte), статусы (byte),
+#          затем строки client_id, name, vehicle_id (длина uint16 + UTF-8)
+
+FORMATS = ("csv", "jsonl", "bin")
+FIELDS = ("client_id", "name", "cargo_weight", "is_vip", "vehicle_id", "status")
+
+# Статусы строк
+UNPLACED = "unplaced"
+PLACED = "placed"
+REMOVED = "removed"   # только при выгрузке изменений
+_STATUS_CODES = {UNPLACED: 0, PLACED: 1, REMOVED: 2}
+_STATUS_NAMES = {code: name for name, code in _STATUS_CODES.items()}
+
+MAGIC = b"TCEXP\x00\x00\x01"
+VERSION = 1
+_HEADER = struct.Struct("<8sHxxQ")
+_TEXT = struct.Struct("<H")
+
+# Размер буфера файла и число строк в одном блоке колонки
+BUFFER_SIZE = 1 << 16
+CHUNK_ROWS = 1 << 14
+
+
+# Формат по расширению файла
+def _format_of(path: str, fmt: Optional[str]) -> str:
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}")
+    return fmt
+
+
+# Где клиент: (vehicle_id или "", статус)
+def _placement(company: TransportCompany, client: Client) -> Tuple[str, str]:
+    if not company.has_client(client):
+        return "", REMOVED
+    vehicle = company.vehicle_of(client)
+    if vehicle is None:
+        return "", UNPLACED
+    return vehicle.vehicle_id, PLACED
+
+
+# Строка выгрузки для клиента
+def _row(company: TransportCompany, client: Client) -> Tuple:
+    return (client.client_id, client.name, client.cargo_weight, client.is_vip,
+            *_placement(company, client))
+
+
+# Текстовые форматы пишутся через обертку над буферизованным файлом
+def _write_csv(f: BinaryIO, company: TransportCompany, clients: List[Client]):
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(FIELDS)
+    for client in clients:
+        writer.writerow(_row(company, client))
+    text.flush()
+    text.detach()
+
+
+def _write_jsonl(f: BinaryIO, company: TransportCompany, clients: List[Client]):
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="\n")
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for client in clients:
+        text.write(encode(dict(zip(FIELDS, _row(company, client)))) + "\n")
+    text.flush()
+    text.detach()
+
+
+def _write_text(f: BinaryIO, value: Optional[str]):
+    data = (value or "").encode("utf-8")
+    f.write(_TEXT.pack(len(data)))
+    f.write(data)
+
+
+# Колонки пишутся блоками по CHUNK_ROWS строк
+def _write_bin(f: BinaryIO, company: TransportCompany, clients: List[Client]):
+    f.write(_HEADER.pack(MAGIC, VERSION, len(clients)))
+    for typecode, column in (("d", lambda c: c.cargo_weight),
+                             ("b", lambda c: c.is_vip),
+                             ("b", lambda c: _STATUS_CODES[_placement(company, c)[1]])):
+        for start in range(0, len(clients), CHUNK_ROWS):
+            f.write(array(typecode, [column(c) for c in clients[start:start + CHUNK_ROWS]]).tobytes())
+    for client in clients:
+        _write_text(f, client.client_id)
+    for client in clients:
+        _write_text(f, client.name)
+    for client in clients:
+        _write_text(f, _placement(company, client)[0])
+
+
+_WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "bin": _write_bin}
+
+
+# Выгрузка строк указанных клиентов (все клиенты компании по умолчанию).
+# fmt — "csv", "jsonl" или "bin" (None — по расширению файла).
+# Файл заменяется атомарно. Возвращает число строк
+def export_distribution(company: TransportCompany, path: str, fmt: Optional[str] = None,
+                        clients: Optional[List[Client]] = None) -> int:
+    writer = _WRITERS[_format_of(path, fmt)]
+    if clients is None:
+        clients = company.clients
+    tmp = path + ".tmp"
+    with open(tmp, "wb", buffering=BUFFER_SIZE) as f:
+        writer(f, company, clients)
+    os.replace(tmp, path)
+    return len(clients)
+
+
+# Чтение двоичной выгрузки: строки в том же виде, что и в CSV/JSONL
+def read_binary_export(path: str) -> Iterator[Tuple]:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, rows = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Файл не является выгрузкой распределения: {path}")
+    offset = _HEADER.size
+    weights = array("d", data[offset:offset + 8 * rows])
+    offset += 8 * rows
+    vip = array("b", data[offset:offset + rows])
+    offset += rows
+    status = array("b", data[offset:offset + rows])
+    offset += rows
+    columns = []
+    for _ in range(3):
+        column = []
+        for _ in range(rows):
+            (length,) = _TEXT.unpack_from(data, offset)
+            offset += _TEXT.size
+            column.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        columns.append(column)
+    ids, names, vehicle_ids = columns
+    for i in range(rows):
+        yield ids[i], names[i], weights[i], bool(vip[i]), vehicle_ids[i], _STATUS_NAMES[status[i]]
+
+
+# Выгрузка с учетом изменений: подписывается на события компании и
+# запоминает клиентов, чья строка изменилась после последней выгрузки
+class Exporter(EventSink):
+    def __init__(self, company: TransportCompany):
+        self.company = company
+        self.revision = 0   # номер последней выгрузки (0 — еще не было)
+        self._changed: Dict[str, Client] = {}
+        company.subscribe(self)
+
+    def _touch(self, client: Client):
+        if client.client_id is not None:
+            self._changed[client.client_id] = client
+
+    def client_added(self, client):
+        self._touch(client)
+
+    def client_removed(self, client):
+        self._touch(client)
+
+    def loaded(self, vehicle, client):
+        self._touch(client)
+
+    def unloaded(self, vehicle, client):
+        self._touch(client)
+
+    def vehicle_added(self, vehicle):
+        # Транспорт мог прийти уже загруженным
+        for client in vehicle.clients_list:
+            self._touch(client)
+
+    # Число строк, изменившихся после последней выгрузки
+    @property
+    def pending(self) -> int:
+        return len(self._changed)
+
+    # Выгрузка: changed_only=True — только изменения после прошлой выгрузки
+    # (удаленные клиенты — со статусом "removed"), иначе все клиенты.
+    # Возвращает число строк
+    def export(self, path: str, fmt: Optional[str] = None, changed_only: bool = False) -> int:
+        clients = list(self._changed.values()) if changed_only and self.revision else None
+        count = export_distribution(self.company, path, fmt, clients)
+        self._changed.clear()
+        self.revision += 1
+        return count
+
+    # Отписка от событий компании
+    def close(self):
+        self.company.unsubscribe(self)
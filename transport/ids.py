@@ -0,0 +1,47 @@
+import itertools
+import random
+import uuid
+from typing import Optional
+
+# Генератор идентификаторов транспорта.
+# Объект хранит целое число, строка ID создается только при обращении.
+
+
+class IdGenerator:
+    def __init__(self, seed: Optional[int] = None, sequential: bool = False):
+        # sequential=True — монотонные номера 1, 2, 3, ...
+        # seed — воспроизводимые случайные ID (для тестов и повторяемых прогонов)
+        self.sequential = sequential
+        if sequential:
+            self._counter = itertools.count(1)
+        else:
+            self._random = random.Random(seed)
+
+    # Следующий числовой ID
+    def next(self) -> int:
+        if self.sequential:
+            return next(self._counter)
+        return self._random.getrandbits(128)
+
+    # Строковое представление ID
+    def format(self, number: int) -> str:
+        if self.sequential:
+            return str(number)
+        return str(uuid.UUID(int=number, version=4))
+
+
+# Текущий генератор (по умолчанию — случайные ID в формате UUID)
+_generator = IdGenerator()
+
+
+# Замена генератора ID, возвращает предыдущий
+def set_id_generator(generator: IdGenerator) -> IdGenerator:
+    global _generator
+    if not isinstance(generator, IdGenerator):
+        raise TypeError("Генератор должен быть IdGenerator")
+    previous, _generator = _generator, generator
+    return previous
+
+
+def get_id_generator() -> IdGenerator:
+    return _generator
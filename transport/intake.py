@@ -0,0 +1,228 @@
+import asyncio
+import json
+from typing import List, Optional, Tuple, Union
+from transport.client import Client
+from transport.company import TransportCompany
+from transport.loader import client_from_row
+from transport.packing import PackingStrategy
+from transport.vehicle import Vehicle
+
+# Прием заказов через asyncio с размещением пачками.
+# Заказы копятся в очереди и размещаются одним вызовом place_clients,
+# когда набирается batch_size заказов или проходит window секунд
+# с первого заказа пачки. Компания изменяется только из цикла событий,
+# поэтому блокировки не нужны.
+#
+# Сетевой протокол (TCP, по строке JSON на заказ, как в JSONL-загрузке):
+#   запрос   {"name": "Ivan", "cargo_weight": 2.5, "is_vip": false, ...}
+#   ответ    {"client_id": "C1", "vehicle_id": "V7", "status": "placed"}
+#            {"client_id": "C2", "vehicle_id": null, "status": "unplaced"}
+#            {"error": "..."}
+# В одном соединении можно отправлять заказы, не дожидаясь ответов:
+# ответы приходят в порядке запросов.
+
+PLACED = "placed"
+UNPLACED = "unplaced"
+
+Order = Tuple[Client, asyncio.Future]
+
+
+class OrderIntake:
+    def __init__(self, company: TransportCompany, strategy: Union[str, PackingStrategy] = "bfd",
+                 window: float = 0.002, batch_size: int = 512):
+        # window — наибольшее ожидание пачки (с), batch_size — размер пачки
+        if window < 0:
+            raise ValueError("Окно пачки должно быть неотрицательным")
+        if batch_size <= 0:
+            raise ValueError("Размер пачки должен быть положительным")
+        self.company = company
+        self.strategy = strategy
+        self.window = window
+        self.batch_size = batch_size
+        # Статистика: failed — запросы, на которые ответ не получен или
+        # получен с ошибкой (неверный заказ, сбой размещения, разрыв соединения)
+        self.orders = 0
+        self.batches = 0
+        self.failed = 0
+        self._pending: List[Order] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # Запуск цикла размещения (в работающем цикле событий)
+    async def start(self):
+        if self._task is not None:
+            raise RuntimeError("Прием заказов уже запущен")
+        self._wake = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    # Остановка: оставшиеся заказы размещаются
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._flush()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # Заказ в очередь; future получит транспорт (None — не поместился)
+    def submit_nowait(self, client: Client) -> asyncio.Future:
+        if self._task is None:
+            raise RuntimeError("Прием заказов не запущен")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((client, future))
+        if len(self._pending) == 1:
+            self._wake.set()
+        if len(self._pending) >= self.batch_size:
+            self._full.set()
+        return future
+
+    # Заказ с ожиданием размещения: транспорт или None
+    async def submit(self, client: Client) -> Optional[Vehicle]:
+        return await self.submit_nowait(client)
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            if len(self._pending) < self.batch_size and self.window > 0:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+            self._flush()
+            # Отдаем управление, чтобы заказы успели накопиться
+            await asyncio.sleep(0)
+
+    # Размещение накопленной пачки
+    def _flush(self):
+        batch, self._pending = self._pending, []
+        self._wake.clear()
+        self._full.clear()
+        if not batch:
+            return
+        company = self.company
+        clients = []
+        for client, future in batch:
+            # Повторный client_id и т.п. — ошибка только этого заказа
+            try:
+                company.add_client(client)
+            except (TypeError, ValueError) as e:
+                future.set_exception(e)
+            else:
+                clients.append((client, future))
+        try:
+            company.place_clients([c for c, _ in clients], self.strategy)
+        except Exception as e:
+            for _, future in clients:
+                future.set_exception(e)
+        else:
+            vehicle_of = company.vehicle_of
+            for client, future in clients:
+                if not future.done():
+                    future.set_result(vehicle_of(client))
+        self.orders += len(batch)
+        self.batches += 1
+
+    # --- сетевой сервис --- #
+
+    # Ответ на заказ в виде словаря
+    @staticmethod
+    def _reply(client: Client, vehicle: Optional[Vehicle]) -> dict:
+        return {"client_id": client.client_id,
+                "vehicle_id": vehicle.vehicle_id if vehicle is not None else None,
+                "status": PLACED if vehicle is not None else UNPLACED}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Ответы пишет отдельная задача в порядке запросов
+        replies: asyncio.Queue = asyncio.Queue()
+        sender = asyncio.get_running_loop().create_task(self._send(replies, writer))
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        # Весь обмен — в одном try: разрыв, тайм-аут или слишком длинная
+        # строка (ValueError из readline) завершают только это соединение
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if not isinstance(row, dict):
+                        raise ValueError("Заказ должен быть объектом JSON")
+                    client = client_from_row(row)
+                    replies.put_nowait((client, self.submit_nowait(client)))
+                except (TypeError, ValueError, RuntimeError) as e:
+                    self.failed += 1
+                    replies.put_nowait((None, encode({"error": str(e)})))
+        except Exception:
+            self.failed += 1
+        finally:
+            replies.put_nowait(None)
+            await sender
+            writer.close()
+
+    async def _send(self, replies: asyncio.Queue, writer: asyncio.StreamWriter):
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        broken = False
+        while True:
+            item = await replies.get()
+            if item is None:
+                break
+            client, result = item
+            # Ответ с ошибкой уже учтен в failed (при разборе или здесь)
+            ok = client is not None
+            if ok:
+                try:
+                    text = encode(self._reply(client, await result))
+                except Exception as e:
+                    # Заказ не принят или пачка не разместилась
+                    self.failed += 1
+                    ok = False
+                    text = encode({"error": str(e)})
+            else:
+                text = result
+            if broken:
+                # Соединение разорвано: ответ не доставлен
+                self.failed += ok
+                continue
+            try:
+                writer.write(text.encode("utf-8") + b"\n")
+                # Сброс буфера, только когда больше нечего отправить
+                if replies.empty():
+                    await writer.drain()
+            except Exception:
+                # Оставшиеся ответы только учитываются, чтение прекращается
+                self.failed += ok
+                broken = True
+                writer.transport.abort()
+
+    # Сетевой сервис на host:port (port=0 — свободный порт)
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        if self._task is None:
+            await self.start()
+        return await asyncio.start_server(self._handle, host, port)
+
+
+# Запуск сервиса до остановки процесса (Ctrl+C)
+async def run_service(company: TransportCompany, host: str = "127.0.0.1", port: int = 8765,
+                      strategy: Union[str, PackingStrategy] = "bfd",
+                      window: float = 0.002, batch_size: int = 512):
+    intake = OrderIntake(company, strategy, window, batch_size)
+    server = await intake.serve(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await intake.stop()
@@ -0,0 +1,319 @@
+import math
+import os
+import struct
+from array import array
+from typing import BinaryIO, Dict, Optional, Tuple
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.truck import Truck
+from transport.train import Train
+from transport.company import TransportCompany
+from transport.events import EventSink
+from transport.columnar import TRAIN, TRUCK, VEHICLE
+from transport.snapshot import load_snapshot, save_snapshot, snapshot_generation
+
+# Журнал изменений компании (только дозапись).
+# После перезапуска загружается снимок и воспроизводятся только записи
+# журнала, сделанные после него.
+#
+# Клиенты и транспорт в журнале обозначаются порядковыми номерами:
+# сначала — в порядке снимка, затем по мере добавления.
+# Запись: код операции (1 байт), длина данных (4 байта), данные.
+#
+# Первая запись файла — поколение журнала. checkpoint() сначала пишет снимок
+# следующего поколения, затем заменяет журнал пустым этого же поколения.
+# Если сбой случился между ними, журнал старого поколения при открытии
+# пропускается: его изменения уже есть в снимке.
+
+ADD_CLIENT = 1
+REMOVE_CLIENT = 2
+ADD_VEHICLE = 3
+REMOVE_VEHICLE = 4
+LOAD = 5
+UNLOAD = 6
+REPLACE_CLIENT = 7
+REPLACE_VEHICLE = 8
+GENERATION = 9
+
+_RECORD = struct.Struct("<BI")
+_NUMBER = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_CLIENT = struct.Struct("<dBdI")
+_VEHICLE = struct.Struct("<BIdQQdd")
+_TEXT = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+_GENERATION = struct.Struct("<Q")
+
+
+def _pack_text(text: Optional[str]) -> bytes:
+    data = (text or "").encode("utf-8")
+    return _TEXT.pack(len(data)) + data
+
+
+def _unpack_text(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _TEXT.unpack_from(data, offset)
+    offset += _TEXT.size
+    return data[offset:offset + length].decode("utf-8"), offset + length
+
+
+def _pack_client(client: Client) -> bytes:
+    return (_CLIENT.pack(client.cargo_weight, client.is_vip, client.volume, client.pallets)
+            + _pack_text(client.name) + _pack_text(client.client_id))
+
+
+def _unpack_client(payload: bytes, offset: int = 0) -> Client:
+    weight, vip, volume, pallets = _CLIENT.unpack_from(payload, offset)
+    name, offset = _unpack_text(payload, offset + _CLIENT.size)
+    client_id, _ = _unpack_text(payload, offset)
+    return Client(name, weight, bool(vip), client_id or None, volume, pallets)
+
+
+def _pack_vehicle(vehicle: Vehicle) -> bytes:
+    if isinstance(vehicle, Truck):
+        kind, cars, color = TRUCK, 0, vehicle.color
+    elif isinstance(vehicle, Train):
+        kind, cars, color = TRAIN, vehicle.number_of_cars, None
+    else:
+        kind, cars, color = VEHICLE, 0, None
+    payload = _VEHICLE.pack(kind, cars, vehicle.capacity,
+                            vehicle.uid >> 64, vehicle.uid & 0xFFFFFFFFFFFFFFFF,
+                            vehicle.volume_capacity, vehicle.pallet_capacity)
+    # Пределы вагонов поезда: число и массив double (0 — без вагонов)
+    car_capacity = getattr(vehicle, "car_capacities", None) or ()
+    return (payload + _pack_text(vehicle.vehicle_id) + _pack_text(color)
+            + _COUNT.pack(len(car_capacity)) + array("d", car_capacity).tobytes())
+
+
+def _unpack_vehicle(payload: bytes, offset: int = 0) -> Vehicle:
+    kind, cars, capacity, uid_high, uid_low, volume, pallets = _VEHICLE.unpack_from(payload, offset)
+    vehicle_id, offset = _unpack_text(payload, offset + _VEHICLE.size)
+    color, offset = _unpack_text(payload, offset)
+    (count,) = _COUNT.unpack_from(payload, offset)
+    offset += _COUNT.size
+    car_capacity = array("d", payload[offset:offset + 8 * count]).tolist() or None
+    volume = None if volume == math.inf else volume
+    pallets = None if pallets == math.inf else int(pallets)
+    if kind == TRUCK:
+        vehicle = Truck(capacity, color, volume, pallets)
+    elif kind == TRAIN:
+        vehicle = Train(capacity, cars, volume, pallets, car_capacity=car_capacity)
+    else:
+        vehicle = Vehicle(capacity, volume, pallets)
+    vehicle.uid = (uid_high << 64) | uid_low
+    vehicle.vehicle_id = vehicle_id
+    return vehicle
+
+
+# Получатель событий, который пишет их в журнал
+class Journal(EventSink):
+    def __init__(self, company: TransportCompany, path: str, sync: bool = False,
+                 generation: int = 0):
+        # sync=True — fsync после каждой записи (надежнее, но медленнее).
+        # generation — поколение снимка, с которого начинается журнал
+        self.company = company
+        self.path = path
+        self.sync = sync
+        self.generation = generation
+        self._numbers: Dict[object, int] = {}
+        self._objects: Dict[int, object] = {}
+        self._next = 0
+        self._renumber()
+        self._file: Optional[BinaryIO] = None
+
+    # Нумерация по текущему состоянию компании (порядок снимка)
+    def _renumber(self):
+        self._numbers.clear()
+        self._objects.clear()
+        self._next = 0
+        for obj in list(self.company.vehicles) + list(self.company.clients):
+            self._number(obj)
+
+    def _number(self, obj) -> int:
+        number = self._next
+        self._next += 1
+        self._numbers[obj] = number
+        self._objects[number] = obj
+        return number
+
+    def _forget(self, obj) -> int:
+        number = self._numbers.pop(obj)
+        del self._objects[number]
+        return number
+
+    # Запись поколения — первая запись журнала
+    def _header(self) -> bytes:
+        return _RECORD.pack(GENERATION, _GENERATION.size) + _GENERATION.pack(self.generation)
+
+    def _write(self, op: int, payload: bytes):
+        if self._file is None:
+            self._file = open(self.path, "ab")
+            if self._file.tell() == 0:
+                self._file.write(self._header())
+        self._file.write(_RECORD.pack(op, len(payload)) + payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    # --- запись событий --- #
+
+    def client_added(self, client):
+        self._write(ADD_CLIENT, _pack_client(client))
+        self._number(client)
+
+    def client_removed(self, client):
+        self._write(REMOVE_CLIENT, _NUMBER.pack(self._forget(client)))
+
+    # Замена — одной записью, чтобы при воспроизведении сохранить место в списке
+    def client_replaced(self, old, new):
+        self._write(REPLACE_CLIENT, _NUMBER.pack(self._forget(old)) + _pack_client(new))
+        self._number(new)
+
+    def vehicle_added(self, vehicle):
+        self._write(ADD_VEHICLE, _pack_vehicle(vehicle))
+        self._number(vehicle)
+        # Транспорт мог прийти уже загруженным
+        for client in vehicle.clients_list:
+            self.loaded(vehicle, client)
+
+    def vehicle_removed(self, vehicle):
+        self._write(REMOVE_VEHICLE, _NUMBER.pack(self._forget(vehicle)))
+
+    def vehicle_replaced(self, old, new):
+        self._write(REPLACE_VEHICLE, _NUMBER.pack(self._forget(old)) + _pack_vehicle(new))
+        self._number(new)
+        for client in new.clients_list:
+            self.loaded(new, client)
+
+    def loaded(self, vehicle, client):
+        if client in self._numbers and vehicle in self._numbers:
+            self._write(LOAD, _PAIR.pack(self._numbers[client], self._numbers[vehicle]))
+
+    def unloaded(self, vehicle, client):
+        if client in self._numbers:
+            self._write(UNLOAD, _NUMBER.pack(self._numbers[client]))
+
+    # --- воспроизведение --- #
+
+    # Применение записей журнала к компании, возвращает их число.
+    # Журнал старшего поколения, чем снимок (сбой во время checkpoint),
+    # не воспроизводится и очищается.
+    # Недописанная последняя запись (сбой во время записи) отбрасывается
+    def replay(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offset = 0
+        count = 0
+        # Журнал без записи поколения — поколение 0
+        generation = 0
+        if len(data) >= _RECORD.size + _GENERATION.size:
+            op, length = _RECORD.unpack_from(data, 0)
+            if op == GENERATION:
+                (generation,) = _GENERATION.unpack_from(data, _RECORD.size)
+                offset = _RECORD.size + length
+        if generation < self.generation:
+            self._reset_file()
+            return 0
+        if generation > self.generation:
+            raise ValueError("Журнал новее снимка: снимок не соответствует журналу")
+        while offset + _RECORD.size <= len(data):
+            op, length = _RECORD.unpack_from(data, offset)
+            start = offset + _RECORD.size
+            if start + length > len(data):
+                break
+            self._apply(op, data[start:start + length])
+            offset = start + length
+            count += 1
+        if offset < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+        return count
+
+    def _apply(self, op: int, payload: bytes):
+        company = self.company
+        if op == ADD_CLIENT:
+            client = _unpack_client(payload)
+            company.add_client(client)
+            self._number(client)
+        elif op == REMOVE_CLIENT:
+            (number,) = _NUMBER.unpack(payload)
+            client = self._objects[number]
+            self._forget(client)
+            company.remove_client(client)
+        elif op == REPLACE_CLIENT:
+            (number,) = _NUMBER.unpack_from(payload, 0)
+            old = self._objects[number]
+            new = _unpack_client(payload, _NUMBER.size)
+            self._forget(old)
+            # Старый клиент уже выгружен записью UNLOAD, загрузка нового — записью LOAD
+            company.replace_client(old, new)
+            self._number(new)
+        elif op == ADD_VEHICLE:
+            vehicle = _unpack_vehicle(payload)
+            company.add_vehicle(vehicle)
+            self._number(vehicle)
+        elif op == REMOVE_VEHICLE:
+            (number,) = _NUMBER.unpack(payload)
+            vehicle = self._objects[number]
+            self._forget(vehicle)
+            # Перераспределение грузов записано в журнале отдельными записями
+            company.remove_vehicle(vehicle, redistribute=False)
+        elif op == REPLACE_VEHICLE:
+            (number,) = _NUMBER.unpack_from(payload, 0)
+            old = self._objects[number]
+            new = _unpack_vehicle(payload, _NUMBER.size)
+            self._forget(old)
+            # Старый транспорт уже пуст (записи UNLOAD), новый загружается записями LOAD
+            company.replace_vehicle(old, new)
+            self._number(new)
+        elif op == LOAD:
+            client_number, vehicle_number = _PAIR.unpack(payload)
+            company.load_into(self._objects[client_number], self._objects[vehicle_number])
+        elif op == UNLOAD:
+            (number,) = _NUMBER.unpack(payload)
+            company.unload_client(self._objects[number])
+        elif op == GENERATION:
+            pass
+        else:
+            raise ValueError(f"Неизвестная запись журнала: {op}")
+
+    # Пустой журнал текущего поколения (атомарно: через временный файл)
+    def _reset_file(self):
+        self.close()
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._header())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    # Новый снимок следующего поколения и пустой журнал.
+    # Снимок заменяется первым: после сбоя между шагами старый журнал
+    # опознается по поколению и не воспроизводится
+    def checkpoint(self, snapshot_path: str):
+        save_snapshot(self.company, snapshot_path, self.generation + 1)
+        self.generation += 1
+        self._reset_file()
+        self._renumber()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Открытие сохраненной компании: снимок + воспроизведение журнала.
+# Возвращает компанию и подписанный на нее журнал для новых изменений
+def open_company(snapshot_path: str, journal_path: str, name: str = "",
+                 sync: bool = False) -> Tuple[TransportCompany, Journal]:
+    generation = 0
+    if os.path.exists(snapshot_path):
+        company = load_snapshot(snapshot_path)
+        generation = snapshot_generation(snapshot_path)
+    else:
+        company = TransportCompany(name)
+    journal = Journal(company, journal_path, sync, generation)
+    journal.replay()
+    company.subscribe(journal)
+    return company, journal
@@ -0,0 +1,151 @@
+import csv
+import json
+import math
+from typing import Callable, Container, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.truck import Truck
+from transport.train import Train
+
+# Потоковая загрузка клиентов и транспорта из файлов CSV и JSONL.
+# Файл читается построчно генератором, в памяти только текущая строка
+# и пачка ошибок. Строки с ошибками пропускаются и передаются пачками
+# в обработчик on_errors, загрузка при этом не прерывается.
+
+# Формат CSV клиентов:    name,cargo_weight,is_vip[,client_id,volume,pallets]
+# Формат CSV транспорта:  type,capacity,color,number_of_cars[,volume,pallets]
+# Пустые volume/pallets — у клиента 0, у транспорта без ограничения.
+# В JSONL те же поля, по одному объекту в строке.
+
+
+# Ошибка в строке входного файла
+class RowError(NamedTuple):
+    line: int
+    message: str
+
+
+# Обработчик пачки ошибок
+ErrorHandler = Callable[[List[RowError]], None]
+
+_TRUE = {"1", "true", "yes", "y", "да"}
+_FALSE = {"0", "false", "no", "n", "нет", ""}
+
+
+# Чтение строк файла как словарей: (номер строки, поля)
+def read_rows(path: str) -> Iterator[Tuple[int, Dict]]:
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    row = e
+                yield line_no, row
+    elif path.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+    else:
+        raise ValueError(f"Неизвестный формат файла: {path}")
+
+
+# Приведение текстовых полей CSV к числам и флагам.
+# NaN и бесконечность («nan», «inf», NaN в JSON) — тоже ошибка строки
+def _number(value, cast, message):
+    if isinstance(value, str):
+        try:
+            value = cast(value.strip())
+        except ValueError:
+            raise ValueError(message) from None
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(message)
+    return value
+
+
+# Необязательное число: пустое поле — None
+def _optional(value, cast, message):
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return _number(value, cast, message)
+
+
+def _flag(value):
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    if value is None:
+        return False
+    return value
+
+
+# Клиент по полям строки (проверки — в конструкторе Client)
+def client_from_row(row: Dict) -> Client:
+    weight = _number(row.get("cargo_weight"), float, "Вес груза должен быть положительным числом")
+    volume = _optional(row.get("volume"), float, "Объем груза должен быть неотрицательным числом")
+    pallets = _optional(row.get("pallets"), int, "Число паллет должно быть неотрицательным целым")
+    return Client(row.get("name"), weight, _flag(row.get("is_vip")), row.get("client_id") or None,
+                  volume or 0.0, pallets or 0)
+
+
+# Транспорт по полям строки (проверки — в конструкторах Truck/Train)
+def vehicle_from_row(row: Dict) -> Vehicle:
+    kind = str(row.get("type", "")).strip().lower()
+    capacity = _number(row.get("capacity"), float, "Грузоподъемность должна быть положительным числом")
+    volume = _optional(row.get("volume"), float, "Объем кузова должен быть положительным числом")
+    pallets = _optional(row.get("pallets"), int, "Число паллет должно быть положительным целым")
+    if kind == "truck":
+        return Truck(capacity, row.get("color"), volume, pallets)
+    if kind == "train":
+        cars = _number(row.get("number_of_cars"), int, "Количество вагонов должно быть положительным числом")
+        return Train(capacity, cars, volume, pallets)
+    raise ValueError(f"Неизвестный тип транспорта: {row.get('type')}")
+
+
+# Общий цикл чтения: строки -> объекты, ошибки -> пачки.
+# known — уже занятые ID (например, company.client_ids(): живое представление
+# видит и объекты, добавленные из этого же файла); строка с занятым ID —
+# ошибка строки, а не исключение при добавлении в компанию.
+# Накопленные ошибки передаются и при досрочном закрытии генератора
+def _iter_objects(path, make, on_errors: Optional[ErrorHandler], batch_size: int,
+                  known: Optional[Container[str]] = None):
+    errors: List[RowError] = []
+    try:
+        for line_no, row in read_rows(path):
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                if not isinstance(row, dict):
+                    raise ValueError("Строка должна быть объектом с полями")
+                obj = make(row)
+                if known is not None and obj.client_id is not None and obj.client_id in known:
+                    raise ValueError(f"Клиент с ID {obj.client_id} уже есть в компании")
+            except (TypeError, ValueError) as e:
+                errors.append(RowError(line_no, str(e)))
+                if len(errors) >= batch_size:
+                    if on_errors:
+                        on_errors(errors)
+                    errors = []
+                continue
+            yield obj
+    finally:
+        if errors and on_errors:
+            on_errors(errors)
+
+
+# Потоковое чтение клиентов из файла.
+# known_ids — занятые client_id: такие строки уходят в on_errors
+def iter_clients(path: str, on_errors: Optional[ErrorHandler] = None,
+                 batch_size: int = 1000, known_ids: Optional[Container[str]] = None) -> Iterator[Client]:
+    return _iter_objects(path, client_from_row, on_errors, batch_size, known_ids)
+
+
+# Потоковое чтение транспорта из файла
+def iter_vehicles(path: str, on_errors: Optional[ErrorHandler] = None,
+                  batch_size: int = 1000) -> Iterator[Vehicle]:
+    return _iter_objects(path, vehicle_from_row, on_errors, batch_size)
@@ -0,0 +1,179 @@
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Union
+from transport.events import EventSink
+from transport.packing import PackingStrategy
+
+# Метрики ядра: время этапов распределения, счетчики загрузок
+# и гистограмма остатков грузоподъемности.
+#
+# Включаются для конкретной компании: Metrics(company) подписывается на ее
+# события и ставит себя в company.metrics. Пока метрики не подключены,
+# ядро проверяет только company.metrics is None один раз на распределение,
+# а в load_cargo ничего не добавляется (счетчики загрузок идут через события).
+#
+# Работа поиска считается внутри стратегий (PackingStrategy.stats):
+#   index_lookups  запросы к индексам остатков (у exact — выбор вариантов)
+#   fit_checks     точные проверки, помещается ли груз в транспорт
+#   placements     грузы, для которых стратегия нашла транспорт
+# Стратегия копит их в локальных переменных и добавляет один раз за
+# распределение, поэтому без метрик поиск не замедляется.
+#
+# Этапы распределения (timers):
+#   inputs    подготовка колонок для стратегии
+#   order     сортировка клиентов
+#   assign    поиск транспорта (стратегия)
+#   apply     загрузка по плану
+#   unplaced  обработка неразмещенных
+
+PHASES = ("inputs", "order", "assign", "apply", "unplaced")
+
+# Корзины гистограммы остатков: доли свободной грузоподъемности
+HISTOGRAM_BINS = 10
+
+
+class Metrics(EventSink):
+    def __init__(self, company=None):
+        self.company = None
+        # Этап -> [число вызовов, суммарное время, наибольшее время]
+        self.timers: Dict[str, List[float]] = {}
+        self.counters: Counter = Counter()
+        if company is not None:
+            self.attach(company)
+
+    # Подключение к компании (метрики одной компании за раз)
+    def attach(self, company):
+        if self.company is not None:
+            self.detach()
+        if company.metrics is not None:
+            raise ValueError("У компании уже подключены метрики")
+        company.subscribe(self)
+        company.metrics = self
+        self.company = company
+
+    # Отключение: ядро снова работает без метрик
+    def detach(self):
+        if self.company is None:
+            return
+        self.company.unsubscribe(self)
+        self.company.metrics = None
+        self.company = None
+
+    # Обнуление накопленных значений
+    def reset(self):
+        self.timers.clear()
+        self.counters.clear()
+
+    # Учет времени этапа (секунды)
+    def record(self, phase: str, seconds: float):
+        timer = self.timers.get(phase)
+        if timer is None:
+            self.timers[phase] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+
+    # --- события (счетчики попыток и успехов загрузки) --- #
+
+    def loaded(self, vehicle, client):
+        self.counters["load_attempts"] += 1
+        self.counters["loads"] += 1
+
+    def rejected(self, vehicle, client):
+        self.counters["load_attempts"] += 1
+        self.counters["rejections"] += 1
+
+    def client_unplaced(self, client):
+        self.counters["unplaced"] += 1
+
+    def unloaded(self, vehicle, client):
+        self.counters["unloads"] += 1
+
+    # --- снимок --- #
+
+    # Гистограмма доли свободной грузоподъемности транспорта:
+    # bins[k] — транспорт с остатком в [k/n, (k+1)/n) (полностью пустой — в последней)
+    def free_histogram(self, bins: int = HISTOGRAM_BINS) -> List[int]:
+        histogram = [0] * bins
+        if self.company is None:
+            return histogram
+        for vehicle in self.company.vehicles:
+            share = max(0.0, vehicle.capacity - vehicle.current_load) / vehicle.capacity
+            histogram[min(bins - 1, int(share * bins))] += 1
+        return histogram
+
+    # Текущие значения метрик одним словарем
+    def snapshot(self) -> Dict:
+        timers = {
+            phase: {"calls": int(calls), "total_s": total, "mean_us": total / calls * 1e6,
+                    "max_us": longest * 1e6}
+            for phase, (calls, total, longest) in self.timers.items()
+        }
+        vehicles = self.company.vehicles if self.company is not None else []
+        counters = dict(self.counters)
+        attempts = counters.get("load_attempts", 0)
+        placements = counters.get("placements", 0)
+        return {
+            "timers": timers,
+            "counters": counters,
+            "load_success_rate": counters.get("loads", 0) / attempts if attempts else None,
+            # Усилия поиска на один размещенный груз
+            "lookups_per_placement": counters.get("index_lookups", 0) / placements if placements else None,
+            "checks_per_placement": counters.get("fit_checks", 0) / placements if placements else None,
+            "vehicles": len(vehicles),
+            "vehicles_used": sum(1 for v in vehicles if v.current_load > 0),
+            "free_histogram": self.free_histogram(),
+        }
+
+
+# Таймер этапов для одного распределения (используется ядром)
+class PhaseTimer:
+    __slots__ = ("metrics", "_last")
+
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self._last = time.perf_counter()
+
+    # Завершение этапа: время с предыдущей отметки
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.metrics.record(phase, now - self._last)
+        self._last = now
+
+
+# Распределение под cProfile (и tracemalloc при memory=True).
+# Возвращает неразмещенных клиентов и текстовый отчет.
+# Профилировщики импортируются здесь, чтобы не замедлять запуск ядра
+def profile_distribution(company, strategy: Union[str, PackingStrategy] = "bfd",
+                         reset: bool = False, memory: bool = False,
+                         sort: str = "cumulative", limit: int = 20) -> Tuple[List, str]:
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+    profiler = cProfile.Profile()
+    if memory:
+        tracemalloc.start()
+    try:
+        profiler.enable()
+        try:
+            unplaced = company.optimize_cargo_distribution(strategy, reset)
+        finally:
+            profiler.disable()
+        memory_report: Optional[str] = None
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+            memory_report = "\n".join(
+                [f"tracemalloc: current {current} B, peak {peak} B"] + [str(stat) for stat in top])
+    finally:
+        if memory:
+            tracemalloc.stop()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+    report = out.getvalue()
+    if memory_report:
+        report += "\n" + memory_report + "\n"
+    return unplaced, report
@@ -0,0 +1,163 @@
+import math
+from typing import List, Sequence, Tuple, Union
+from transport.capacity_index import VectorBestFitIndex, VectorFitIndex
+from transport.packing import PackingStrategy, get_strategy, register_strategy
+from transport.car_packing import car_states
+
+# Упаковка по нескольким ресурсам: вес, объем и паллеты.
+# Стратегия получает не список весов, а колонки по ресурсам:
+# demands[d][i] — потребность клиента i в ресурсе d,
+# capacities[d][v] и loads[d][v] — вместимость и загрузка транспорта v.
+# Неограниченный ресурс транспорта задается как math.inf.
+
+RESOURCES = ("weight", "volume", "pallets")
+
+Columns = Sequence[Sequence[float]]
+
+
+# Нужно ли учитывать объем и паллеты (у кого-то из клиентов они заданы)
+def needs_multi_resource(clients) -> bool:
+    return any(c.volume or c.pallets for c in clients)
+
+
+# Колонки потребностей клиентов
+def demand_columns(clients) -> List[List[float]]:
+    return [[c.cargo_weight for c in clients],
+            [c.volume for c in clients],
+            [c.pallets for c in clients]]
+
+
+# Колонки вместимости транспорта
+def capacity_columns(vehicles) -> List[List[float]]:
+    return [[v.capacity for v in vehicles],
+            [v.volume_capacity for v in vehicles],
+            [v.pallet_capacity for v in vehicles]]
+
+
+# Колонки текущей загрузки транспорта
+def load_columns(vehicles) -> List[List[float]]:
+    return [[v.current_load for v in vehicles],
+            [v.current_volume for v in vehicles],
+            [v.current_pallets for v in vehicles]]
+
+
+# Входные данные для стратегии: (стратегия, потребности, VIP, вместимость, загрузка).
+# Если у клиентов заданы объем или паллеты — вариант стратегии по нескольким
+# ресурсам (PackingStrategy.with_resources: у «bfd» — VectorBestFit).
+# Если в парке есть поезда с загрузкой по вагонам — вариант с учетом вагонов
+# (PackingStrategy.with_cars: у «bfd» — CarBestFit). У стратегий без нужного
+# варианта — ValueError, другая стратегия молча не подставляется.
+# Многоресурсная стратегия вагоны не различает: вагон проверяется при
+# загрузке (Train.load_cargo), не поместившийся груз остается неразмещенным
+def packing_inputs(strategy: Union[str, PackingStrategy], clients, vehicles) -> Tuple:
+    engine = get_strategy(strategy)
+    vip = [c.is_vip for c in clients]
+    if needs_multi_resource(clients):
+        engine = engine.with_resources()
+    if engine.multi_resource:
+        return engine, demand_columns(clients), vip, capacity_columns(vehicles), load_columns(vehicles)
+    engine = engine.with_cars(car_states(vehicles))
+    return (engine, [c.cargo_weight for c in clients], vip,
+            [v.capacity for v in vehicles], [v.current_load for v in vehicles])
+
+
+# Масштаб ресурса: 1 / наибольшее конечное значение (0 — ресурс не учитывается)
+def _scale(values: Sequence[float]) -> float:
+    finite = [x for x in values if x != math.inf and x > 0]
+    return 1.0 / max(finite) if finite else 0.0
+
+
+# Лучший подходящий транспорт по нескольким ресурсам.
+# Кандидаты — задействованный транспорт, где хватает всех ресурсов
+# (VectorBestFitIndex). Из первых candidates кандидатов выбирается тот,
+# у которого после загрузки меньше всего остается (норма вектора
+# нормированных остатков). Если не подходит ни один задействованный,
+# открывается самый вместительный подходящий пустой (VectorFitIndex).
+# Клиенты обрабатываются по убыванию суммы нормированных потребностей
+@register_strategy
+class VectorBestFit(PackingStrategy):
+    name = "vbfd"
+    multi_resource = True
+
+    def __init__(self, candidates: int = 4):
+        self.candidates = candidates
+
+    def order(self, demands: Columns, vip: Sequence[bool]) -> List[int]:
+        scales = [_scale(column) for column in demands]
+        size = [sum(x * s for x, s in zip(need, scales)) for need in zip(*demands)]
+        return sorted(range(len(vip)), key=lambda i: (not vip[i], -size[i]))
+
+    def assign(self, order, demands, vip, capacities, loads):
+        loads = [list(column) for column in loads]
+        dims = len(capacities)
+        m = len(capacities[0]) if dims else 0
+        scales = [_scale(column) for column in capacities]
+        capacity = list(zip(*capacities))       # вместимость по транспорту
+        free = [[c - l for c, l in zip(cap, load)] for cap, load in zip(capacities, loads)]
+        closed = float("-inf")
+
+        # Задействованный транспорт — в индексе opened на своей позиции,
+        # пустой — в индексе spare в порядке убывания вместимости
+        used = [any(load[v] > 0 for load in loads) for v in range(m)]
+        opened = VectorBestFitIndex([[f[v] if used[v] else closed for v in range(m)] for f in free])
+        spare = sorted((v for v in range(m) if not used[v]),
+                       key=lambda v: -sum(min(c, 1e300) * s for c, s in zip(capacity[v], scales)))
+        spare_index = VectorFitIndex([[free[d][v] for v in spare] for d in range(dims)])
+        used_count = m - len(spare)
+
+        checks = 0
+
+        def fits(v, need):
+            nonlocal checks
+            checks += 1
+            return all(load[v] + x <= c[v] for load, c, x in zip(loads, capacities, need))
+
+        def residual(v, need):
+            r = 0.0
+            for d in range(dims):
+                s = scales[d]
+                if s:
+                    left = (free[d][v] - need[d]) * s
+                    if left != math.inf:
+                        r += left * left
+            return r
+
+        assignment = [-1] * len(order)
+        watched = self.progress is not None or self.should_stop is not None
+        step = self.progress_step
+        total = len(order)
+        placed = lookups = 0
+        for k, i in enumerate(order):
+            if watched and k % step == 0:
+                self._report(k, total, placed, used_count)
+            need = [column[i] for column in demands]
+            best, best_score = -1, 0.0
+            lookups += 1
+            for v in opened.find_all(need, self.candidates):
+                # Остаток в индексе может отличаться от проверки load_cargo
+                # на погрешность округления — такой транспорт пропускаем
+                if fits(v, need):
+                    score = residual(v, need)
+                    if best < 0 or score < best_score:
+                        best, best_score = v, score
+            if best < 0:
+                s = spare_index.find(need)
+                lookups += 1
+                while s >= 0 and not fits(spare[s], need):
+                    s = spare_index.find(need, s + 1)
+                    lookups += 1
+                if s < 0:
+                    continue
+                best = spare[s]
+                spare_index.update(s, [closed] * dims)
+                used_count += 1
+            for d in range(dims):
+                loads[d][best] += need[d]
+                free[d][best] = capacities[d][best] - loads[d][best]
+            opened.update(best, [f[best] for f in free])
+            assignment[i] = best
+            placed += 1
+        if watched:
+            self._report(total, total, placed, used_count)
+        self._count(lookups, checks, placed)
+        return assignment
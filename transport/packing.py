@@ -0,0 +1,233 @@
+import importlib
+from typing import Callable, Dict, List, MutableMapping, Optional, Sequence, Union
+from transport.capacity_index import BestFitIndex, FirstFitIndex
+
+# Стратегии упаковки грузов по транспорту.
+# Стратегия работает с числами, а не с объектами: на вход — веса грузов,
+# VIP-флаги, грузоподъемность и текущая загрузка транспорта,
+# на выходе — номер транспорта для каждого клиента (-1 — не поместился).
+
+
+# Размещение прервано по запросу (should_stop вернул True)
+class PackingCancelled(Exception):
+    pass
+
+
+# Базовая стратегия: порядок клиентов и размещение
+class PackingStrategy:
+    name = ""
+    # Сортировать ли клиентов по убыванию веса внутри группы VIP/обычные
+    decreasing = True
+    # Учитывает ли стратегия объем и паллеты (тогда вместо списков чисел
+    # получает колонки по ресурсам, см. transport.multi_resource)
+    multi_resource = False
+    # Необязательный контроль хода работы (для фоновых запусков):
+    # progress(обработано, всего, размещено, задействовано транспорта)
+    # вызывается каждые progress_step клиентов; если should_stop()
+    # вернет True, размещение прерывается исключением PackingCancelled
+    progress: Optional[Callable[[int, int, int, int], None]] = None
+    should_stop: Optional[Callable[[], bool]] = None
+    progress_step = 1000
+    # Необязательные счетчики поиска (например, Metrics.counters): после
+    # размещения стратегия добавляет в них index_lookups — запросы к индексам
+    # остатков, fit_checks — точные проверки, помещается ли груз,
+    # placements — размещенные грузы
+    stats: Optional[MutableMapping[str, int]] = None
+
+    # Вариант стратегии для парка с поездами, загружаемыми по вагонам
+    # (cars — состояние вагонов, см. transport.car_packing; None — таких нет).
+    # Стратегия, которая не различает вагоны, не подменяется другой:
+    # вызывающий получает ValueError и выбирает стратегию сам
+    def with_cars(self, cars) -> "PackingStrategy":
+        if cars is None:
+            return self
+        raise ValueError(f"Стратегия {self.name!r} не учитывает вагоны поездов, "
+                         f"для поездов с загрузкой по вагонам используйте 'bfd' или 'cars'")
+
+    # Вариант стратегии для клиентов с объемом или паллетами: стратегия,
+    # которая учитывает только вес, тоже не подменяется — ValueError
+    def with_resources(self) -> "PackingStrategy":
+        if self.multi_resource:
+            return self
+        raise ValueError(f"Стратегия {self.name!r} учитывает только вес, а у клиентов заданы "
+                         f"объем или паллеты: используйте 'bfd' или 'vbfd'")
+
+    # Порядок обработки клиентов: сначала VIP
+    def order(self, weights: Sequence[float], vip: Sequence[bool]) -> List[int]:
+        if self.decreasing:
+            return sorted(range(len(weights)), key=lambda i: (not vip[i], -weights[i]))
+        return sorted(range(len(weights)), key=lambda i: not vip[i])
+
+    # Размещение клиентов в порядке order
+    def assign(self, order: Sequence[int], weights: Sequence[float], vip: Sequence[bool],
+               capacities: Sequence[float], loads: Sequence[float]) -> List[int]:
+        raise NotImplementedError
+
+    # Учет работы поиска в stats (если счетчики заданы)
+    def _count(self, lookups: int, checks: int, placed: int):
+        stats = self.stats
+        if stats is not None:
+            stats["index_lookups"] = stats.get("index_lookups", 0) + lookups
+            stats["fit_checks"] = stats.get("fit_checks", 0) + checks
+            stats["placements"] = stats.get("placements", 0) + placed
+
+    # Отчет о ходе работы и проверка отмены
+    def _report(self, done: int, total: int, placed: int, used: int):
+        if self.should_stop is not None and self.should_stop():
+            raise PackingCancelled()
+        if self.progress is not None:
+            self.progress(done, total, placed, used)
+
+
+# Первый подходящий транспорт (в порядке добавления)
+class FirstFit(PackingStrategy):
+    name = "ff"
+    decreasing = False
+
+    def assign(self, order, weights, vip, capacities, loads):
+        loads = list(loads)
+        index = FirstFitIndex([c - l for c, l in zip(capacities, loads)])
+        assignment = [-1] * len(weights)
+        watched = self.progress is not None or self.should_stop is not None
+        step = self.progress_step
+        total = len(order)
+        placed = lookups = checks = 0
+        used = sum(1 for l in loads if l > 0)
+        for k, i in enumerate(order):
+            if watched and k % step == 0:
+                self._report(k, total, placed, used)
+            w = weights[i]
+            v = index.find(w)
+            lookups += 1
+            # Остаток в индексе может отличаться от проверки load_cargo
+            # на погрешность округления — тогда ищем следующий транспорт
+            while v >= 0:
+                checks += 1
+                if loads[v] + w <= capacities[v]:
+                    break
+                v = index.find(w, v + 1)
+                lookups += 1
+            if v < 0:
+                continue
+            if loads[v] <= 0:
+                used += 1
+            loads[v] += w
+            index.update(v, capacities[v] - loads[v])
+            assignment[i] = v
+            placed += 1
+        if watched:
+            self._report(total, total, placed, used)
+        self._count(lookups, checks, placed)
+        return assignment
+
+
+# Первый подходящий транспорт, клиенты по убыванию веса
+class FirstFitDecreasing(FirstFit):
+    name = "ffd"
+    decreasing = True
+
+
+# Транспорт с наименьшим подходящим остатком, клиенты по убыванию веса.
+# Новый (пустой) транспорт берется только если груз не помещается
+# в уже задействованный, и тогда — самый вместительный
+class BestFitDecreasing(PackingStrategy):
+    name = "bfd"
+
+    # Для поездов по вагонам — тот же лучший подходящий на двух уровнях
+    # (транспорт, затем вагон), см. transport.car_packing.CarBestFit
+    def with_cars(self, cars) -> PackingStrategy:
+        if cars is None:
+            return self
+        from transport.car_packing import CarBestFit
+        return CarBestFit(cars)
+
+    # Для объема и паллет — лучший подходящий по нескольким ресурсам
+    # (transport.multi_resource.VectorBestFit)
+    def with_resources(self) -> PackingStrategy:
+        from transport.multi_resource import VectorBestFit
+        return VectorBestFit()
+
+    def assign(self, order, weights, vip, capacities, loads):
+        loads = list(loads)
+        closed = float("-inf")
+        # В индексе только задействованный транспорт, остальной — закрыт
+        index = BestFitIndex([c - l if l > 0 else closed for c, l in zip(capacities, loads)])
+        spare = sorted((v for v in range(len(loads)) if loads[v] <= 0),
+                       key=lambda v: -capacities[v])
+        next_spare = 0
+        assignment = [-1] * len(weights)
+        watched = self.progress is not None or self.should_stop is not None
+        step = self.progress_step
+        total = len(order)
+        placed = lookups = checks = 0
+        for k, i in enumerate(order):
+            if watched and k % step == 0:
+                self._report(k, total, placed, len(loads) - len(spare) + next_spare)
+            w = weights[i]
+            skip = 0
+            v = index.find(w)
+            lookups += 1
+            # Остаток в индексе может отличаться от проверки load_cargo
+            # на погрешность округления — тогда берем следующий транспорт
+            while v >= 0:
+                checks += 1
+                if loads[v] + w <= capacities[v]:
+                    break
+                skip += 1
+                v = index.find(w, skip)
+                lookups += 1
+            if v < 0:
+                if next_spare == len(spare):
+                    continue
+                checks += 1
+                if loads[spare[next_spare]] + w > capacities[spare[next_spare]]:
+                    continue
+                v = spare[next_spare]
+                next_spare += 1
+            loads[v] += w
+            index.update(v, capacities[v] - loads[v])
+            assignment[i] = v
+            placed += 1
+        if watched:
+            self._report(total, total, placed, len(loads) - len(spare) + next_spare)
+        self._count(lookups, checks, placed)
+        return assignment
+
+
+# Доступные стратегии по имени
+STRATEGIES: Dict[str, type] = {
+    FirstFit.name: FirstFit,
+    FirstFitDecreasing.name: FirstFitDecreasing,
+    BestFitDecreasing.name: BestFitDecreasing,
+}
+
+# Стратегии из отдельных модулей: загружаются при первом обращении
+_STRATEGY_MODULES: Dict[str, str] = {
+    "exact": "transport.exact_solver",
+    "vbfd": "transport.multi_resource",
+    "cars": "transport.car_packing",
+}
+
+
+# Регистрация стратегии под ее именем
+def register_strategy(cls: type) -> type:
+    if not (isinstance(cls, type) and issubclass(cls, PackingStrategy)):
+        raise TypeError("Стратегия должна наследовать PackingStrategy")
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+# Имена всех стратегий, включая еще не загруженные
+def strategy_names() -> List[str]:
+    return sorted(set(STRATEGIES) | set(_STRATEGY_MODULES))
+
+
+# Получение стратегии по имени или готового объекта
+def get_strategy(strategy: Union[str, PackingStrategy]) -> PackingStrategy:
+    if isinstance(strategy, PackingStrategy):
+        return strategy
+    if strategy not in STRATEGIES and strategy in _STRATEGY_MODULES:
+        importlib.import_module(_STRATEGY_MODULES[strategy])
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Неизвестная стратегия упаковки: {strategy}")
+    return STRATEGIES[strategy]()
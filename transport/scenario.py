@@ -0,0 +1,297 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.packing import PackingStrategy
+from transport.multi_resource import packing_inputs
+
+# Сценарии «что если» поверх компании (копирование при записи).
+#
+# Сценарий не копирует парк и клиентов: он хранит только отличия от
+# компании — добавленный и убранный транспорт, новых клиентов, измененные
+# назначения клиентов и загрузку затронутого транспорта (числа, а не
+# объекты). Распределение внутри сценария работает с этими числами,
+# объекты Vehicle компании не изменяются.
+#
+# commit() переносит отличия в компанию (загрузка проверяется заново
+# через load_cargo), discard() просто отбрасывает сценарий.
+#
+# Ограничение: загрузка отдельных вагонов поездов в сценарии не
+# пересчитывается — стратегия видит вагоны в состоянии компании
+# (с запасом, если сценарий освободил место в поезде).
+
+
+# Сценарий распределения поверх компании
+class Scenario:
+    def __init__(self, company, name: str = ""):
+        self.company = company
+        self.name = name
+        self._removed: Set[str] = set()                     # vehicle_id убранного транспорта
+        self._added: Dict[str, Vehicle] = {}                # новый транспорт по vehicle_id
+        self._new_clients: Dict[Client, None] = {}          # новые клиенты (в порядке добавления)
+        self._assignment: Dict[Client, Optional[Vehicle]] = {}  # измененные назначения
+        self._loads: Dict[Vehicle, List[float]] = {}        # загрузка затронутого транспорта
+        self._closed = False
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("Сценарий уже применен или отменен")
+
+    # --- состояние сценария --- #
+
+    # Транспорт сценария в порядке компании, затем добавленный
+    def vehicles(self) -> List[Vehicle]:
+        removed = self._removed
+        base = [v for key, v in self.company._vehicles.items() if key not in removed] \
+            if removed else list(self.company._vehicles.values())
+        return base + list(self._added.values())
+
+    # Клиенты сценария: клиенты компании и новые
+    def clients(self) -> List[Client]:
+        return list(self.company._clients.values()) + list(self._new_clients)
+
+    # Транспорт клиента в сценарии (None — не загружен)
+    def vehicle_of(self, client: Client) -> Optional[Vehicle]:
+        if client in self._assignment:
+            return self._assignment[client]
+        return self.company._assignment.get(client)
+
+    # Загрузка транспорта в сценарии: [вес, объем, паллеты]
+    def load_of(self, vehicle: Vehicle) -> List[float]:
+        load = self._loads.get(vehicle)
+        if load is None:
+            return [vehicle.current_load, vehicle.current_volume, vehicle.current_pallets]
+        return load
+
+    # Загрузка для изменения (копируется при первом изменении транспорта)
+    def _touch(self, vehicle: Vehicle) -> List[float]:
+        load = self._loads.get(vehicle)
+        if load is None:
+            load = self._loads[vehicle] = [vehicle.current_load, vehicle.current_volume,
+                                           vehicle.current_pallets]
+        return load
+
+    def _assign(self, client: Client, vehicle: Optional[Vehicle]):
+        old = self.vehicle_of(client)
+        if old is not None:
+            load = self._touch(old)
+            load[0] -= client.cargo_weight
+            load[1] -= client.volume
+            load[2] -= client.pallets
+        if vehicle is not None:
+            load = self._touch(vehicle)
+            load[0] += client.cargo_weight
+            load[1] += client.volume
+            load[2] += client.pallets
+        # Порядок словаря — порядок загрузки при commit()
+        self._assignment.pop(client, None)
+        self._assignment[client] = vehicle
+
+    # --- изменения --- #
+
+    def add_vehicle(self, vehicle: Vehicle):
+        self._check_open()
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("Можно добавлять только Vehicle")
+        key = vehicle.vehicle_id
+        if key in self._added or (key in self.company._vehicles and key not in self._removed):
+            raise ValueError(f"Транспорт с ID {key} уже есть в сценарии")
+        if vehicle.client_count:
+            raise ValueError("В сценарий можно добавить только пустой транспорт")
+        self._added[key] = vehicle
+
+    def add_vehicles(self, vehicles: Iterable[Vehicle]) -> int:
+        count = 0
+        for vehicle in vehicles:
+            self.add_vehicle(vehicle)
+            count += 1
+        return count
+
+    # Убрать транспорт (объект или vehicle_id): его клиенты становятся
+    # неразмещенными. Возвращает этих клиентов
+    def remove_vehicle(self, vehicle: Union[str, Vehicle]) -> List[Client]:
+        self._check_open()
+        key = vehicle if isinstance(vehicle, str) else vehicle.vehicle_id
+        if key in self._added:
+            vehicle = self._added.pop(key)
+        elif key in self.company._vehicles and key not in self._removed:
+            vehicle = self.company._vehicles[key]
+            self._removed.add(key)
+        else:
+            raise ValueError(f"Транспорт с ID {key} не найден")
+        orphans = self._clients_in(vehicle)
+        for client in orphans:
+            self._assignment[client] = None
+        self._loads.pop(vehicle, None)
+        return orphans
+
+    # Убрать весь транспорт, для которого predicate(vehicle) истинно.
+    # Возвращает число убранного транспорта
+    def remove_vehicles(self, predicate: Callable[[Vehicle], bool]) -> int:
+        doomed = [v for v in self.vehicles() if predicate(v)]
+        for vehicle in doomed:
+            self.remove_vehicle(vehicle)
+        return len(doomed)
+
+    # Клиенты, загруженные в транспорт в сценарии
+    def _clients_in(self, vehicle: Vehicle) -> List[Client]:
+        assignment = self._assignment
+        found = {c: None for c in vehicle._clients if assignment.get(c, vehicle) is vehicle}
+        found.update((c, None) for c, v in assignment.items() if v is vehicle)
+        return list(found)
+
+    def add_client(self, client: Client):
+        self._check_open()
+        if not isinstance(client, Client):
+            raise TypeError("Можно добавлять только Client")
+        if client in self._new_clients or self.company.has_client(client):
+            raise ValueError("Клиент уже есть в сценарии")
+        self._new_clients[client] = None
+
+    def add_clients(self, clients: Iterable[Client]) -> int:
+        count = 0
+        for client in clients:
+            self.add_client(client)
+            count += 1
+        return count
+
+    # Неразмещенные клиенты сценария
+    def unplaced_clients(self) -> List[Client]:
+        return [c for c in self.clients() if self.vehicle_of(c) is None]
+
+    # --- распределение --- #
+
+    # Распределение неразмещенных клиентов внутри сценария
+    # (reset=True — все клиенты заново). Возвращает неразмещенных
+    def optimize_cargo_distribution(self, strategy: Union[str, PackingStrategy] = "bfd",
+                                    reset: bool = False) -> List[Client]:
+        self._check_open()
+        vehicles = self.vehicles()
+        if reset:
+            # Весь транспорт пуст, все клиенты не размещены
+            self._assignment = {client: None for client in self.clients()}
+            self._loads = {vehicle: [0.0, 0.0, 0] for vehicle in vehicles}
+        clients = self.unplaced_clients()
+        engine, demands, vip, capacities, loads = packing_inputs(strategy, clients, vehicles)
+        # Загрузка — из сценария, а не из объектов транспорта
+        if engine.multi_resource:
+            for v, vehicle in enumerate(vehicles):
+                if vehicle in self._loads:
+                    for d, value in enumerate(self._loads[vehicle]):
+                        loads[d][v] = value
+        else:
+            for v, vehicle in enumerate(vehicles):
+                if vehicle in self._loads:
+                    loads[v] = self._loads[vehicle][0]
+        order = engine.order(demands, vip)
+        assignment = engine.assign(order, demands, vip, capacities, loads)
+        unplaced = []
+        for i in order:
+            if assignment[i] >= 0:
+                self._assign(clients[i], vehicles[assignment[i]])
+            else:
+                unplaced.append(clients[i])
+        return unplaced
+
+    # --- сравнение --- #
+
+    # Показатели сценария: транспорт (всего и задействовано),
+    # неразмещенные клиенты и их вес, загрузка парка
+    def summary(self) -> Dict:
+        vehicles = self.vehicles()
+        used = 0
+        total_load = 0.0
+        for vehicle in vehicles:
+            load = self.load_of(vehicle)[0]
+            if load > 0:
+                used += 1
+                total_load += load
+        capacity = sum(v.capacity for v in vehicles)
+        unplaced = self.unplaced_clients()
+        return {
+            "name": self.name,
+            "vehicles": len(vehicles),
+            "vehicles_used": used,
+            "unplaced": len(unplaced),
+            "unplaced_weight": sum(c.cargo_weight for c in unplaced),
+            "capacity": capacity,
+            "utilization": total_load / capacity if capacity else 0.0,
+        }
+
+    # Число измененных назначений и затронутого транспорта
+    @property
+    def changes(self) -> Dict[str, int]:
+        return {"vehicles_added": len(self._added), "vehicles_removed": len(self._removed),
+                "clients_added": len(self._new_clients), "assignments": len(self._assignment),
+                "vehicles_touched": len(self._loads)}
+
+    # --- применение --- #
+
+    # Перенос сценария в компанию. Затронутый транспорт выгружается
+    # полностью и загружается заново в порядке сценария — так загрузка
+    # считается с нуля, как и в сценарии, без накопленной погрешности.
+    # Клиенты, которых транспорт компании не принял при повторной
+    # проверке, остаются неразмещенными и возвращаются списком
+    def commit(self) -> List[Client]:
+        self._check_open()
+        self._check_commit()
+        company = self.company
+        for key in self._removed:
+            if company.get_vehicle(key) is not None:
+                company.remove_vehicle(key, redistribute=False)
+        company.add_vehicles(self._added.values())
+        company.add_clients(self._new_clients)
+        assignment = self._assignment
+        # План для затронутого транспорта: оставшиеся клиенты, затем новые
+        plan: Dict[Vehicle, List[Client]] = {
+            vehicle: [c for c in vehicle._clients if c not in assignment]
+            for vehicle in self._loads if company.has_vehicle(vehicle)}
+        rejected = []
+        for client, vehicle in assignment.items():
+            if vehicle is None or not company.has_client(client):
+                continue
+            if vehicle in plan:
+                plan[vehicle].append(client)
+            else:
+                # Транспорт удален из компании после создания сценария
+                rejected.append(client)
+        for vehicle in plan:
+            company.unload_vehicle(vehicle)
+        for client in assignment:
+            if company.has_client(client):
+                company.unload_client(client)
+        for vehicle, clients in plan.items():
+            for client in clients:
+                if company.vehicle_of(client) is not None or not company.load_into(client, vehicle):
+                    rejected.append(client)
+        self._closed = True
+        return rejected
+
+    # Проверка ID до применения: компания могла измениться после создания
+    # сценария. При конфликте — ValueError, компания не меняется
+    def _check_commit(self):
+        company = self.company
+        for key in self._added:
+            if key in company.vehicle_ids() and key not in self._removed:
+                raise ValueError(f"Транспорт с ID {key} уже есть в компании")
+        seen = set()
+        for client in self._new_clients:
+            client_id = client.client_id
+            if company.has_client(client) or (client_id is not None and
+                                              (client_id in company.client_ids() or client_id in seen)):
+                raise ValueError(f"Клиент с ID {client_id} уже есть в компании")
+            seen.add(client_id)
+
+    # Отмена сценария: компания не меняется
+    def discard(self):
+        self._closed = True
+        self._removed.clear()
+        self._added.clear()
+        self._new_clients.clear()
+        self._assignment.clear()
+        self._loads.clear()
+
+
+# Сравнение сценариев: строка показателей для компании (name="base") и каждого сценария
+def compare_scenarios(company, *scenarios: Scenario) -> List[Dict]:
+    base = Scenario(company, "base").summary()
+    return [base] + [s.summary() for s in scenarios]
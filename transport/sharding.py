@@ -0,0 +1,151 @@
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.company import TransportCompany
+from transport.packing import PackingStrategy
+from transport.multi_resource import packing_inputs
+
+# Распределение грузов по частям (шардам) на нескольких ядрах.
+# Клиенты и транспорт делятся на шарды, каждый шард упаковывается
+# в отдельном процессе. В процесс передаются не объекты, а плотные
+# массивы чисел (array.tobytes) и стратегия, обратно — порядок загрузки
+# и массив номеров транспорта.
+# Затем проход слияния размещает неразмещенных клиентов в остатки
+# всего парка.
+#
+# На Windows и macOS вызывающий скрипт должен запускаться под
+# if __name__ == "__main__" (требование ProcessPoolExecutor).
+
+# Ключ шарда: "type" — по типу транспорта, функция — метка для клиента
+# и транспорта (например, депо), None — равные по вместимости шарды
+ShardKey = Union[None, str, Callable[[object], object]]
+
+
+# Колонка чисел для передачи в процесс
+def _dense(values) -> bytes:
+    return array("d", values).tobytes()
+
+
+# Упаковка одного шарда (выполняется в процессе-исполнителе).
+# Для многоресурсной стратегии demands, capacities и loads — колонки по ресурсам.
+# Возвращает порядок загрузки и номера транспорта
+def _pack_shard(engine: PackingStrategy, demands, vip: bytes, capacities, loads) -> Tuple[bytes, bytes]:
+    if engine.multi_resource:
+        demands, capacities, loads = ([array("d", column) for column in columns]
+                                      for columns in (demands, capacities, loads))
+    else:
+        demands, capacities, loads = array("d", demands), array("d", capacities), array("d", loads)
+    v = array("b", vip)
+    order = engine.order(demands, v)
+    assignment = engine.assign(order, demands, v, capacities, loads)
+    return array("l", order).tobytes(), array("l", assignment).tobytes()
+
+
+# Раздача клиентов по шардам пропорционально свободному месту:
+# очередной (VIP и тяжелые — первыми) уходит в наименее заполненный шард
+def _deal_clients(clients: List[Client], pending: List[int],
+                  free: List[float]) -> List[List[int]]:
+    parts: List[List[int]] = [[] for _ in free]
+    heap = [(0.0, s) for s in range(len(free)) if free[s] > 0]
+    heapq.heapify(heap)
+    if not heap:
+        return parts
+    used = [0.0] * len(free)
+    for i in sorted(pending, key=lambda i: (not clients[i].is_vip, -clients[i].cargo_weight)):
+        _, s = heapq.heappop(heap)
+        parts[s].append(i)
+        used[s] += clients[i].cargo_weight
+        heapq.heappush(heap, (used[s] / free[s], s))
+    return parts
+
+
+# Разбиение на шарды: список пар (номера клиентов, номера транспорта)
+def partition(clients: List[Client], vehicles: List[Vehicle], pending: List[int],
+              shards: int, key: ShardKey = None) -> List[Tuple[List[int], List[int]]]:
+    if callable(key):
+        groups: Dict[object, Tuple[List[int], List[int]]] = {}
+        for v, vehicle in enumerate(vehicles):
+            groups.setdefault(key(vehicle), ([], []))[1].append(v)
+        for i in pending:
+            groups.setdefault(key(clients[i]), ([], []))[0].append(i)
+        return list(groups.values())
+
+    if key == "type":
+        by_type: Dict[type, List[int]] = {}
+        for v, vehicle in enumerate(vehicles):
+            by_type.setdefault(type(vehicle), []).append(v)
+        fleets = list(by_type.values())
+    elif key is None:
+        # Транспорт раздается по кругу от самого вместительного
+        fleets = [[] for _ in range(max(1, min(shards, len(vehicles))))]
+        for k, v in enumerate(sorted(range(len(vehicles)), key=lambda v: -vehicles[v].capacity)):
+            fleets[k % len(fleets)].append(v)
+    else:
+        raise ValueError(f"Неизвестный ключ шардов: {key}")
+
+    free = [sum(vehicles[v].capacity - vehicles[v].current_load for v in fleet) for fleet in fleets]
+    return list(zip(_deal_clients(clients, pending, free), fleets))
+
+
+# Распределение грузов компании по шардам.
+# workers — число процессов (по умолчанию — число ядер), shards — число
+# шардов для ключа None. Размещаются только еще не загруженные клиенты.
+# Возвращает список клиентов, которых не удалось загрузить
+def distribute_sharded(company: TransportCompany, strategy: Union[str, PackingStrategy] = "bfd",
+                       key: ShardKey = None, workers: Optional[int] = None,
+                       shards: Optional[int] = None) -> List[Client]:
+    workers = workers or os.cpu_count() or 1
+    clients = company.clients
+    vehicles = company.vehicles
+    pending_clients = set(company.unplaced_clients())
+    pending = [i for i, c in enumerate(clients) if c in pending_clients]
+    # Стратегия без варианта для этих данных (объем и паллеты, вагоны поездов)
+    # отвергается ValueError до того, как что-либо загружено
+    packing_inputs(strategy, [clients[i] for i in pending], vehicles)
+    parts = partition(clients, vehicles, pending, shards or workers, key)
+
+    # Входные данные каждого шарда — через packing_inputs, как у place_clients:
+    # объем, паллеты и вагоны поездов учитываются и в шардах
+    jobs = []
+    for part_clients, part_vehicles in parts:
+        if not part_clients or not part_vehicles:
+            continue
+        engine, demands, vip, capacities, loads = packing_inputs(
+            strategy, [clients[i] for i in part_clients], [vehicles[v] for v in part_vehicles])
+        if engine.multi_resource:
+            demands, capacities, loads = ([_dense(column) for column in columns]
+                                          for columns in (demands, capacities, loads))
+        else:
+            demands, capacities, loads = _dense(demands), _dense(capacities), _dense(loads)
+        jobs.append((part_clients, part_vehicles, engine, demands,
+                     array("b", vip).tobytes(), capacities, loads))
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(_pack_shard, *job[2:]) for job in jobs]
+            results = [f.result() for f in futures]
+    else:
+        results = [_pack_shard(*job[2:]) for job in jobs]
+
+    # Загрузка результатов шардов в объекты
+    leftovers: List[Client] = []
+    for (part_clients, part_vehicles, *_), (packed_order, packed) in zip(jobs, results):
+        local = array("l", packed)
+        order = array("l", packed_order)
+        shard_clients = [clients[i] for i in part_clients]
+        shard_vehicles = [vehicles[v] for v in part_vehicles]
+        placed = [i for i in order if local[i] >= 0]
+        # Не прошедшие проверку при загрузке уходят в проход слияния;
+        # о неразмещенных сообщается только после него
+        leftovers.extend(company.apply_assignment(shard_clients, shard_vehicles, local, placed,
+                                                  notify=False))
+        leftovers.extend(shard_clients[i] for i in order if local[i] < 0)
+
+    # Проход слияния: остатки и клиенты без шарда — в свободное место всего парка
+    leftovers.extend(clients[i] for part_clients, part_vehicles in parts
+                     if part_clients and not part_vehicles for i in part_clients)
+    return company.place_clients(leftovers, strategy)
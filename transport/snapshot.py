@@ -0,0 +1,218 @@
+import math
+import mmap
+import os
+import struct
+from array import array
+from typing import List, Optional, Tuple
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.truck import Truck
+from transport.train import Train
+from transport.company import TransportCompany
+from transport.columnar import TRAIN, TRUCK, VEHICLE
+
+# Двоичный снимок состояния компании.
+#
+# Формат (little-endian):
+#   заголовок   MAGIC, версия, число транспорта и клиентов, смещения таблиц,
+#               ссылка на название компании, поколение снимка (см. journal)
+#   транспорт   записи фиксированной длины: тип, вагоны, грузоподъемность,
+#               загрузка, числовой ID, ссылки на строку ID и цвет,
+#               объем и паллеты (вместимость и загрузка, inf — без ограничения),
+#               ссылка на пределы вагонов (массив double, пусто — без вагонов)
+#   клиенты     записи фиксированной длины: вес, номер транспорта (-1),
+#               VIP-флаг, ссылки на имя и client_id, объем, паллеты,
+#               номер вагона (-1), место в порядке загрузки транспорта
+#   строки      UTF-8 и массивы, ссылка — пара (смещение, длина в байтах)
+#
+# Записи фиксированной длины позволяют открыть файл через mmap и читать
+# любую запись по номеру, не разбирая остальные (SnapshotView).
+
+MAGIC = b"TCSNAP\x00\x01"
+VERSION = 5
+
+_HEADER = struct.Struct("<8sHxxIIQQQIIQ")
+_VEHICLE = struct.Struct("<BxxxIddQQIIIIddddII")
+_CLIENT = struct.Struct("<diBxxxIIIIdIiI")
+
+
+# Запись снимка в файл (атомарно: через временный файл).
+# generation — поколение снимка: журнал старшего поколения не воспроизводится
+def save_snapshot(company: TransportCompany, path: str, generation: int = 0):
+    strings = bytearray()
+
+    def ref(text: Optional[str]) -> Tuple[int, int]:
+        if not text:
+            return 0, 0
+        return ref_bytes(text.encode("utf-8"))
+
+    def ref_bytes(data: bytes) -> Tuple[int, int]:
+        if not data:
+            return 0, 0
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    vehicles = company.vehicles
+    rows = {}
+    # Место клиента в порядке загрузки своего транспорта
+    slots = {client: slot for vehicle in vehicles for slot, client in enumerate(vehicle.clients_list)}
+    vehicle_part = bytearray()
+    for row, vehicle in enumerate(vehicles):
+        if isinstance(vehicle, Truck):
+            kind, cars, color = TRUCK, 0, vehicle.color
+        elif isinstance(vehicle, Train):
+            kind, cars, color = TRAIN, vehicle.number_of_cars, None
+        else:
+            kind, cars, color = VEHICLE, 0, None
+        vehicle_part += _VEHICLE.pack(
+            kind, cars, vehicle.capacity, vehicle.current_load,
+            vehicle.uid >> 64, vehicle.uid & 0xFFFFFFFFFFFFFFFF,
+            *ref(vehicle.vehicle_id), *ref(color),
+            vehicle.volume_capacity, vehicle.pallet_capacity,
+            vehicle.current_volume, vehicle.current_pallets,
+            *ref_bytes(array("d", getattr(vehicle, "car_capacities", None) or ()).tobytes()),
+        )
+        rows[vehicle] = row
+
+    client_part = bytearray()
+    for client in company.clients:
+        vehicle = company.vehicle_of(client)
+        car = vehicle.car_of(client) if isinstance(vehicle, Train) else None
+        client_part += _CLIENT.pack(
+            client.cargo_weight, rows[vehicle] if vehicle is not None else -1,
+            client.is_vip, *ref(client.name), *ref(client.client_id),
+            client.volume, client.pallets, -1 if car is None else car, slots.get(client, 0),
+        )
+
+    name = ref(company.name)
+    vehicles_offset = _HEADER.size
+    clients_offset = vehicles_offset + len(vehicle_part)
+    strings_offset = clients_offset + len(client_part)
+    header = _HEADER.pack(MAGIC, VERSION, len(vehicles), len(company.clients),
+                          vehicles_offset, clients_offset, strings_offset, *name, generation)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(vehicle_part)
+        f.write(client_part)
+        f.write(strings)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# Снимок, открытый через mmap: записи читаются по номеру, без разбора файла
+class SnapshotView:
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = struct.unpack_from("<8sH", self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл не является снимком компании: {path}")
+        (_, _, self.vehicle_count, self.client_count, self._vehicles, self._clients,
+         self._strings, name_offset, name_length, self.generation) = _HEADER.unpack_from(self._map, 0)
+        self.name = self._text(name_offset, name_length)
+
+    def _text(self, offset: int, length: int) -> Optional[str]:
+        if not length:
+            return None
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _doubles(self, offset: int, length: int) -> Optional[List[float]]:
+        if not length:
+            return None
+        start = self._strings + offset
+        return array("d", self._map[start:start + length]).tolist()
+
+    # Транспорт по номеру: (тип, грузоподъемность, загрузка, вагоны, цвет, uid, vehicle_id,
+    # объем, паллеты, загрузка по объему, загрузка по паллетам, пределы вагонов или None)
+    def vehicle(self, row: int) -> Tuple:
+        if not 0 <= row < self.vehicle_count:
+            raise IndexError("Нет транспорта с таким номером")
+        (kind, cars, capacity, load, uid_high, uid_low,
+         id_offset, id_length, color_offset, color_length,
+         volume, pallets, used_volume, used_pallets,
+         cars_offset, cars_length) = _VEHICLE.unpack_from(
+            self._map, self._vehicles + row * _VEHICLE.size)
+        return (kind, capacity, load, cars, self._text(color_offset, color_length),
+                (uid_high << 64) | uid_low, self._text(id_offset, id_length),
+                volume, pallets, used_volume, int(used_pallets),
+                self._doubles(cars_offset, cars_length))
+
+    # Клиент по номеру: (имя, вес, VIP, номер транспорта или -1, client_id, объем, паллеты,
+    # номер вагона или -1, место в порядке загрузки транспорта)
+    def client(self, row: int) -> Tuple:
+        if not 0 <= row < self.client_count:
+            raise IndexError("Нет клиента с таким номером")
+        (weight, vehicle, vip, name_offset, name_length, id_offset, id_length,
+         volume, pallets, car, slot) = _CLIENT.unpack_from(self._map, self._clients + row * _CLIENT.size)
+        return (self._text(name_offset, name_length) or "", weight, bool(vip), vehicle,
+                self._text(id_offset, id_length), volume, pallets, car, slot)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Создание компании по снимку
+def load_snapshot(path: str) -> TransportCompany:
+    with SnapshotView(path) as view:
+        company = TransportCompany(view.name or "")
+        vehicles: List[Vehicle] = []
+        for row in range(view.vehicle_count):
+            (kind, capacity, load, cars, color, uid, vehicle_id,
+             volume, pallets, _, _, car_capacity) = view.vehicle(row)
+            volume = None if volume == math.inf else volume
+            pallets = None if pallets == math.inf else int(pallets)
+            if kind == TRUCK:
+                vehicle = Truck(capacity, color or "", volume, pallets)
+            elif kind == TRAIN:
+                vehicle = Train(capacity, cars, volume, pallets, car_capacity=car_capacity)
+            else:
+                vehicle = Vehicle(capacity, volume, pallets)
+            vehicle.uid = uid
+            if vehicle_id:
+                vehicle.vehicle_id = vehicle_id
+            vehicles.append(vehicle)
+        clients: List[Client] = []
+        # Грузы транспорта: (место в порядке загрузки, клиент, вагон)
+        cargo: List[List[Tuple[int, Client, int]]] = [[] for _ in vehicles]
+        for row in range(view.client_count):
+            name, weight, vip, v, client_id, volume, pallets, car, slot = view.client(row)
+            client = Client(name, weight, vip, client_id, volume, pallets)
+            if v >= 0:
+                cargo[v].append((slot, client, car))
+            clients.append(client)
+        # Клиенты возвращаются в транспорт в прежнем порядке загрузки
+        for vehicle, loaded in zip(vehicles, cargo):
+            loaded.sort(key=lambda item: item[0])
+            if isinstance(vehicle, Train):
+                for _, client, car in loaded:
+                    vehicle._attach(client, car)
+            else:
+                for _, client, _ in loaded:
+                    vehicle._attach(client)
+        # Загрузку берем из снимка, без повторного сложения весов
+        for row, vehicle in enumerate(vehicles):
+            record = view.vehicle(row)
+            vehicle.current_load = record[2]
+            vehicle.current_volume = record[9]
+            vehicle.current_pallets = record[10]
+    company.add_vehicles(vehicles)
+    company.add_clients(clients)
+    return company
+
+
+# Поколение снимка (0 — снимок без поколения)
+def snapshot_generation(path: str) -> int:
+    with SnapshotView(path) as view:
+        return view.generation
@@ -1,14 +1,129 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from transport.client import Client
+from transport.capacity_index import FirstFitIndex
 from transport.vehicle import Vehicle  # Импортируем базовый класс Vehicle
 
-# Класс поезда
+# Класс поезда.
+# По умолчанию поезд загружается как единое целое (capacity).
+# В режиме вагонов (per_car=True или заданный car_capacity) каждый груз
+# кладется в отдельный вагон с пределом загрузки: в вагон с наибольшим
+# свободным местом, чтобы поезд загружался равномерно. Вагон выбирается
+# по дереву остатков вагонов за O(log числа вагонов)
 class Train(Vehicle):
-    def __init__(self, capacity: float, number_of_cars: int):
-        super().__init__(capacity)  # Вызываем конструктор базового класса
+    __slots__ = ("number_of_cars", "car_capacities", "car_loads", "_car_index", "_car_of")
+
+    def __init__(self, capacity: float, number_of_cars: int, volume: Optional[float] = None,
+                 pallets: Optional[int] = None, per_car: bool = False,
+                 car_capacity: Union[None, float, Sequence[float]] = None):
+        super().__init__(capacity, volume, pallets)  # Вызываем конструктор базового класса
         # Проверяем, что число вагонов положительное целое
         if not isinstance(number_of_cars, int) or number_of_cars <= 0:
             raise ValueError("Количество вагонов должно быть положительным числом")
         self.number_of_cars = number_of_cars
 
+        # Пределы вагонов: по умолчанию грузоподъемность делится поровну
+        self.car_capacities: Optional[List[float]] = None
+        self.car_loads: Optional[List[float]] = None
+        self._car_index: Optional[FirstFitIndex] = None
+        self._car_of: Optional[Dict[Client, int]] = None
+        if per_car or car_capacity is not None:
+            if car_capacity is None:
+                car_capacity = capacity / number_of_cars
+            if isinstance(car_capacity, (int, float)):
+                car_capacity = [car_capacity] * number_of_cars
+            car_capacity = list(car_capacity)
+            if len(car_capacity) != number_of_cars:
+                raise ValueError("Число пределов вагонов не совпадает с числом вагонов")
+            if any(not isinstance(c, (int, float)) or c <= 0 for c in car_capacity):
+                raise ValueError("Предел вагона должен быть положительным числом")
+            self.car_capacities = car_capacity
+            self.car_loads = [0.0] * number_of_cars
+            self._car_index = FirstFitIndex(car_capacity)
+            self._car_of = {}
+
+    # Загружается ли поезд по вагонам
+    @property
+    def per_car(self) -> bool:
+        return self.car_capacities is not None
+
+    # Номер вагона с грузом клиента (None — нет такого или поезд без вагонов)
+    def car_of(self, client: Client) -> Optional[int]:
+        return self._car_of.get(client) if self._car_of is not None else None
+
+    # Пределы и загрузка вагонов (копии, для стратегий упаковки)
+    def car_state(self) -> Tuple[List[float], List[float]]:
+        return list(self.car_capacities), list(self.car_loads)
+
+    # Вагон для груза: с наибольшим свободным местом, -1 — не помещается
+    def _choose_car(self, weight: float) -> int:
+        car = self._car_index.argmax()
+        if car < 0 or self.car_loads[car] + weight > self.car_capacities[car]:
+            return -1
+        return car
+
+    def _put(self, client: Client, car: int):
+        self.car_loads[car] += client.cargo_weight
+        self._car_index.update(car, self.car_capacities[car] - self.car_loads[car])
+        self._car_of[client] = car
+
+    # Кроме поезда в целом проверяется вагон, куда попадет груз: с наибольшим
+    # свободным местом (после unload_cargo(without), если without указан)
+    def fits(self, client: Client, without: Optional[Client] = None) -> bool:
+        if not super().fits(client, without):
+            return False
+        if self.car_capacities is None:
+            return True
+        weight = client.cargo_weight
+        if without is None:
+            return self._choose_car(weight) >= 0
+        if len(self._clients) == 1:
+            # Поезд опустеет, все вагоны будут свободны
+            return weight <= max(self.car_capacities)
+        # Вагон груза without освобождается и может стать самым свободным
+        # (при равенстве остатков выбирается левый вагон, как в индексе)
+        own = self._car_of[without]
+        own_load = self.car_loads[own] - without.cargo_weight
+        car = self._car_index.argmax()
+        if car != own:
+            own_free = self.car_capacities[own] - own_load
+            best_free = self._car_index.max()
+            if own_free < best_free or (own_free == best_free and car < own):
+                return self.car_loads[car] + weight <= self.car_capacities[car]
+        return own_load + weight <= self.car_capacities[own]
+
+    def unload_cargo(self, client: Client) -> bool:
+        if not super().unload_cargo(client):
+            return False
+        if self.car_capacities is not None:
+            if self._clients:
+                car = self._car_of.pop(client)
+                self.car_loads[car] -= client.cargo_weight
+                self._car_index.update(car, self.car_capacities[car] - self.car_loads[car])
+            else:
+                self._reset_cars()
+        return True
+
+    def unload_all(self) -> List[Client]:
+        unloaded = super().unload_all()
+        if self.car_capacities is not None:
+            self._reset_cars()
+        return unloaded
+
+    def _reset_cars(self):
+        self.car_loads = [0.0] * self.number_of_cars
+        self._car_index = FirstFitIndex(self.car_capacities)
+        self._car_of = {}
+
+    # Привязка груза (при загрузке и восстановлении снимка): в заданный
+    # вагон или в вагон с наибольшим свободным местом
+    def _attach(self, client: Client, car: Optional[int] = None):
+        super()._attach(client)
+        if self.car_capacities is not None:
+            self._put(client, self._car_index.argmax() if car is None or car < 0 else car)
+
+    def _render_key(self) -> tuple:
+        return super()._render_key() + (self.number_of_cars,)
+
     # Строковое представление поезда
-    def __str__(self):
-        return f"Поезд с {self.number_of_cars} вагонами, " + super().__str__()
\ No newline at end of file
+    def _render(self) -> str:
+        return f"Поезд с {self.number_of_cars} вагонами, " + super()._render()
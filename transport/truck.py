@@ -1,14 +1,21 @@
+from typing import Optional
 from transport.vehicle import Vehicle  # Импортируем базовый класс Vehicle
 
 # Класс грузовика, наследует Vehicle
 class Truck(Vehicle):
-    def __init__(self, capacity: float, color: str):
-        super().__init__(capacity)  # Вызываем конструктор базового класса
+    __slots__ = ("color",)
+
+    def __init__(self, capacity: float, color: str, volume: Optional[float] = None,
+                 pallets: Optional[int] = None):
+        super().__init__(capacity, volume, pallets)  # Вызываем конструктор базового класса
         # Проверяем, что цвет — строка
         if not isinstance(color, str):
             raise TypeError("Цвет должен быть строкой")
         self.color = color
 
+    def _render_key(self) -> tuple:
+        return super()._render_key() + (self.color,)
+
     # Строковое представление грузовика
-    def __str__(self):
-        return f"Грузовик {self.color}, " + super().__str__()
\ No newline at end of file
+    def _render(self) -> str:
+        return f"Грузовик {self.color}, " + super()._render()
\ No newline at end of file
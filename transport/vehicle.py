@@ -1,13 +1,26 @@
-# Импортируем uuid для уникального ID транспорта
-import uuid
-from typing import List
+import math
+from typing import List, Optional, Tuple, Union
 from transport.client import Client  # Импорт класса Client
+from transport.events import EventSink, NULL_SINK
+from transport.ids import IdGenerator, get_id_generator
+
+# Общий пустой набор клиентов: свой словарь создается при первой загрузке
+_NO_CLIENTS = {}
+
 
 # Класс базового транспортного средства
 class Vehicle:
-    def __init__(self, capacity: float):
-        # Генерация уникального идентификатора транспорта
-        self.vehicle_id = str(uuid.uuid4())
+    __slots__ = ("uid", "_ids", "_vehicle_id", "capacity", "current_load", "_clients", "_loaded", "_events",
+                 "volume_capacity", "pallet_capacity", "current_volume", "current_pallets", "_text")
+
+    def __init__(self, capacity: float, volume: Optional[Union[int, float]] = None,
+                 pallets: Optional[int] = None):
+        # Числовой уникальный идентификатор транспорта,
+        # строка vehicle_id создается только при обращении
+        generator: IdGenerator = get_id_generator()
+        self.uid = generator.next()
+        self._ids = generator
+        self._vehicle_id: Optional[str] = None
 
         # Проверяем, что capacity — положительное число
         if not isinstance(capacity, (int, float)) or capacity <= 0:
@@ -17,26 +30,174 @@ class Vehicle:
         # Текущая загрузка (по умолчанию 0)
         self.current_load = 0.0
 
-        # Список клиентов, чьи грузы загружены
-        self.clients_list: List[Client] = []
+        # Ограничения по объему (м³) и числу паллет (None — без ограничения)
+        if volume is not None and (not isinstance(volume, (int, float)) or volume <= 0):
+            raise ValueError("Объем кузова должен быть положительным числом")
+        if pallets is not None and (not isinstance(pallets, int) or pallets <= 0):
+            raise ValueError("Число паллет должно быть положительным целым")
+        self.volume_capacity = math.inf if volume is None else volume
+        self.pallet_capacity = math.inf if pallets is None else pallets
+        self.current_volume = 0.0
+        self.current_pallets = 0
+
+        # Клиенты, чьи грузы загружены (словарь с порядком загрузки:
+        # проверка и выгрузка клиента за O(1))
+        self._clients = _NO_CLIENTS
+        # Кэш clients_list (None — пересобрать при обращении)
+        self._loaded: Optional[Tuple[Client, ...]] = ()
+
+        # Получатель событий загрузки (по умолчанию — пустой, без вывода)
+        self._events: EventSink = NULL_SINK
+
+        # Кэш строкового представления: (ключ, строка)
+        self._text: Optional[tuple] = None
+
+    # Строковый идентификатор транспорта
+    @property
+    def vehicle_id(self) -> str:
+        if self._vehicle_id is None:
+            self._vehicle_id = self._ids.format(self.uid)
+        return self._vehicle_id
+
+    @vehicle_id.setter
+    def vehicle_id(self, value: str):
+        if not isinstance(value, str):
+            raise TypeError("ID транспорта должен быть строкой")
+        self._vehicle_id = value
+
+    # Клиенты, чьи грузы загружены, в порядке загрузки. Кортеж только для
+    # чтения: собирается при первом обращении после изменения загрузки
+    @property
+    def clients_list(self) -> Tuple[Client, ...]:
+        loaded = self._loaded
+        if loaded is None:
+            loaded = self._loaded = tuple(self._clients)
+        return loaded
+
+    # Число загруженных клиентов
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    # Загружен ли груз клиента в этот транспорт
+    def holds(self, client: Client) -> bool:
+        return client in self._clients
+
+    @property
+    def events(self) -> EventSink:
+        return self._events
+
+    @events.setter
+    def events(self, sink: EventSink):
+        self._events = sink
 
     # Метод загрузки клиента
     def load_cargo(self, client: Client):
         # Проверяем, что передан объект Client
         if not isinstance(client, Client):
             raise TypeError("Можно загружать только объекты Client")
-        
-        # Проверяем, хватит ли места для груза
-        if self.current_load + client.cargo_weight > self.capacity:
-            print(f"Не хватает места для клиента {client.name}")
+
+        # Груз клиента уже в этом транспорте — повторно не загружаем
+        if client in self._clients:
+            return False
+
+        # Проверяем, хватит ли места для груза (вес, объем, паллеты)
+        if not self.fits(client):
+            self._events.rejected(self, client)
             return False
 
         # Добавляем клиента и увеличиваем текущую загрузку
-        self.clients_list.append(client)
+        self._attach(client)
         self.current_load += client.cargo_weight
-        print(f"Загружен клиент {client.name}, текущая загрузка: {self.current_load} т")
+        self.current_volume += client.volume
+        self.current_pallets += client.pallets
+        self._events.loaded(self, client)
+        return True
+
+    # Поместится ли груз клиента (without — если сначала выгрузить этого клиента).
+    # Вычисления повторяют unload_cargo и load_cargo, поэтому ответ точно
+    # совпадает с результатом загрузки после выгрузки
+    def fits(self, client: Client, without: Optional[Client] = None) -> bool:
+        load, volume, pallets = self.current_load, self.current_volume, self.current_pallets
+        if without is not None:
+            if len(self._clients) == 1:
+                load, volume, pallets = 0.0, 0.0, 0
+            else:
+                load -= without.cargo_weight
+                volume -= without.volume
+                pallets -= without.pallets
+        return (load + client.cargo_weight <= self.capacity
+                and volume + client.volume <= self.volume_capacity
+                and pallets + client.pallets <= self.pallet_capacity)
+
+    # Выгрузка груза клиента, возвращает False, если клиента нет в транспорте
+    def unload_cargo(self, client: Client) -> bool:
+        if not isinstance(client, Client):
+            raise TypeError("Можно выгружать только объекты Client")
+        if client not in self._clients:
+            return False
+        del self._clients[client]
+        self._loaded = None
+        if self._clients:
+            self.current_load -= client.cargo_weight
+            self.current_volume -= client.volume
+            self.current_pallets -= client.pallets
+        else:
+            # Пустой транспорт — без накопленной погрешности вычитаний
+            self._clients = _NO_CLIENTS
+            self._reset_load()
+        self._events.unloaded(self, client)
         return True
 
-    # Строковое представление транспорта
+    # Выгрузка всех грузов, возвращает список выгруженных клиентов
+    def unload_all(self) -> List[Client]:
+        unloaded = list(self._clients)
+        self._clients = _NO_CLIENTS
+        self._loaded = ()
+        self._reset_load()
+        for client in unloaded:
+            self._events.unloaded(self, client)
+        return unloaded
+
+    def _reset_load(self):
+        self.current_load = 0.0
+        self.current_volume = 0.0
+        self.current_pallets = 0
+
+    # Ограничен ли транспорт по объему или паллетам
+    @property
+    def multi_resource(self) -> bool:
+        return self.volume_capacity != math.inf or self.pallet_capacity != math.inf
+
+    # Добавление клиента в список без проверки места (загрузка учитывается отдельно)
+    def _attach(self, client: Client):
+        if self._clients is _NO_CLIENTS:
+            self._clients = {client: None}
+        else:
+            self._clients[client] = None
+        self._loaded = None
+
+    # Поля, от которых зависит строковое представление.
+    # Строка пересобирается, только если какое-то из них изменилось
+    def _render_key(self) -> tuple:
+        return (self.capacity, self.current_load, self.vehicle_id,
+                self.current_volume, self.volume_capacity, self.current_pallets, self.pallet_capacity)
+
+    # Строковое представление транспорта (из кэша, если поля не менялись)
     def __str__(self):
-        return f"ID: {self.vehicle_id}, грузоподъемность: {self.capacity} т, текущая загрузка: {self.current_load} т"
\ No newline at end of file
+        key = self._render_key()
+        cached = self._text
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = self._render()
+        self._text = (key, text)
+        return text
+
+    # Сборка строкового представления
+    def _render(self) -> str:
+        text = f"ID: {self.vehicle_id}, грузоподъемность: {self.capacity} т, текущая загрузка: {self.current_load} т"
+        if self.volume_capacity != math.inf:
+            text += f", объем: {self.current_volume}/{self.volume_capacity} м³"
+        if self.pallet_capacity != math.inf:
+            text += f", паллеты: {self.current_pallets}/{self.pallet_capacity}"
+        return text